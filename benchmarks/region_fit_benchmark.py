@@ -0,0 +1,120 @@
+"""Click-to-fit benchmark for ScreenRuler.
+
+Times `A` (fit to the region under the cursor) on synthetic captures of the
+full click-fit neighborhood, with the cursor in the middle. The worst case
+is a region that spans the whole capture and is full of holes, like the
+background of a page of text. Each case reports the QImage to array
+conversion and the region search separately.
+
+    python benchmarks/region_fit_benchmark.py
+    python benchmarks/region_fit_benchmark.py --width 3840 --height 2160 --budget-ms 0
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from compact_screen_ruler.constants import CLICK_FIT_NEIGHBORHOOD  # noqa: E402
+from compact_screen_ruler.ruler.content_snap import is_content_snap_available, np  # noqa: E402
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua ut enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo"
+).split()
+
+
+def draw_text_lines(painter, rect, pixel_size):
+    font = QtGui.QFont("DejaVu Sans")
+    font.setPixelSize(pixel_size)
+    painter.setFont(font)
+    painter.setPen(QtGui.QColor(30, 30, 30))
+    line_height = int(pixel_size * 1.5)
+    word_index = 0
+    for y_pos in range(rect.top() + line_height, rect.bottom() - line_height, line_height):
+        words = []
+        while len(" ".join(words)) * pixel_size // 2 < rect.width():
+            words.append(WORDS[word_index % len(WORDS)])
+            word_index += 7
+        painter.drawText(rect.left(), y_pos, " ".join(words))
+
+
+def build_image(case, width, height):
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+    image.fill(QtGui.QColor(*{"uniform": (48, 52, 60), "page": (90, 90, 90)}.get(case, (255, 255, 255))))
+    painter = QtGui.QPainter(image)
+    if case == "text":
+        draw_text_lines(painter, QtCore.QRect(8, 0, width - 16, height), 15)
+    elif case == "page":
+        # The page stops short of every edge, so its background has to be labelled exactly.
+        page_rect = QtCore.QRect(width // 10, height // 10, width * 8 // 10, height * 8 // 10)
+        painter.fillRect(page_rect, QtGui.QColor(255, 255, 255))
+        draw_text_lines(painter, page_rect.adjusted(24, 0, -24, 0), 15)
+    elif case == "noise":
+        # Light pixels with dark specks: the light ones percolate across the whole capture as a maze of runs.
+        speckle = np.random.default_rng(1).random((height, width)) < 0.2
+        grain = np.where(speckle, 40, 250).astype(np.uint8)
+        pixels = np.empty((height, width, 4), dtype=np.uint8)
+        pixels[:, :, :3] = grain[:, :, np.newaxis]
+        pixels[:, :, 3] = 255
+        painter.drawImage(0, 0, QtGui.QImage(pixels.tobytes(), width, height, width * 4, image.format()))
+    painter.end()
+    return image
+
+
+def measure(case, width, height, runs):
+    from compact_screen_ruler.ruler.region_fit import find_region_bounds, image_to_rgb_array
+
+    image = build_image(case, width, height)
+    convert_timings = []
+    fit_timings = []
+    for _run in range(runs):
+        start = time.perf_counter()
+        pixels = image_to_rgb_array(image, width, height)
+        converted = time.perf_counter()
+        result = find_region_bounds(pixels, width // 2, height // 2)
+        fitted = time.perf_counter()
+        convert_timings.append((converted - start) * 1000.0)
+        fit_timings.append((fitted - converted) * 1000.0)
+    return statistics.median(convert_timings), statistics.median(fit_timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=CLICK_FIT_NEIGHBORHOOD)
+    parser.add_argument("--height", type=int, default=CLICK_FIT_NEIGHBORHOOD)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="fail when a case's median exceeds this")
+    args = parser.parse_args()
+
+    if not is_content_snap_available():
+        print("The click-fit benchmark needs NumPy (pip install numpy).", file=sys.stderr)
+        return 1
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    print(f"{args.width}x{args.height}, median of {args.runs} runs")
+    print(f"{'case':<8} {'convert ms':>10} {'fit ms':>9} {'total ms':>9}  region")
+    failed = False
+    for case in ("uniform", "text", "page", "noise"):
+        convert_ms, fit_ms, (left, top, right, bottom, area) = measure(case, args.width, args.height, args.runs)
+        total_ms = convert_ms + fit_ms
+        print(
+            f"{case:<8} {convert_ms:>10.2f} {fit_ms:>9.2f} {total_ms:>9.2f}  "
+            f"{right - left}x{bottom - top} at {left},{top}, {area} px"
+        )
+        if args.budget_ms > 0 and total_ms > args.budget_ms:
+            print(f"REGRESSION {case}: {total_ms:.2f} ms > budget {args.budget_ms:.2f} ms", file=sys.stderr)
+            failed = True
+
+    app.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+"""Offscreen rendering benchmark for ScreenRuler.
+
+Builds the ruler under the Qt `offscreen` platform and renders it into a
+QImage for every combination of size, unit, grid, transparency and color
+inversion. Each configuration reports cold frames (tick layer rebuilt),
+warm frames (tick layer cached) and the tick renderer's draw calls.
+
+    python benchmarks/render_benchmark.py --output results.json
+    python benchmarks/render_benchmark.py --compare results.json --threshold 0.15
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from compact_screen_ruler.ruler_widget import ScreenRuler  # noqa: E402
+from compact_screen_ruler.version import __version__  # noqa: E402
+
+SIZES = ((690, 70), (1920, 70), (70, 1080), (1920, 1080), (3840, 2160), (7680, 4320))
+QUICK_SIZES = ((690, 70), (1920, 1080))
+UNITS = ("px", "cm", "in")
+
+# Regressions smaller than this are treated as timer noise.
+MIN_REGRESSION_MS = 0.05
+
+
+def config_key(config):
+    flags = [name for name in ("grid", "transparent", "inverted") if config[name]]
+    return "-".join([f"{config['width']}x{config['height']}", config["unit"]] + flags)
+
+
+def iter_configs(sizes):
+    for (width, height), unit, grid, transparent, inverted in itertools.product(
+        sizes, UNITS, (False, True), (False, True), (False, True)
+    ):
+        yield {
+            "width": width,
+            "height": height,
+            "unit": unit,
+            "grid": grid,
+            "transparent": transparent,
+            "inverted": inverted,
+        }
+
+
+def render_frames(ruler, image, frames, cold):
+    timings = []
+    for _frame in range(frames):
+        if cold:
+            ruler.clearTickLayerCache()
+        image.fill(QtCore.Qt.GlobalColor.transparent)
+        start = time.perf_counter()
+        ruler.render(image)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def run_config(ruler, config, frames):
+    ruler.resize(config["width"], config["height"])
+    ruler.window_size_x = config["width"]
+    ruler.window_size_y = config["height"]
+    ruler.measurement_unit = config["unit"]
+    ruler.grid_enabled = config["grid"]
+    ruler.is_transparent = config["transparent"]
+    ruler.invert_colors = config["inverted"]
+    ruler.clearTickLayerCache()
+    ruler.clearTickLabelCache()
+    ruler.tick_draw_calls = 0
+
+    image = QtGui.QImage(config["width"], config["height"], QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    cold_ms = render_frames(ruler, image, frames, cold=True)
+    draw_calls = ruler.tick_draw_calls
+    warm_ms = render_frames(ruler, image, frames, cold=False)
+    return {
+        "key": config_key(config),
+        "config": config,
+        "cold_ms": cold_ms,
+        "warm_ms": warm_ms,
+        "draw_calls": draw_calls,
+    }
+
+
+def compare_results(results, baseline, threshold):
+    baseline_by_key = {entry["key"]: entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        previous = baseline_by_key.get(entry["key"])
+        if previous is None:
+            continue
+        for metric in ("cold_ms", "warm_ms"):
+            limit = previous[metric] * (1.0 + threshold)
+            if entry[metric] > limit and entry[metric] - previous[metric] > MIN_REGRESSION_MS:
+                regressions.append((entry["key"], metric, previous[metric], entry[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20, help="frames rendered per configuration and mode")
+    parser.add_argument("--quick", action="store_true", help="only benchmark a small and a 1080p ruler")
+    parser.add_argument("--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="allowed slowdown per configuration (0.15 = 15%%)"
+    )
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    ruler = ScreenRuler()
+
+    results = []
+    print(f"{'configuration':<40} {'cold ms':>9} {'warm ms':>9} {'draw calls':>11}")
+    for config in iter_configs(QUICK_SIZES if args.quick else SIZES):
+        entry = run_config(ruler, config, args.frames)
+        results.append(entry)
+        print(f"{entry['key']:<40} {entry['cold_ms']:>9.3f} {entry['warm_ms']:>9.3f} {entry['draw_calls']:>11}")
+
+    ruler.close()
+    app.quit()
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "platform": platform.platform(),
+            "frames": args.frames,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(results, baseline, args.threshold)
+        for key, metric, previous, current in regressions:
+            print(f"REGRESSION {key} {metric}: {previous:.3f} ms -> {current:.3f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+"""Cold start benchmark for ScreenRuler.
+
+Starts a fresh interpreter per run under the Qt `offscreen` platform. Each
+run reports the time to import the application package, to create the
+`QApplication`, to construct the ruler, and from `show()` to the end of the
+first paint. It also reports which deferred modules were already loaded by
+then. NumPy, the dialogs and the socket servers should only load on first use.
+
+    python benchmarks/startup_benchmark.py --output startup.json
+    python benchmarks/startup_benchmark.py --compare startup.json --threshold 0.2
+    python benchmarks/startup_benchmark.py --import-budget-ms 150
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METRICS = ("import_ms", "app_ms", "construct_ms", "first_paint_ms", "total_ms")
+
+# Modules that must not be imported before the first frame.
+DEFERRED_MODULES = (
+    "numpy",
+    "PyQt6.QtNetwork",
+    "compact_screen_ruler.dialogs",
+    "compact_screen_ruler.ipc",
+    "compact_screen_ruler.publish",
+    "compact_screen_ruler.ruler.content_snap",
+    "compact_screen_ruler.ruler.region_fit",
+)
+
+# Regressions smaller than this are treated as timer noise.
+MIN_REGRESSION_MS = 2.0
+
+
+def run_child():
+    """Measure one cold start in this process and print the timings as JSON."""
+    start = time.perf_counter()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT_DIR)
+
+    from PyQt6 import QtCore, QtWidgets
+
+    qt_loaded = time.perf_counter()
+    from compact_screen_ruler.ruler_widget import ScreenRuler
+    from compact_screen_ruler.version import __version__
+
+    imported = time.perf_counter()
+    app = QtWidgets.QApplication(sys.argv[:1])
+    app_created = time.perf_counter()
+
+    timings = {}
+
+    class TimedRuler(ScreenRuler):
+        def paintEvent(self, event):
+            super().paintEvent(event)
+            if "painted" not in timings:
+                timings["painted"] = time.perf_counter()
+                QtCore.QTimer.singleShot(0, app.quit)
+
+    ruler = TimedRuler()
+    constructed = time.perf_counter()
+    ruler.show()
+    QtCore.QTimer.singleShot(5000, app.quit)
+    app.exec()
+
+    painted = timings.get("painted")
+    result = {
+        "version": __version__,
+        "qt_import_ms": (qt_loaded - start) * 1000.0,
+        "import_ms": (imported - qt_loaded) * 1000.0,
+        "app_ms": (app_created - imported) * 1000.0,
+        "construct_ms": (constructed - app_created) * 1000.0,
+        "first_paint_ms": (painted - constructed) * 1000.0 if painted else None,
+        "total_ms": (painted - start) * 1000.0 if painted else None,
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in sys.modules],
+    }
+    print(json.dumps(result))
+    return 0
+
+
+def run_once():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(runs):
+    summary = {}
+    for metric in ("qt_import_ms",) + METRICS:
+        values = [run[metric] for run in runs if run[metric] is not None]
+        summary[metric] = {
+            "median": statistics.median(values) if values else None,
+            "min": min(values) if values else None,
+        }
+    summary["deferred_loaded"] = sorted({name for run in runs for name in run["deferred_loaded"]})
+    summary["missed_first_paint"] = sum(1 for run in runs if run["first_paint_ms"] is None)
+    return summary
+
+
+def compare_results(summary, baseline, threshold):
+    regressions = []
+    for metric in METRICS:
+        previous = baseline["summary"].get(metric, {}).get("median")
+        current = summary[metric]["median"]
+        if previous is None or current is None:
+            continue
+        if current > previous * (1.0 + threshold) and current - previous > MIN_REGRESSION_MS:
+            regressions.append((metric, previous, current))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh processes to start")
+    parser.add_argument("--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown per metric (0.2 = 20%%)")
+    parser.add_argument("--import-budget-ms", type=float, help="fail when the median package import exceeds this")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child()
+
+    runs = [run_once() for _run in range(max(1, args.runs))]
+    summary = summarize(runs)
+
+    print(f"{'metric':<16} {'median ms':>10} {'min ms':>10}")
+    for metric in ("qt_import_ms",) + METRICS:
+        values = summary[metric]
+        if values["median"] is None:
+            print(f"{metric:<16} {'-':>10} {'-':>10}")
+        else:
+            print(f"{metric:<16} {values['median']:>10.2f} {values['min']:>10.2f}")
+    print(f"deferred modules loaded at first paint: {', '.join(summary['deferred_loaded']) or 'none'}")
+
+    report = {
+        "meta": {
+            "version": runs[0]["version"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": len(runs),
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    failed = False
+    if summary["deferred_loaded"]:
+        print("REGRESSION deferred modules imported before the first frame", file=sys.stderr)
+        failed = True
+    if summary["missed_first_paint"]:
+        print(f"REGRESSION {summary['missed_first_paint']} run(s) never painted", file=sys.stderr)
+        failed = True
+    if args.import_budget_ms is not None and summary["import_ms"]["median"] > args.import_budget_ms:
+        print(
+            f"REGRESSION import_ms: {summary['import_ms']['median']:.2f} ms > budget {args.import_budget_ms:.2f} ms",
+            file=sys.stderr,
+        )
+        failed = True
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        for metric, previous, current in compare_results(summary, baseline, args.threshold):
+            print(f"REGRESSION {metric}: {previous:.2f} ms -> {current:.2f} ms", file=sys.stderr)
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
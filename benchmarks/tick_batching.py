@@ -0,0 +1,76 @@
+"""Compare per-line and batched tick submission.
+
+Renders the tick layer the way the ruler does, into a QImage, with both
+submission paths and prints draw calls and ms per frame. Grid mode fills
+its lines from the tiled grid first, so only the lines past the tiled
+range and the labels go through the line batch there; ruler mode draws
+every tick as a line.
+
+    python benchmarks/tick_batching.py --frames 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from compact_screen_ruler.ruler_widget import ScreenRuler  # noqa: E402
+
+
+def measure(ruler, batched, frames):
+    ruler.batched_tick_lines = batched
+    image = QtGui.QImage(ruler.width(), ruler.height(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    tick_schedule = ruler.getTickSchedule()
+    timings = []
+    for _frame in range(frames):
+        image.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setFont(ruler.font())
+        ruler.tick_draw_calls = 0
+        start = time.perf_counter()
+        tiled_grid = ruler.drawTiledGrid(painter, 0, tick_schedule) if ruler.grid_enabled else {}
+        ruler.drawSubticks(painter, 0, tick_schedule, tiled_grid)
+        ruler.drawMajorTicksAndLabels(painter, 0, ruler.width() - 37, tick_schedule, tiled_grid)
+        painter.end()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return ruler.tick_draw_calls, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--ruler-height", type=int, default=70, help="height of the ruler-mode case")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    ruler = ScreenRuler()
+
+    print(f"{args.frames} frames per case")
+    print(f"{'mode':<18} {'unit':<5} {'path':<9} {'calls/frame':>12} {'ms/frame':>9}")
+    for grid_enabled, height in ((True, args.height), (False, args.ruler_height)):
+        ruler.resize(args.width, height)
+        ruler.grid_enabled = grid_enabled
+        mode = f"{'grid' if grid_enabled else 'ruler'} {args.width}x{height}"
+        for unit in ("px", "cm", "in"):
+            ruler.measurement_unit = unit
+            for batched in (False, True):
+                calls, ms_per_frame = measure(ruler, batched, args.frames)
+                path = "batched" if batched else "per-line"
+                print(f"{mode:<18} {unit:<5} {path:<9} {calls:>12} {ms_per_frame:>9.2f}")
+
+    ruler.close()
+    app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
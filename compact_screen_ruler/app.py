@@ -1,16 +1,81 @@
 """Application entrypoint helpers for Compact Screen Ruler."""
 
+import argparse
+import os
 import sys
 
-from PyQt6 import QtGui, QtWidgets
+from PyQt6 import QtWidgets
 
+from .constants import IPC_DEFAULT_SERVER_NAME, PUBLISH_DEFAULT_SERVER_NAME
+from .icons import get_app_icon
 from .ruler_widget import ScreenRuler
 
 
-def main():
+def parse_args(argv):
+    """Split application options from the arguments passed through to Qt."""
+    parser = argparse.ArgumentParser(prog="screen_ruler", description="Compact Screen Ruler")
+    parser.add_argument(
+        "--profile-paint",
+        action="store_true",
+        default=os.environ.get("SCREEN_RULER_PROFILE_PAINT", "0") != "0",
+        help="time each paint stage and print p50/p95/p99 on exit or Ctrl+Shift+P",
+    )
+    parser.add_argument(
+        "--latency-json",
+        metavar="PATH",
+        default=os.environ.get("SCREEN_RULER_LATENCY_JSON") or None,
+        help="trace input-to-geometry/paint latency and write histograms to PATH on exit",
+    )
+    parser.add_argument(
+        "--ipc-server",
+        metavar="NAME",
+        nargs="?",
+        const=IPC_DEFAULT_SERVER_NAME,
+        default=os.environ.get("SCREEN_RULER_IPC") or None,
+        help=f"accept JSON commands on the local socket NAME (default: {IPC_DEFAULT_SERVER_NAME})",
+    )
+    parser.add_argument(
+        "--publish",
+        metavar="NAME",
+        nargs="?",
+        const=PUBLISH_DEFAULT_SERVER_NAME,
+        default=os.environ.get("SCREEN_RULER_PUBLISH") or None,
+        help=f"stream geometry and pick changes on the local socket NAME (default: {PUBLISH_DEFAULT_SERVER_NAME})",
+    )
+    return parser.parse_known_args(argv[1:])
+
+
+def main(argv=None):
     """Start the Qt application and run the ruler widget event loop."""
-    app = QtWidgets.QApplication(sys.argv)
-    app.setWindowIcon(QtGui.QIcon("icon.ico"))
+    argv = sys.argv if argv is None else argv
+    args, qt_args = parse_args(argv)
+
+    app = QtWidgets.QApplication(argv[:1] + qt_args)
+    app.setWindowIcon(get_app_icon())
     exm = ScreenRuler()
+    app.aboutToQuit.connect(exm.finishRecording)
+    if args.profile_paint:
+        exm.enablePaintProfiling()
+        app.aboutToQuit.connect(exm.dumpPaintProfile)
+    if args.latency_json:
+        exm.enableLatencyTracing()
+        app.aboutToQuit.connect(lambda: exm.exportLatencyHistograms(args.latency_json))
+    if args.ipc_server:
+        from .ipc import RulerCommandServer
+
+        command_server = RulerCommandServer(exm, args.ipc_server, exm)
+        if not command_server.start():
+            print(f"Could not listen on {args.ipc_server}: {command_server.getErrorString()}", file=sys.stderr)
+        else:
+            app.aboutToQuit.connect(command_server.reportStats)
+    if args.publish:
+        from .publish import RulerStatePublisher
+
+        exm.state_publisher = RulerStatePublisher(exm, args.publish, exm)
+        if not exm.state_publisher.start():
+            print(f"Could not listen on {args.publish}: {exm.state_publisher.getErrorString()}", file=sys.stderr)
+            exm.state_publisher = None
+        else:
+            app.aboutToQuit.connect(exm.state_publisher.reportStats)
     exm.show()
     return app.exec()
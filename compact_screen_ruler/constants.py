@@ -2,3 +2,88 @@
 
 SNAP_INCREMENT = 10
 SCREEN_EDGE_SNAP_DISTANCE = 12
+MEASUREMENT_UNITS = ("px", "cm", "in")
+
+# Upper bound for cached tick-layer pixmaps; the most recent layer is always kept.
+TICK_LAYER_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Samples kept per paint stage when paint profiling is enabled.
+PAINT_PROFILE_CAPACITY = 2048
+
+# Grid tiles for non-integer cm/in periods span up to GRID_TILE_MAX_SIZE pixels and are re-anchored
+# before rounding drift passes GRID_TILE_MAX_DRIFT pixels, using GRID_TILE_PHASES sub-pixel offsets.
+GRID_TILE_MAX_SIZE = 1024
+GRID_TILE_MAX_DRIFT = 0.125
+GRID_TILE_PHASES = 4
+
+# Average frame times (ms) over the last LOD_SAMPLE_COUNT frames of a drag or resize that switch
+# rendering to reduced (major ticks only) and minimal (also at most LOD_LABEL_BUDGET labels) detail.
+LOD_REDUCED_FRAME_MS = 8.0
+LOD_MINIMAL_FRAME_MS = 16.0
+LOD_LABEL_BUDGET = 24
+LOD_SAMPLE_COUNT = 6
+
+# Measurements kept by the shared text layout cache.
+TEXT_LAYOUT_CACHE_SIZE = 256
+
+# Recent samples kept per latency trace, and how often the on-ruler latency readout refreshes.
+LATENCY_TRACE_CAPACITY = 2048
+LATENCY_READOUT_INTERVAL_MS = 500
+
+# Clickthrough hover polling waits roughly as long as a cursor moving CLICKTHROUGH_CURSOR_SPEED px/ms
+# would need to reach the ruler, clamped to CLICKTHROUGH_POLL_MIN_MS..CLICKTHROUGH_POLL_MAX_MS.
+CLICKTHROUGH_POLL_MIN_MS = 50
+CLICKTHROUGH_POLL_MAX_MS = 1000
+CLICKTHROUGH_CURSOR_SPEED = 4.0
+
+# Recording: time-lapse interval, frames per burst (captured once per display frame), and the bounds of
+# the in-memory ring buffer that holds frames until the background writer saves them.
+RECORDING_INTERVAL_MS = 1000
+RECORDING_BURST_FRAMES = 120
+RECORDING_MAX_FRAMES = 1800
+RECORDING_MAX_BYTES = 512 * 1024 * 1024
+
+# Content edge snapping: captures extend CONTENT_SNAP_CAPTURE_MARGIN px around the ruler. A position counts
+# as an edge when CONTENT_SNAP_MIN_RUN consecutive px along the ruler edge's span (of at least
+# CONTENT_SNAP_MIN_SPAN px; shorter spans need the whole span) see a gray-level step of
+# CONTENT_SNAP_GRADIENT_THRESHOLD or more across it. Stronger steps win over weaker ones nearby.
+CONTENT_SNAP_CAPTURE_MARGIN = 64
+CONTENT_SNAP_GRADIENT_THRESHOLD = 24
+CONTENT_SNAP_MIN_RUN = 24
+CONTENT_SNAP_MIN_SPAN = 4
+
+# Click-to-fit searches up to CLICK_FIT_NEIGHBORHOOD px around the cursor, starting from a
+# CLICK_FIT_INITIAL_WINDOW px window. Pixels within CLICK_FIT_COLOR_TOLERANCE per channel of the dominant
+# color within CLICK_FIT_SEED_RADIUS px of the cursor form the region; regions below CLICK_FIT_MIN_AREA px
+# are ignored. The search labels row runs of the region's mask, so its cost follows the run count: a page of
+# text at 2048 px has about 250k runs. Windows past CLICK_FIT_MAX_RUNS, such as grainy photos, stop the search
+# at the previous window. benchmarks/region_fit_benchmark.py times the worst cases against a budget.
+CLICK_FIT_NEIGHBORHOOD = 2048
+CLICK_FIT_MAX_RUNS = 300000
+CLICK_FIT_INITIAL_WINDOW = 512
+CLICK_FIT_COLOR_TOLERANCE = 8
+CLICK_FIT_SEED_RADIUS = 3
+CLICK_FIT_MIN_AREA = 16
+
+# Scanline inspector: pixels within this per-channel distance of the line's dominant color count as gap.
+SCANLINE_COLOR_TOLERANCE = 8
+
+# Pick-mode loupe: zoom levels cycled with Z, the loupe's view size in px, and the capture taken around the
+# cursor when a pick starts (LOUPE_CAPTURE_RADIUS px each way), reused until the cursor leaves it.
+LOUPE_ZOOM_LEVELS = (8, 12, 16)
+LOUPE_VIEW_SIZE = 168
+LOUPE_CAPTURE_RADIUS = 192
+
+# Local command server: socket name used when --ipc-server or SCREEN_RULER_IPC is given without a name, and the
+# largest unterminated command line a client may buffer before it is disconnected.
+IPC_DEFAULT_SERVER_NAME = "compact-screen-ruler"
+IPC_MAX_LINE_BYTES = 1024 * 1024
+# How long to wait for an existing server on the same name to accept a connection before treating it as stale.
+IPC_PROBE_TIMEOUT_MS = 500
+
+# State publisher: socket name used when --publish or SCREEN_RULER_PUBLISH is given without a name, the number
+# of messages queued per subscriber before its backlog is replaced by a snapshot, and how many bytes may sit in a
+# subscriber's socket before the queue stops feeding it.
+PUBLISH_DEFAULT_SERVER_NAME = "compact-screen-ruler-events"
+PUBLISH_QUEUE_SIZE = 64
+PUBLISH_MAX_PENDING_BYTES = 64 * 1024
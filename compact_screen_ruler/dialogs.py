@@ -1,6 +1,6 @@
 """Dialog classes used by the Compact Screen Ruler UI."""
 
-from PyQt6 import QtCore, QtGui, QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 
 class ChooseGeometry(QtWidgets.QDialog):
@@ -10,7 +10,6 @@ class ChooseGeometry(QtWidgets.QDialog):
         super().__init__()
 
         self.setWindowTitle("Set Position and Size")
-        self.setWindowIcon(QtGui.QIcon("icon.png"))
 
         self.label_size = QtWidgets.QLabel("Size: ", self)
         self.label_pos = QtWidgets.QLabel("Position: ", self)
@@ -88,7 +87,6 @@ class HelpDialog(QtWidgets.QDialog):
         super().__init__()
 
         self.setWindowTitle("Help and Info")
-        self.setWindowIcon(QtGui.QIcon("icon.png"))
 
         self.resize(420, 250)
         self.setMinimumSize(360, 220)
@@ -108,10 +106,21 @@ class HelpDialog(QtWidgets.QDialog):
             "L\t\tLock/unlock aspect ratio while resizing\n"
             "U\t\tToggle units (px, cm, in)\n"
             "G\t\tToggle full-window grid from tick marks\n"
+            "A\t\tFit the ruler to the element under the mouse cursor\n"
+            "M\t\tToggle the spacing inspector along the ruler's centerline\n"
+            "Ctrl + M\t\tRecapture the screen for the spacing inspector\n"
+            "Z\t\tCycle the pick-mode loupe zoom (8x, 12x, 16x, off)\n"
+            "F5\t\tRecapture the screen for the loupe while picking\n"
+            "E\t\tToggle snapping to visible edges of on-screen content\n"
+            "Ctrl + G\t\tAdd snap guides through the mouse cursor\n"
+            "Ctrl+Shift+G\tClear all snap guides\n"
+            "Ctrl+Shift+L\tShow/hide input latency readout\n"
             "Ctrl\t\tHold down Ctrl to snap to medium tick spacing\n"
             "Ctrl + C\t\tCopy current dimensions to clipboard (123x456)\n"
             "Shift\t\tHold down Shift to disable screen-edge snapping\n"
             "Ctrl + S\t\tTake a screenshot of what's behind the ruler\n"
+            "Ctrl + R\t\tStart/stop time-lapse recording of what's behind the ruler\n"
+            "Ctrl + B\t\tRecord a burst of frames at the display refresh rate\n"
             "F1 / H\t\tDisplay this Help dialog"
         )
         self.main_label = QtWidgets.QLabel(text)
@@ -0,0 +1,108 @@
+"""Application icon embedded as base64 PNG data.
+
+Loading the icon from here works from any working directory and in frozen
+builds, without shipping `icon.png` next to the executable. Regenerate
+`ICON_PNG_BASE64` from `icon.png` after changing the icon.
+"""
+
+import base64
+import functools
+
+from PyQt6 import QtGui
+
+ICON_PNG_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAIAAABMXPacAAAACXBIWXMAAAsTAAALEwEAmpwYAAAbyUlEQVR42s0dS3MbRXN2tZIsWbYT4thO4MaB"
+    "S0Jc5AXhkBS58R84cOSvBoqqAAWxHduhCvI4xIlk67HSSvsdOmm3+7UjxcC3h1Rsz8729Hu6e6aTH374IYQwm82m0+lsNnvx4sXOzs7HH3+8vr7+"
+    "8OHDk5OTw8PDJEnC+ydJkrIsYfx0On358uWff/556dKlzc3N+/fv9/v9Z8+ewTB8pSzLsixh/pcvXx4cHGxsbFy+fPnBgwfD4fDg4EAdXxQFjl9f"
+    "X9/a2nrw4MFgMDg4OEiShI5H+AGew8PDra2tS5cu3b9/fzQa7e/vs/Ew/2w2K4ri1atX+/v7V65c+eijjx4+fNjr9Z49e0bHs/W+evXq6dOnW1tb"
+    "ly9fhvkl/Ayevb29Tz755OLFi998881gMAB8wvgkSTIcPZlMJpNJt9s9ODg4PDxM07TVat24cQPAxXdmsxlgpygKGP/HH3+8myvLbt68OZvN0jSF"
+    "VxAgOn5nZ2dnZyeE0Ol0rl27VpYlLgD+D9QqimI8Hne73d3d3d3d3SRJ2u32jRs3EIkMOzB/r9eD+ZMkabVa29vbMJJ+AuafTCZ0/hDC0tLSzZs3"
+    "2Xhc73Q6zfO82+3u7e3t7e1lWdZut69fvw4rxfXS+YuiOD4+3t/ff/bsWVmWS0tLX3zxRTj7ZMgLRVGMRqPxeIwoODk5KYqCoRIXPJlMcDz8vt/v"
+    "j0Yj+D/A5IwPIRwdHY3HYxg2m81wAcgNeZ7neY7zDwaD0WjECMbmBwDgT8fHx8PhkEKOOAVq5XmO40MIJycncjzOPx6P8zxH+IuiePv2LeCHMZCE"
+    "ZzqdhhD6/T6uF7knQxwBR0wmE4RgPB5Pp1N8gcoXrGE8HhdFcUrMLAOMUA6i8kgRCmABfzH5RZ5g8+d5DuPpAmAwwD8ajeh4wA4bP3v/FEVBEYpw"
+    "MvFCIWAMgWLN8AOTg0Sy+ansIn7S8v2DZgCH1mo1+iNyNJV6hiD6AfYW0IBOyAhGV4taiI6H/0uGoMsGDDKLRVU/FcrpdMqEO0kS/CJiBngFzRL7"
+    "LoOfoggeOj+Ch4ClKnHYginojLvV1VJS4Tz0N0iwNE0ZathKJAdIkChUFDDGQFRocDZKMFSDOC1VdBJFzWaTKUMLkw61UhU1jAaqipCfqdVqaNyp"
+    "ZrReybIMBIjNz5wuOn8wHpyWIhT1p1w24JrB32q1KJBILSoZFB50N5jKokLJqALj6UfTYD9pmiJ5kbmoymZzUYMsB1BXAZ7JZEIXwNxEyRCMivRf"
+    "1O+MYEAzyvjIInK94/FYUkVSDn/ZaDTkPAiV9JWRivQTqSUj7HuqsmZztVotqa/YWxSmLMsYylSDzHiCTYJKTKJ1MpmgRWGOiqUlqFWgWkh9qEsj"
+    "lSHTnxIhpwQ41UdpCuuhOFJxkbx/6C9BAhhCLZOoolu1mXS89DoczZskCdVIcv3yEyiRKp3UwVJ5oiwyIZA6oCzLlKkU6XWoD7I/Jdh0OsUtGFsA"
+    "s8ZSv1t2lVEdGULFIxohVEGUgVTlw2BAlWWpIKZCGTOpgkjxg2YMYU4dcatUCAynoFIYuEh2qROlTDDxcvSDOpipUNi++p4JWwt8QqJbhRMJRtHF"
+    "2Jy+VavV5MwpRZD0aqibrzIR8wpolEMKJvWyESAppJQhVLfSUVNUIpMkwR+ZXKr0QP3DzAC1Mcz8UAI7coMMQSF/txHjP59VKSDCjJ6WaUIN5hgu"
+    "y42jvBbeO2ASv5LATFkxN5RqXuYaMJtMJ7ckmEk8tfBBOG8SS0wC3qkg5sP6ALGRUkGBSKqbw3B2p8MEXDUGkmBo51X+lRJDsU+Vlfpp3DdI46ni"
+    "FCUMf2/pBoZPqq9SVdvikijBqSZB80slhlKY8QXCx0CkMTg5hiE6SZJGo8GUIVUyzAZQ+CsJH0Jot9uqzbM8V9WL802ORHWq2hxcAPNKKROpXm04"
+    "65Izc8psAIYigtgrWcIhJZJRyGc6iQsWGvGxxvxOtj2mXpDqcdHF4tdT3zdgoRi6NZerotSyvHVLYiwqMgLQ0AVjaol9FgtTjYeUDEeNqItSrZHK"
+    "nbhxoxyfWtBTg8aUg2NjKdfTwWrESjIUU0fSK0O3z0JTJVVU0lKnQFo7izzgocggBxVfOh5DF2dcKQdcZsGYrpCWsCgKdcFIDwwuOZZTpZycTYWZ"
+    "mgTmETG2CGIXGbTNEI18MA+CGm1H47PwnERy6lBYtWC4TlWE5cZH5SO5AFULSQtk6fqgbd/AT7fMgE975nGoapZxPdsxwEi6U0uShErw6T7AWthk"
+    "MlEdLEkGRnBGG9UFojodDT7lU+llQT5EndZSoVJ5MlFmDCEjjGyHRI0KZAxVkVWRBgkyRt0zO2GmIgaDQb/f91mP/ub4+HgwGKjjVTR1u93BYKD6"
+    "PPBLZqUHgwHmbC2GoL/v9/v9fl+dHKlLCXxycgLwOJaAPpBzlhkhi2VHoxHgh8JTu3XrFk3R5XleFEWn07lw4UKe561Wa3l5mblZmI8cj8fD4fDo"
+    "6KhWqzUajeFw2Gq1wJtmgg/MBZnb6XTa6XRWV1dns1mz2cTxOBjceYAH0sKdTmdtbW08HjebTYCHhmMxhTmdTkej0XQ6XV1dXV1dzfO83W7T+XE8"
+    "wgPjO53OysrKZDIBeCg2aQp2PB4PBoPXr18Dc4zH4+XlZbZeRBG8kuc5hYfiJ2BZSpqmtVqtXq+XZbm1tbW5uVmv1+v1eqPRgKybKrD41U6n8+mn"
+    "n66vr3/77be9Xu/w8FCqSEj/TqfTjY2Nzc1N+Fyr1ZI5DWDANE0bjcZsNtvc3ITxAEyz2ZQwwPh6vR5CuHr16tWrV+F1HE91NIxn682yTJ1f2qSy"
+    "LJeXlz/77LPNzc2HDx/2+32sC2ISVq/X2+321atXr1y5UqvVms1mo9FYWlpimiBDYc+yDK0EOHxZllGhZuFWjL28efPmp59+yrLs4sWL29vbqnlM"
+    "0zTLslarBXPCjzi/dI0AjKWlJUATAAPjVQOIMSsVfjoSrAgGrmF++CLOzzwlthfpdruPHj1K03RlZQXXyzxRDIODFoXJ6/W61LcZ2lL4PCwAcMTC"
+    "674rDUVINEQu/Q3AO2KKzY9ChliAlSCLMGoxjoOR8G9KHpUb4D/NZhOMqrVetnVnGfx+v5/nuWXn6/U6Oils/jMSgOhgkROqNJlPRndVqhck92IM"
+    "s4EknIOWxIe/sr07Qz31Hej8dAY2WBphNl5u8ukaGTmx7ojCSZUV89PUGF9mbWpU71sNp1CmkEk06sOp22ArrlAZzGKQq+lPVVxiFqtuDtifBoOB"
+    "GhhmJscHPnO2NkEUGfo4Ah9R5bgQEWmpxIX/+C4yxQizZCxELCvv8K9sbwgehBpBkOJiPZkKsRoflRhnP0KsWEYLmERXYpYpOhU8qRulMVThZDOr"
+    "wTir0ott9ev1ulpaKaFyWCpzUCBnZEtiHgIazHmZWmY8fMKrWiXYUTw5p2q6rMdSlZPJhNltEBE15mOtPavUPBZnyXwhFttWKoRgBPqtt5x6qZhM"
+    "SyUryEykxX/09+BWUomPiRazJ11An6riWfl7f8Fzqfh4REc+srJTlSQJEsR2HFbwEfJuJ+zrYlWZWvDFhOktTf0fPqoJYf/KKg0ZoF6ALdK53nQK"
+    "2YKo63LeipGSD8HjOc5g6aVwNrwcNBtZucyyLFO/9sgq1bLcJDUrWVkRdV4onkun+TMELaguN/++wXMWflpUUIkmy5uWI9Uc7LlwqJpRcfhrYZI7"
+    "9QAqAKyc3dcQpgryJYWxlTMS4k0M+khvLIYx/a1vpH6LB8DZt58qEBK2iqxDYboknVfvW/wIEjCZTCQTqQVei2FH3dbJGJHKBNb+KwYY1VFGqqhz"
+    "xjBBWZZnTgh9+MNgCm4poC9t6u6pUqs6H608QmThzsoqUwmwTIjP/sE/IcMAqjTRMuMc3BypOhvj08iKD1VbLmYM1MJIh/ZW6MI3AKfZoXjIrNpV"
+    "HECLYSUz+gdOZHGZLJCm5TBy31S5K7YCwtYy2UplcE1WFs+lZk/PB8RUXMllqObOcgQr53dKi5kQyK1/qIqdqAhyONQyp4wGyHCWVrDSWRR1+gEr"
+    "WRMYo9PpgQW5Z46kbhAZCKmIghtuS86eeFDLkxwK+bpOLduSQuMIOoMkUws9/bNdlAFZ3Q4Ux0n5sGJqiXFwzuL0GEZTw9SSfpV6Qy2nZG/RFKwf"
+    "8wlGcXUqnTN1IolKqROhLmje/RHLYkqqy+NgkT6MtWznpK3Ff2rdVLfbZW53jGFnHm3tzp070qj65pteJwN1L51Op9PpFEXRbrdbrVaMuUuM82KJ"
+    "OJms1sJEOg4y4cXUhcVtFBJap4R1U2tra6PRaGlpqd1us/xzfDA4SZJM5ucspUlRAHUvZVlubm5ubGxAERGU1sR4GtZfmeaJSZ9VLlXdQ7GvWIBh"
+    "chGqLhqNBtQpwZ6f1RFJ0vrr5Ul5CqhVV0trmyAdARVXWPfCeKESL9auVX7R4usYGgSjXNXRVCrDhfdZP6ipkeuNDILS58yxWyclRBeA1h8rWbAI"
+    "J5L9K0/VWjkyS2lEkkE11EHUMbC1U28HzxBAIQ8rP3G+a7kGmTpOPWxNR2Ldjqx+idQ8kY5p5O8XpkelrqM8x+ryYvS+JA8bmcXoUEc/xoyPGSCt"
+    "ZfhXHnlG2lovHgBN3NsHHGUbVRXBzIB6EiZEnwSOF4J4u32+j2OlLYlx0r8qgf1hqY/HSgrPpXxjEhQLM/JicbcgIm7x+4zKhVfSNfjR0IVLLZxF"
+    "qvFC9WKUecm8QKZF3WGcS746Ph+VLjC1U71Tyfjq9UFqnDUej4upHWtCv6YzBuMxQexqAqj3NOCfEu3MrfRi5baWzbCYdM+lfGPetVJaVjDKih5K"
+    "CatcURrD6TEhXAc4Ndz0gVz8geSJoYclFkygE/dsc+WTzQWfPDAcXH80sa+cW3hL9YFPpU+RGLe0sBkkxtWsfTBqjXh5+gKg+567ute1/M547Jy7"
+    "ZKhfTNxzQfISIdV0VW7uKlSQLwdBC+XLbKoamYhMrMcr9Eq+qVxUZfI2aIeQ/ALQSE5KF1iSao3xmavSKxK/57UR8dXOAq/7Pn4M36Thgx8rZ5RU"
+    "3Td3Lvj951RTvHhZ29WYdaXnAnplFV/4J7fB/4lq8kNs8U/6IQvwucY/8PT/wPLOVVgLAzwvky1CgMpzWD6d/k12js8eOxUx6h2o8iuLHXpI512n"
+    "ilBfFTra6byU0ofnD6wTZ6wUzDk9uBifpeeyVJlSZgU56t2U/1dKqVJWrGNl1gVlkU8WCZzMECT2TUyVEfN/M+UyF2M5gPkZG4aW+ORSVon3YFTa"
+    "+Cc9HSj/rxjfR6W6FlmvJ2+L97NgUSrIuhOi8vJHh7/8csz/0ElVS/P8wT5C4jVSOpdILrDZozWaqq6UpRwfSAnfI4o/882uQ5xXkioLPk0VpFYj"
+    "L4wXx05YvPbhxVi+FDpAJtpdfXMtXMbpEvcS2lQFQvJs5MmWednzvzUG8pxTPNIjN9KJfbUPlwDrhF9kHX0MZuWG5b91hyotk4RfSoYvUowecmRa"
+    "uYONqR+O1yGVMe0Y6p4L44ezm5XKrYl10CxSPZh1QTGHTEqjN5tk6srcukxrWIv/RyuFnEv7Kxku8vIbNsD6jdlipTJQ5YAek/NTdaUPevxf/ZFJ"
+    "XJOSUmvkFqoOK1oYryhNlDsL63QDFV68U1Ne/epjVmJffnquuvZKeqsOSYxmk0vGO5vopYD+hFZlblmWtTt37gTjWJZTUYx3tz5//vznn3+G61jv"
+    "3bvXarXevn0bqUMS0d6C/d7n90onndEyMe5Si6EBXe/jx49PTk6yLLt371673WbrrQwLMrRkqmz6cVds1zoej3u93tOnT58+fZqm6fLyMvTLjdyI"
+    "O3v3RLun0VqSNcwqDbcimjTwmZy9yRfXe3x8DM2QQwj1ev327dvYCSfYCXoG0pmD2j7G1ZcpQHhKDe7RZD0KrBYH1uSViA5GJMqyqFK/W+XGToCB"
+    "rpc2HB4Oh/BjTCRDAvDunHB8Lr88285W9svFfr/WYiLPCUceNrZsprqJtQ7A+icSA+mQDQ2vaV8vekVbpCpjKreEhs4hOpdCDa/sFsouC4opUVIt"
+    "mCrIlZe2xFQbhrhEXqm16ZP9lh2OqTz8c+q2lFUtN50PqHuQBQJ26jwsIiLDW3J/X9o9uBjAvpGTP2KznkRccz1XXbe0PakacogMscr1y/6h825i"
+    "K4OmwaiKLM+24ItRx4698e2QMz5xLxqWRjGNibhGEhlva1LVhR/WZiMr9bJ6k4K6q5ckiVlpovWWk70qrTJeS93JyuUszLMr8cmA/TySqjZ0id0H"
+    "OYhYrpOAszLjqiMQWdrt45HaOTiyesrLEXcVl2obq3lDzY64sLbpMSd+HHmfKxxEP+dfUxLmfKzqfMffizcGaYiOx5ZGm0IcwK5KSYzro+PZpDIV"
+    "GqmpF7NJjinC/9OrpGN4V6qjNB4vqmvE+nYlZ1u1VEZIwkKPhcdziVonorelamZg7bRh9AKrSPwbs+Y98RuTBf13ku8fEr6uTENRAsx1dkj9VhqP"
+    "4kqzFqMK2aUA/xABPkS22PLlXQZU4mkvV4eKDjxpJSPEKCKLZqq3Ex99+jcf9ais3Nn6q5OMWCkZ1WUpztQWzZKqC/39r8QwdcyZlkhcO/t5PypO"
+    "bwp2ArE+eKmzBic96dxf4LsNlQpXdX4WqxgMEZ2HKwOFTpBGnhdbQDdmc/FapXoJdlwvJgJsBXBiZMiv92dHMy3vIKnqVU1jLY4LZEVKJN7SUOV3"
+    "J+61sHOdwQtGFE+tR4uPkfgUkmXllWpBjYjIfRx0g7U8kUgh0DdiVrjRf5KzLb4rIaisgnI2YsHdKM21S5DhUjV0GmOK1GCl76dk8fpaxU4pGhYH"
+    "7d7xxGgeZWmtsqp9vBQd/96ExO7AFOLSFTLUU5YlXJxXeW+m3C7gFzOfHxPRVyu452Sw5zv+FagijS1SS8LkRDHVm65K936vmHNF89pweCaTSZ7n"
+    "loKKqQU+zYhVHoMKWqiSDej1esfHxz5fx7sllfBYZqCsusefkRZ/pO2nYhRvr9dj/ZMdwVVLb96pIIQDYpnUt2X38EmwsEdllmX7+/sbGxuXLl2i"
+    "f2XLRt8Z64iCkamgUXicBL7ljKfh2OR9V09VJjB9jSGs8L75KSUDO2uFPUUbjcbff/+9t7d3+fLlkjSPlKRl+GSlRLXbt2/TvDPUveR5XqvVbt++"
+    "vba2dnR0xJBOGzpD1+rr169fu3bt+++/X19ff/PmDbthlr7y/PnzX375BS6cvXv3rqyrCaIO59dffwV4vvrqq5WVFYSHUgLHv3jx4rfffoMLfL/8"
+    "8stOp3N0dCSj0KzOZzAY1Ov1r7/+GuCRaT6oiphMJicnJ71e78aNG59//vl33323tbWF81ONig2y//rrr8ePH4Ns3b17d2Vl5c2bN3RwhtiHD/R6"
+    "vZ2dnZ2dnTRNm83m9vY2S8kiPeH3RVH0er1Hjx6FEFZXV3E8Nb90Ad1uF+ZPkmRpaQnGMxWBvbeh7ujJkydPnjwJIWRZBv2/mQ6EXDmM73a7v//+"
+    "O/Byq9XC8fQT2B4b1ru7u7u7uxtCaDQa29vb1JVg+gS+MhgMfvzxR+wnjOyPfiByc57nx8fHMD9bLy4hoxQeDodoVWazWa/Xy/Mccz1MNlnHWdCJ"
+    "WKVCeRPnz/OcWq3BYDCZTKRDAnSF8aPRCOc/Pj7GH2l1DTLQcDhEAKbT6XA4xIanlKMBOyDBCA/Mj3VN4WxQXRYGzGYzvDs6nI1aQ80OMARdL+KT"
+    "moGU6h9aaIUK0XIGQBRYRgL1qSxsgroaumDAmnoYBDmadYi26o4Qp5RgUDDJbDWyBQym87OUr5pBYwPA61OLE2TdFNy2zaZKUbHIuheZ7pErZ2YW"
+    "L9cMdikRXXCtVpPLxooj2GpWwkClvnQbjbDFsvVSVmAm3dr0qTHU8n2zdzY/XDTMXkmd3WZRFIgCKwpEiQQcodZo4odlU2qpf1gNJF0AhF9kPMMq"
+    "KbSqXX3cqbu80m1PyywN7S9GcaU0tmYMwiiGbVIsp5ul6Ghrv6DFYZgEyP2E9Brx/0wjqZUjidbZr7Tv4ijtznBqzbaaAw9aux+5i0QJoDCkTDPG"
+    "31NOXVqfgyyukQtmjMkGZFkmKwPVbC2+DgQrtVbZEmCmMaipU7GhakgmNGwqeTXpmTZYMtzhl0MxgiXvG07LIL5VEW6V38KyZe0pS8NK9mTzA5My"
+    "jFtpIlrnw0DCQyhyfj+CbZEHxwuVRGjA9A8zVqrZAB3tVOVZSdfgRtaovVGvRVXhpJXM4ezGTRWayWQiPYJS6x1OAVbzGUx0EDkSLSkTZ2r0LBGz"
+    "9BK4WX6lP+v/Ou/tnonbMyqx+2QzTaWmZWico4y4Qg6cFPat0u4UEURsJshDenREvV6nIpYYvVboAijNqLpQdS44y34Yji2YtUz3SzOxvbujBxg8"
+    "LFCjlmRLI69SCJbPnA4aFwLspY7BhG0q46/SvdG0srsoY4fIY63wNBoN/zhJqV2TU7r9wigGkYEiS/kStzE9BgvUtSC0qRMWxw4lQfPzZGUcdjEJ"
+    "bqM1lWcto0Ln94+jSKrTuALadoejA+nSEINxtMzOAIveaNJTB0F0WyBvsoZ/2UYJOKg0Tv84CbzIqxd9wy6xWWlyWBAwaBe0qvpW1bGS4azzE6ea"
+    "yikZL4oCS/4t7cywhl5QqNq1US2UGP3ugt0+Vi1MZyJPJTiQQDGLGzsalUHO5qeJhERcX08THhL+U5lgRonhQp54Cfa9WegVMHFx7IcMY1HUQ/aD"
+    "SUmidfVEDcmKhVmSi6kptpdUVRzdS1tn4ixfQO6cWaQg0I2YUztPl83sPn0FxMXJybF3/bZX6vEr1cbSW5MZgtRogSVhrM5HlkmzJSRGW5BAciGM"
+    "wDK+maqIxgXA5rDUOjNIkacbJRVTfvBLxY5q94LRQkHSjMUKg1u8BPFL1XrhV+SE6jC1QETdjWaOzoW0UbBPhjqbZHkiV8aOpGEPZwtMwapTeJyT"
+    "QHIfQ/d9cssmE0rQG9CyRkGLNlq+BnXHfW8qk9JEdZY6Ef5obdAZ9pmrKnU0WzAzA+xd9cINlUWYm6hcEyBi45Z6QRXnHA6UlyyoeGOgpsHeNxdF"
+    "wdS0VHb0Fcwvql/yvdJEa5fLXhkMBqqnaJ3FrNVq2G62chuPTkRi31nE5oGdrSPBbI3j8RhVHL6SMX6nHNftdnu9nrOHlAiiGTgKAW0/iQN6vV6/"
+    "33ccGyZhtVqt3++r2EGFQ+d//fq1NEvMotLxJycnkNGUXryKhH6/PxwOJZ/RxVJ8Yr9lOknt1q1bQEmgP9z3sLy8vLa2luf50tLS8vKy5Fx8ZTwe"
+    "z2azlZUVGN9oNNrtthroBxMHXLCysnLhwoXhcLi8vNxqtdgKaf/e0WgE86+urk4mk0ajAfDI+THNS+FpNpsUHhq1hiVAP2Scv9VqwXjEIB0M8Eyn"
+    "07W1tZWVlfF4DOtlqgzLq2B8URSrq6sAD+23DJ/4H/zeFdcg77pKAAAAAElFTkSuQmCC"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_icon():
+    """Return the application icon, decoding it on first use."""
+    pixmap = QtGui.QPixmap()
+    pixmap.loadFromData(base64.b64decode(ICON_PNG_BASE64), "PNG")
+    return QtGui.QIcon(pixmap)
@@ -0,0 +1,253 @@
+"""Local socket server for scripted control of the ruler.
+
+Clients connect to a `QLocalServer` (a Unix domain socket or Windows named
+pipe) and send one JSON object per line:
+
+    {"id": 1, "command": "set_geometry", "args": {"x": 10, "y": 20, "width": 300, "height": 70}}
+
+Every command gets exactly one response line, in request order:
+
+    {"id": 1, "ok": true, "result": {...}}
+    {"id": 2, "ok": false, "error": "unknown command: foo"}
+
+Clients do not have to wait for a response before sending the next command.
+All complete lines in one read are handled together and their responses
+are written back in a single write.
+"""
+
+import base64
+import json
+import sys
+
+from PyQt6 import QtCore, QtNetwork
+
+from .constants import IPC_MAX_LINE_BYTES, IPC_PROBE_TIMEOUT_MS, MEASUREMENT_UNITS
+
+
+INT32_MIN = -(2**31)
+INT32_MAX = 2**31 - 1
+
+
+class CommandError(Exception):
+    """A command was malformed or could not be applied."""
+
+
+def get_int_arg(args, name, default=None):
+    value = args.get(name, default)
+    if value is None:
+        raise CommandError(f"missing argument: {name}")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise CommandError(f"argument {name} must be a number")
+    # Qt takes geometry as 32-bit ints; anything else would overflow inside the binding. The comparison also
+    # rejects NaN and infinities, and unlike math.isfinite it cannot overflow on huge JSON integers.
+    if not INT32_MIN <= value <= INT32_MAX:
+        raise CommandError(f"argument {name} is out of range")
+    return int(value)
+
+
+def get_bool_arg(args, name, default):
+    value = args.get(name, default)
+    if not isinstance(value, bool):
+        raise CommandError(f"argument {name} must be true or false")
+    return value
+
+
+def listen_local_server(server, server_name):
+    """Listen on `server_name`, taking over a stale socket but never one that another instance still serves.
+
+    A crashed server leaves its socket file behind on Unix, which makes
+    `listen()` fail with AddressInUseError. The name is only freed when a
+    connection attempt to it fails.
+    """
+    if server.listen(server_name):
+        return True
+    if server.serverError() != QtNetwork.QAbstractSocket.SocketError.AddressInUseError:
+        return False
+
+    probe = QtNetwork.QLocalSocket()
+    probe.connectToServer(server_name)
+    is_alive = probe.waitForConnected(IPC_PROBE_TIMEOUT_MS)
+    probe.abort()
+    if is_alive:
+        return False
+    QtNetwork.QLocalServer.removeServer(server_name)
+    return server.listen(server_name)
+
+
+class RulerCommandServer(QtCore.QObject):
+    """Accept newline-delimited JSON commands for `ruler` on a local socket."""
+
+    def __init__(self, ruler, server_name, parent=None):
+        super().__init__(parent)
+        self.ruler = ruler
+        self.server_name = server_name
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.handleNewConnection)
+        self.buffers = {}
+        self.clients_served = 0
+        self.commands_handled = 0
+        self.commands = {
+            "ping": self.commandPing,
+            "get_geometry": self.commandGetGeometry,
+            "set_geometry": self.commandSetGeometry,
+            "flip": self.commandFlip,
+            "set_unit": self.commandSetUnit,
+            "set_grid": self.commandSetGrid,
+            "set_transparent": self.commandSetTransparent,
+            "get_measurement": self.commandGetMeasurement,
+            "capture": self.commandCapture,
+        }
+
+    def start(self):
+        return listen_local_server(self.server, self.server_name)
+
+    def getErrorString(self):
+        return self.server.errorString()
+
+    def reportStats(self):
+        print(
+            f"Commands on {self.server_name}: {self.clients_served} clients served, "
+            f"{self.commands_handled} commands handled",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def handleNewConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.buffers[socket] = bytearray()
+            self.clients_served += 1
+            socket.readyRead.connect(lambda socket=socket: self.handleReadyRead(socket))
+            socket.disconnected.connect(lambda socket=socket: self.handleDisconnected(socket))
+
+    def handleDisconnected(self, socket):
+        self.buffers.pop(socket, None)
+        socket.deleteLater()
+
+    def handleReadyRead(self, socket):
+        buffer = self.buffers.get(socket)
+        if buffer is None:
+            return
+        buffer += bytes(socket.readAll())
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            if len(buffer) > IPC_MAX_LINE_BYTES:
+                socket.abort()
+            return
+
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[: end + 1]
+        responses = [self.handleLine(line) for line in lines if line.strip()]
+        if responses:
+            socket.write(b"".join(responses))
+
+    def handleLine(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise CommandError("request must be a JSON object")
+            request_id = request.get("id")
+            command = request.get("command")
+            handler = self.commands.get(command)
+            if handler is None:
+                raise CommandError(f"unknown command: {command}")
+            args = request.get("args") or {}
+            if not isinstance(args, dict):
+                raise CommandError("args must be a JSON object")
+            response = {"id": request_id, "ok": True, "result": handler(args)}
+        except (CommandError, ValueError) as error:
+            response = {"id": request_id, "ok": False, "error": str(error)}
+        except Exception as error:
+            # An exception escaping the readyRead slot aborts the process, so unexpected failures are answered too.
+            response = {"id": request_id, "ok": False, "error": f"{type(error).__name__}: {error}"}
+        self.commands_handled += 1
+        return json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    def getGeometry(self):
+        ruler = self.ruler
+        return {"x": ruler.pos().x(), "y": ruler.pos().y(), "width": ruler.width(), "height": ruler.height()}
+
+    def commandPing(self, _args):
+        return "pong"
+
+    def commandGetGeometry(self, _args):
+        return self.getGeometry()
+
+    def commandSetGeometry(self, args):
+        ruler = self.ruler
+        current = self.getGeometry()
+        size_x = max(ruler.MIN_WINDOW_SIZE, get_int_arg(args, "width", current["width"]))
+        size_y = max(ruler.MIN_WINDOW_SIZE, get_int_arg(args, "height", current["height"]))
+        pos_x = get_int_arg(args, "x", current["x"])
+        pos_y = get_int_arg(args, "y", current["y"])
+        ruler.setRulerGeometry(pos_x, pos_y, size_x, size_y)
+        return self.getGeometry()
+
+    def commandFlip(self, _args):
+        self.ruler.flipOrientation()
+        return self.getGeometry()
+
+    def commandSetUnit(self, args):
+        unit = args.get("unit")
+        if unit not in MEASUREMENT_UNITS:
+            raise CommandError(f"unit must be one of {', '.join(MEASUREMENT_UNITS)}")
+        if unit != self.ruler.measurement_unit:
+            self.ruler.setMeasurementUnit(unit)
+        return unit
+
+    def commandSetGrid(self, args):
+        enabled = get_bool_arg(args, "enabled", not self.ruler.grid_enabled)
+        if enabled != self.ruler.grid_enabled:
+            self.ruler.toggleGridMode()
+        return enabled
+
+    def commandSetTransparent(self, args):
+        enabled = get_bool_arg(args, "enabled", not self.ruler.is_transparent)
+        if enabled != self.ruler.is_transparent:
+            self.ruler.makeTransparent()
+        return enabled
+
+    def commandGetMeasurement(self, args):
+        ruler = self.ruler
+        include_y = get_bool_arg(args, "include_y", True)
+        return {
+            "text": ruler.buildResolutionText(ruler.width(), ruler.height(), include_y),
+            "width": ruler.formatMeasurementValue(ruler.width(), "x"),
+            "height": ruler.formatMeasurementValue(ruler.height(), "y"),
+            "unit": ruler.measurement_unit,
+        }
+
+    def commandCapture(self, args):
+        """Capture what is behind the ruler.
+
+        With a `path`, or a configured screenshot directory, the image is
+        queued on the screenshot writer and the path is returned at once.
+        Otherwise the PNG is returned inline as base64.
+        """
+        ruler = self.ruler
+        image = ruler.grabScreenshotImage()
+        if image is None or image.isNull():
+            raise CommandError("capture failed")
+
+        path = args.get("path")
+        if path is None and ruler.screenshot_options.output_dir:
+            path = ruler.screenshot_options.buildOutputPath(image.width(), image.height())
+        if path is not None:
+            if not isinstance(path, str) or not path:
+                raise CommandError("argument path must be a non-empty string")
+            ruler.saveScreenshot(image, path)
+            return {"path": path, "width": image.width(), "height": image.height()}
+
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        buffer.close()
+        return {
+            "format": "png",
+            "width": image.width(),
+            "height": image.height(),
+            "data": base64.b64encode(bytes(data)).decode("ascii"),
+        }
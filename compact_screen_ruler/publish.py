@@ -0,0 +1,163 @@
+"""Live stream of the ruler's geometry and pick measurements over a local socket.
+
+Subscribers connect to a `QLocalServer` and receive one JSON object per
+line. The first message, and the first after any dropped messages, is a
+full snapshot:
+
+    {"type": "snapshot", "seq": 0, "dropped": 0, "state": {"x": 10, "y": 20, ...}}
+
+Later messages carry only the fields that changed since the previous one:
+
+    {"type": "delta", "seq": 1, "changes": {"x": 14, "pick": {"x": 3, "y": 9, ...}}}
+
+`pick` is null outside right-click pick mode. Changes are coalesced so each
+subscriber gets at most one message per display frame.
+"""
+
+import json
+import sys
+import time
+from collections import deque
+
+from PyQt6 import QtCore, QtNetwork
+
+from .constants import PUBLISH_MAX_PENDING_BYTES, PUBLISH_QUEUE_SIZE
+from .ipc import listen_local_server
+
+
+class Subscriber:
+    """One connected client and its bounded outgoing message queue."""
+
+    def __init__(self, socket):
+        self.socket = socket
+        self.queue = deque()
+        self.last_state = None
+        self.seq = 0
+        self.dropped = 0
+        self.pending_drops = 0
+
+    def enqueue(self, state):
+        if self.last_state is not None and len(self.queue) >= PUBLISH_QUEUE_SIZE:
+            # Later deltas depend on the ones being dropped, so the backlog is replaced by one snapshot.
+            self.pending_drops += len(self.queue)
+            self.dropped += len(self.queue)
+            self.queue.clear()
+            self.last_state = None
+
+        if self.last_state is None:
+            message = {"type": "snapshot", "seq": self.seq, "dropped": self.pending_drops, "state": state}
+            self.pending_drops = 0
+        else:
+            changes = {key: value for key, value in state.items() if self.last_state.get(key) != value}
+            if not changes:
+                return
+            message = {"type": "delta", "seq": self.seq, "changes": changes}
+        self.queue.append(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+        self.last_state = state
+        self.seq += 1
+
+    def pump(self):
+        # Only hand the socket more data once it has drained, so a stalled client backs up into the bounded
+        # queue instead of Qt's unbounded write buffer.
+        while self.queue and self.socket.bytesToWrite() < PUBLISH_MAX_PENDING_BYTES:
+            self.socket.write(self.queue.popleft())
+
+
+class RulerStatePublisher(QtCore.QObject):
+    """Publish `ruler` state changes to every subscriber at most once per display frame."""
+
+    def __init__(self, ruler, server_name, parent=None):
+        super().__init__(parent)
+        self.ruler = ruler
+        self.server_name = server_name
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.handleNewConnection)
+        self.subscribers = {}
+        self.subscribers_served = 0
+        self.disconnected_dropped = 0
+        self.last_flush_time = 0.0
+
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def start(self):
+        return listen_local_server(self.server, self.server_name)
+
+    def getErrorString(self):
+        return self.server.errorString()
+
+    def handleNewConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            subscriber = Subscriber(socket)
+            self.subscribers[socket] = subscriber
+            self.subscribers_served += 1
+            socket.bytesWritten.connect(lambda _count, subscriber=subscriber: subscriber.pump())
+            socket.disconnected.connect(lambda socket=socket: self.handleDisconnected(socket))
+            subscriber.enqueue(self.getState())
+            subscriber.pump()
+
+    def handleDisconnected(self, socket):
+        subscriber = self.subscribers.pop(socket, None)
+        if subscriber is not None:
+            self.disconnected_dropped += subscriber.dropped
+        socket.deleteLater()
+
+    def getState(self):
+        ruler = self.ruler
+        state = {
+            "x": ruler.pos().x(),
+            "y": ruler.pos().y(),
+            "width": ruler.width(),
+            "height": ruler.height(),
+            "unit": ruler.measurement_unit,
+            "width_text": ruler.formatMeasurementValue(ruler.width(), "x"),
+            "height_text": ruler.formatMeasurementValue(ruler.height(), "y"),
+            "pick": None,
+        }
+        if ruler.drawPickPos:
+            pick_x = ruler.mouse_x - ruler.pos().x()
+            pick_y = ruler.mouse_y - ruler.pos().y()
+            state["pick"] = {
+                "x": pick_x,
+                "y": pick_y,
+                "x_text": ruler.formatMeasurementValue(pick_x, "x"),
+                "y_text": ruler.formatMeasurementValue(pick_y, "y"),
+            }
+        return state
+
+    def markDirty(self):
+        if not self.subscribers or self.flush_timer.isActive():
+            return
+        elapsed = time.perf_counter() - self.last_flush_time
+        delay = max(0.0, self.ruler.getDisplayFrameInterval() - elapsed)
+        self.flush_timer.start(int(delay * 1000.0))
+
+    def flush(self):
+        if not self.subscribers:
+            return
+        self.last_flush_time = time.perf_counter()
+        state = self.getState()
+        for subscriber in self.subscribers.values():
+            subscriber.enqueue(state)
+            subscriber.pump()
+
+    def getStats(self):
+        return {
+            "subscribers": len(self.subscribers),
+            "served": self.subscribers_served,
+            "queued": sum(len(subscriber.queue) for subscriber in self.subscribers.values()),
+            "dropped": self.disconnected_dropped + sum(subscriber.dropped for subscriber in self.subscribers.values()),
+        }
+
+    def reportStats(self):
+        stats = self.getStats()
+        print(
+            f"Published on {self.server_name}: {stats['served']} subscribers served, {stats['subscribers']} still "
+            f"connected, {stats['dropped']} messages dropped, {stats['queued']} unsent",
+            file=sys.stderr,
+            flush=True,
+        )
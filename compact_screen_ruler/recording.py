@@ -0,0 +1,198 @@
+"""Time-lapse and burst recording of the screen region under the ruler."""
+
+import os
+import threading
+import time
+from collections import deque
+
+from PyQt6 import QtCore, QtGui
+
+
+class FrameRingBuffer:
+    """Thread-safe FIFO of captured frames bounded by frame count and bytes.
+
+    When either bound is exceeded the oldest unwritten frame is evicted and
+    counted as dropped.
+    """
+
+    def __init__(self, max_frames, max_bytes):
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self.frames = deque()
+        self.lock = threading.Lock()
+        self.buffered_bytes = 0
+        self.peak_bytes = 0
+        self.evicted = 0
+
+    def push(self, frame_index, timestamp_ms, image):
+        with self.lock:
+            self.frames.append((frame_index, timestamp_ms, image))
+            self.buffered_bytes += image.sizeInBytes()
+            while len(self.frames) > 1 and (len(self.frames) > self.max_frames or self.buffered_bytes > self.max_bytes):
+                _index, _timestamp, dropped_image = self.frames.popleft()
+                self.buffered_bytes -= dropped_image.sizeInBytes()
+                self.evicted += 1
+            self.peak_bytes = max(self.peak_bytes, self.buffered_bytes)
+
+    def pop(self):
+        with self.lock:
+            if not self.frames:
+                return None
+            frame = self.frames.popleft()
+            self.buffered_bytes -= frame[2].sizeInBytes()
+            return frame
+
+    def __len__(self):
+        with self.lock:
+            return len(self.frames)
+
+
+class FrameWriterTask(QtCore.QRunnable):
+    """Drain the ring buffer to numbered image files plus a `frames.csv` timing index."""
+
+    def __init__(self, recorder):
+        super().__init__()
+        self.recorder = recorder
+
+    def run(self):
+        recorder = self.recorder
+        index_path = os.path.join(recorder.output_dir, "frames.csv")
+        write_header = not os.path.exists(index_path)
+        with open(index_path, "a", encoding="utf-8") as index_file:
+            if write_header:
+                index_file.write("frame,timestamp_ms,file\n")
+            while True:
+                frame = recorder.buffer.pop()
+                if frame is None:
+                    break
+                frame_index, timestamp_ms, image = frame
+                file_name = f"frame_{frame_index:06d}{recorder.extension}"
+                if image.save(os.path.join(recorder.output_dir, file_name), recorder.image_format):
+                    index_file.write(f"{frame_index},{timestamp_ms:.3f},{file_name}\n")
+                    with recorder.counter_lock:
+                        recorder.frames_written += 1
+                else:
+                    with recorder.counter_lock:
+                        recorder.write_failures += 1
+        recorder.writerIdle()
+
+
+class RegionRecorder(QtCore.QObject):
+    """Capture `grab_region()` on a timer and stream the frames to disk in the background.
+
+    `grab_region` must return a `QImage` and runs on the GUI thread, because
+    `QScreen.grabWindow` cannot be called from other threads. Only the grab
+    and the `QPixmap` to `QImage` conversion happen there; encoding and file
+    writes run on a dedicated single-thread pool. `grab_region` decides what
+    a frame shows; the ruler passes a grab that leaves itself out.
+    """
+
+    statsChanged = QtCore.pyqtSignal()
+    stopped = QtCore.pyqtSignal()
+
+    def __init__(self, grab_region, output_dir, max_frames, max_bytes, image_format="png", parent=None):
+        super().__init__(parent)
+        self.grab_region = grab_region
+        self.output_dir = output_dir
+        self.image_format = image_format
+        self.extension = f".{image_format}"
+        self.buffer = FrameRingBuffer(max_frames, max_bytes)
+
+        self.thread_pool = QtCore.QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.writer_active = False
+        self.writer_lock = threading.Lock()
+        self.counter_lock = threading.Lock()
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.captureFrame)
+
+        self.interval_ms = 0
+        self.frames_remaining = None
+        self.start_time = 0.0
+        self.last_capture_time = None
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.write_failures = 0
+        self.late_frames = 0
+
+    def isRecording(self):
+        return self.timer.isActive()
+
+    def start(self, interval_ms, frame_count=None):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.interval_ms = max(1, int(interval_ms))
+        self.frames_remaining = frame_count
+        self.start_time = time.perf_counter()
+        self.last_capture_time = None
+        self.timer.start(self.interval_ms)
+        self.captureFrame()
+
+    def stop(self):
+        if not self.timer.isActive():
+            return
+        self.timer.stop()
+        self.statsChanged.emit()
+        self.stopped.emit()
+
+    def captureFrame(self):
+        now = time.perf_counter()
+        if self.last_capture_time is not None:
+            # Ticks that arrive more than half an interval late stand in for the frames they missed.
+            missed = int(((now - self.last_capture_time) * 1000.0) / self.interval_ms + 0.5) - 1
+            self.late_frames += max(0, missed)
+        self.last_capture_time = now
+
+        image = self.grab_region()
+        if image is not None and not image.isNull():
+            self.buffer.push(self.frames_captured, (now - self.start_time) * 1000.0, image)
+            self.frames_captured += 1
+            self.startWriter()
+
+        if self.frames_remaining is not None:
+            self.frames_remaining -= 1
+            if self.frames_remaining <= 0:
+                self.stop()
+                return
+        self.statsChanged.emit()
+
+    def startWriter(self):
+        with self.writer_lock:
+            if self.writer_active:
+                return
+            self.writer_active = True
+        self.thread_pool.start(FrameWriterTask(self))
+
+    def writerIdle(self):
+        with self.writer_lock:
+            self.writer_active = False
+        # A frame pushed after the final pop but before the flag was cleared still needs a writer.
+        if len(self.buffer):
+            self.startWriter()
+
+    def getStats(self):
+        with self.counter_lock:
+            frames_written = self.frames_written
+            write_failures = self.write_failures
+        return {
+            "captured": self.frames_captured,
+            "written": frames_written,
+            "buffered": len(self.buffer),
+            "dropped": self.buffer.evicted + self.late_frames + write_failures,
+            "evicted": self.buffer.evicted,
+            "late": self.late_frames,
+            "write_failures": write_failures,
+            "buffered_bytes": self.buffer.buffered_bytes,
+            "peak_bytes": self.buffer.peak_bytes,
+        }
+
+    def waitForWriter(self, timeout_ms=-1):
+        return self.thread_pool.waitForDone(timeout_ms)
+
+
+def grab_screen_region(screen, rect):
+    """Grab `rect` (global coordinates) from `screen` as a `QImage`."""
+    screen_geo = screen.geometry()
+    pixmap = screen.grabWindow(0, rect.x() - screen_geo.x(), rect.y() - screen_geo.y(), rect.width(), rect.height())
+    return pixmap.toImage() if not pixmap.isNull() else QtGui.QImage()
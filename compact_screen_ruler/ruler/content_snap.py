@@ -0,0 +1,161 @@
+"""Content-aware edge snapping from gradients of a captured screen region.
+
+Importing this module loads NumPy. The ruler imports it, and `region_fit`
+which builds on it, only when a content-aware feature is first used.
+"""
+
+from PyQt6 import QtCore, QtGui
+
+from ..constants import (
+    CONTENT_SNAP_CAPTURE_MARGIN,
+    CONTENT_SNAP_GRADIENT_THRESHOLD,
+    CONTENT_SNAP_MIN_RUN,
+    CONTENT_SNAP_MIN_SPAN,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; content snapping is unavailable without it.
+    np = None
+
+
+def is_content_snap_available():
+    return np is not None
+
+
+def image_to_gray_array(image, width, height):
+    """Return a (height, width) uint8 array of `image` in logical pixels."""
+    gray = image.convertToFormat(QtGui.QImage.Format.Format_Grayscale8)
+    if gray.width() != width or gray.height() != height:
+        # Grabs come back in device pixels on scaled displays.
+        gray = gray.scaled(
+            width,
+            height,
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.FastTransformation,
+        )
+    data = gray.constBits().asstring(gray.sizeInBytes())
+    return np.frombuffer(data, dtype=np.uint8).reshape(gray.height(), gray.bytesPerLine())[:, :width]
+
+
+class ContentEdgeMap:
+    """Edge tables for one capture.
+
+    A boundary at global x counts as an edge pixel in a row when the gray
+    levels on either side differ by at least the gradient threshold. For the
+    positions near a ruler edge, the longest unbroken run of edge pixels
+    along the edge's span decides whether a position is an edge at all, and
+    prefix sums of the step sizes give its strength in a single vectorized
+    slice. Pixels of the ruler itself are masked out.
+    """
+
+    def __init__(self, gray, capture_rect, bounds_rect, ruler_rect):
+        self.rect = capture_rect
+        self.bounds = bounds_rect
+        height, width = gray.shape
+        signed = gray.astype(np.int16)
+
+        # x_steps[r, c] is the boundary at local x = c + 1, y_steps[r, c] the boundary at local y = r + 1.
+        x_steps = np.abs(np.diff(signed, axis=1))
+        y_steps = np.abs(np.diff(signed, axis=0))
+        self.x_edges = x_edges = x_steps >= CONTENT_SNAP_GRADIENT_THRESHOLD
+        self.y_edges = y_edges = y_steps >= CONTENT_SNAP_GRADIENT_THRESHOLD
+
+        mask_left = max(0, ruler_rect.x() - capture_rect.x())
+        mask_top = max(0, ruler_rect.y() - capture_rect.y())
+        mask_right = min(width, ruler_rect.x() + ruler_rect.width() - capture_rect.x())
+        mask_bottom = min(height, ruler_rect.y() + ruler_rect.height() - capture_rect.y())
+        if mask_right > mask_left and mask_bottom > mask_top:
+            x_edges[mask_top:mask_bottom, max(0, mask_left - 1) : mask_right] = False
+            y_edges[max(0, mask_top - 1) : mask_bottom, mask_left:mask_right] = False
+
+        self.x_strength = np.zeros((height + 1, max(0, width - 1)), dtype=np.int32)
+        np.cumsum(np.where(x_edges, x_steps, 0), axis=0, out=self.x_strength[1:])
+        self.y_strength = np.zeros((max(0, height - 1), width + 1), dtype=np.int32)
+        np.cumsum(np.where(y_edges, y_steps, 0), axis=1, out=self.y_strength[:, 1:])
+
+    def covers(self, axis, value, span_start, span_end, max_distance):
+        if axis == "x":
+            low, high = max(value - max_distance, self.bounds.left()), min(value + max_distance, self.bounds.right())
+            span_low, span_high = self.rect.top(), self.rect.bottom() + 1
+            inside = self.rect.left() <= low and high <= self.rect.right()
+        else:
+            low, high = max(value - max_distance, self.bounds.top()), min(value + max_distance, self.bounds.bottom())
+            span_low, span_high = self.rect.left(), self.rect.right() + 1
+            inside = self.rect.top() <= low and high <= self.rect.bottom()
+        return inside and min(span_end, span_high) - max(span_start, span_low) >= CONTENT_SNAP_MIN_SPAN
+
+    def findEdge(self, axis, value, span_start, span_end, max_distance):
+        """Return `(distance, position)` of the best edge within `max_distance` of `value`, or None."""
+        if axis == "x":
+            edges, strength, origin, span_origin = self.x_edges, self.x_strength, self.rect.x(), self.rect.y()
+        else:
+            edges, strength, origin, span_origin = self.y_edges.T, self.y_strength.T, self.rect.y(), self.rect.x()
+        span_limit, position_count = edges.shape
+
+        first = max(0, min(span_limit, span_start - span_origin))
+        last = max(0, min(span_limit, span_end - span_origin))
+        low = max(0, value - max_distance - origin - 1)
+        high = min(position_count, value + max_distance - origin)
+        if last - first < CONTENT_SNAP_MIN_SPAN or high <= low:
+            return None
+
+        # Longest unbroken run of edge pixels along the span at each position: the count since the last gap.
+        window = edges[first:last, low:high]
+        counts = np.cumsum(window, axis=0, dtype=np.int32)
+        longest = (counts - np.maximum.accumulate(np.where(window, 0, counts), axis=0)).max(axis=0)
+        total_strength = strength[last, low:high] - strength[first, low:high]
+        positions = np.arange(low, high) + origin + 1
+        distances = np.abs(positions - value)
+
+        # A position is an edge when a long enough stretch of the span sees one, however long the span is.
+        # Short spans need to be covered from end to end. Prefer the strongest edge, then the nearest one.
+        min_run = min(CONTENT_SNAP_MIN_RUN, last - first)
+        score = np.where(longest >= min_run, total_strength - distances * 1e-4, -1.0)
+        best = int(np.argmax(score))
+        if score[best] < 0:
+            return None
+        return int(distances[best]), int(positions[best])
+
+
+class ContentSnapper:
+    """Reuse one capture around the ruler across drag events and re-grab only when it no longer covers a query.
+
+    `grab_region(rect)` returns `(image, captured_rect, bounds_rect)` for a
+    global rect, clipped to the screen it is on, or None.
+    """
+
+    def __init__(self, grab_region):
+        self.grab_region = grab_region
+        self.edge_map = None
+        self.capture_ruler_rect = None
+        self.captures = 0
+
+    def reset(self):
+        self.edge_map = None
+        self.capture_ruler_rect = None
+
+    def capture(self, ruler_rect):
+        margin = CONTENT_SNAP_CAPTURE_MARGIN
+        grabbed = self.grab_region(ruler_rect.adjusted(-margin, -margin, margin, margin))
+        self.edge_map = None
+        self.capture_ruler_rect = QtCore.QRect(ruler_rect)
+        if grabbed is None:
+            return
+        image, capture_rect, bounds_rect = grabbed
+        if image.isNull() or capture_rect.width() < 2 or capture_rect.height() < 2:
+            return
+        gray = image_to_gray_array(image, capture_rect.width(), capture_rect.height())
+        self.edge_map = ContentEdgeMap(gray, capture_rect, bounds_rect, ruler_rect)
+        self.captures += 1
+
+    def findEdge(self, axis, value, span_start, span_end, max_distance, ruler_rect):
+        needs_capture = self.edge_map is None or not self.edge_map.covers(
+            axis, value, span_start, span_end, max_distance
+        )
+        # Grabbing again from the same ruler position would not cover any more of the screen.
+        if needs_capture and ruler_rect != self.capture_ruler_rect:
+            self.capture(ruler_rect)
+        if self.edge_map is None:
+            return None
+        return self.edge_map.findEdge(axis, value, span_start, span_end, max_distance)
@@ -1,10 +1,37 @@
 """Core widget lifecycle and command handlers for the ruler."""
 
+import os
+import sys
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from ..dialogs import ChooseGeometry, HelpDialog
+from ..constants import (
+    CLICKTHROUGH_CURSOR_SPEED,
+    CLICKTHROUGH_POLL_MAX_MS,
+    CLICKTHROUGH_POLL_MIN_MS,
+    CLICK_FIT_MIN_AREA,
+    CLICK_FIT_NEIGHBORHOOD,
+    LOD_LABEL_BUDGET,
+    LOD_MINIMAL_FRAME_MS,
+    LOD_REDUCED_FRAME_MS,
+    LOD_SAMPLE_COUNT,
+    LOUPE_ZOOM_LEVELS,
+    MEASUREMENT_UNITS,
+    RECORDING_BURST_FRAMES,
+    RECORDING_INTERVAL_MS,
+    RECORDING_MAX_BYTES,
+    RECORDING_MAX_FRAMES,
+    TEXT_LAYOUT_CACHE_SIZE,
+)
+from ..recording import RegionRecorder, grab_screen_region
+from ..screenshots import SCREENSHOT_FILE_FILTERS, ScreenshotOptions, ScreenshotWriter, get_format_for_path
+from .quality import LOD_FULL
+from .screen_metrics import ScreenMetricsCache
+from .snap_engine import SnapEngine
+from .text_cache import TextLayoutCache
 
 
 class RulerCore(QtWidgets.QWidget):
@@ -37,6 +64,16 @@ class RulerCore(QtWidgets.QWidget):
         self.measurement_unit = "px"
         self.grid_enabled = False
         self.help_dialog = None
+        self.screenshot_options = ScreenshotOptions.fromEnvironment()
+        self.screenshot_progress = {}
+        self.screenshot_writer = None
+        self.recorder = None
+        try:
+            self.recording_interval_ms = int(os.environ.get("SCREEN_RULER_RECORD_INTERVAL_MS", RECORDING_INTERVAL_MS))
+        except ValueError:
+            self.recording_interval_ms = RECORDING_INTERVAL_MS
+        if self.recording_interval_ms <= 0:
+            self.recording_interval_ms = RECORDING_INTERVAL_MS
         self.clickthrough_enabled = False
         self.hover_zones = {"left": False, "right": False, "top": False, "bottom": False}
         self.active_interaction_zones = {"left": False, "right": False, "top": False, "bottom": False}
@@ -47,11 +84,56 @@ class RulerCore(QtWidgets.QWidget):
         self.left_dragged_since_press = False
         self.press_global_pos = QtCore.QPoint(0, 0)
         self.offset = QtCore.QPoint(0, 0)
+        self.pick_crosshair_pos = None
+        self.pick_readout_rect = QtCore.QRect()
+        self.pick_overlay = None
+        self.state_publisher = None
+        self.highlighted_screen_edges = {"left": False, "right": False, "top": False, "bottom": False}
+        self.drawn_snap_guides = {"x": (), "y": ()}
+        self.frame_pacing_enabled = os.environ.get("SCREEN_RULER_FRAME_PACING", "1") != "0"
+        self.pending_global_pos = None
+        self.last_interaction_frame_time = 0.0
+        self.pointer_events_received = 0
+        self.pointer_frames_applied = 0
+        self.paint_profiler = None
+        self.latency_tracer = None
+        self.latency_readout_visible = False
+        self.latency_readout_timer = None
+        self.clickthrough_poll_wakeups = 0
+        self.clickthrough_poll_started = 0.0
+        self.clickthrough_poll_stopped = 0.0
+        self.adaptive_quality_enabled = True
+        self.render_lod = LOD_FULL
+        self.recent_frame_times = deque(maxlen=LOD_SAMPLE_COUNT)
+        self.lod_reduced_frame_ms = LOD_REDUCED_FRAME_MS
+        self.lod_minimal_frame_ms = LOD_MINIMAL_FRAME_MS
+        self.lod_label_budget = LOD_LABEL_BUDGET
+        self.tick_layer_cache = OrderedDict()
+        self.tick_layer_cache_bytes = 0
+        self.tick_schedule = None
+        self.tick_schedule_key = None
+        self.batched_tick_lines = True
+        self.tick_draw_calls = 0
+        self.tick_label_cache = {}
+        self.grid_tile_cache = {}
+        self.text_layout_cache = TextLayoutCache(TEXT_LAYOUT_CACHE_SIZE)
+        self.current_screen = None
+        self.screen_metrics = ScreenMetricsCache(self.handleScreenMetricsChanged)
+        self.snap_engine = SnapEngine(self.screen_metrics)
+        self.content_snap_enabled = False
+        self.content_snapper = None
+        self.scanline_enabled = False
+        self.scanline_capture = None
+        self.scanline_spans = []
+        self.scanline_spans_key = None
+        self.loupe_zoom = LOUPE_ZOOM_LEVELS[0]
+        self.loupe_window = None
+        self.loupe_screen_rect = QtCore.QRect()
 
         self.setWindowFlags(QtCore.Qt.WindowType.FramelessWindowHint | QtCore.Qt.WindowType.WindowStaysOnTopHint)
 
+        # The window icon comes from the application icon set in app.py.
         self.setWindowTitle("Compact Screen Ruler")
-        self.setWindowIcon(QtGui.QIcon("icon.png"))
 
         self.resize(self.window_size_x, self.window_size_y)
         self.center()
@@ -59,7 +141,24 @@ class RulerCore(QtWidgets.QWidget):
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setMouseTracking(True)
 
+        # Nothing below is needed for the first frame: shortcuts and stored snap guides are loaded once the event
+        # loop runs, and the clickthrough button and its timer are built the first time clickthrough mode is enabled.
         self.shortcuts = []
+        self.shortcuts_installed = False
+        QtCore.QTimer.singleShot(0, self.installShortcuts)
+        QtCore.QTimer.singleShot(0, self.loadSnapGuides)
+        self.disable_clickthrough_button = None
+        self.clickthrough_hover_timer = None
+
+        self.interaction_frame_timer = QtCore.QTimer(self)
+        self.interaction_frame_timer.setSingleShot(True)
+        self.interaction_frame_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.interaction_frame_timer.timeout.connect(self.applyPendingPointerState)
+
+    def installShortcuts(self):
+        if self.shortcuts_installed:
+            return
+        self.shortcuts_installed = True
         shortcut_map = {
             "Q": self.close,
             "Ctrl+Q": self.close,
@@ -73,7 +172,18 @@ class RulerCore(QtWidgets.QWidget):
             "L": self.toggleAspectRatioLock,
             "U": self.toggleMeasurementUnit,
             "G": self.toggleGridMode,
+            "E": self.toggleContentSnap,
+            "A": self.fitToElementUnderCursor,
+            "M": self.toggleScanlineInspector,
+            "Ctrl+M": self.refreshScanlineCapture,
+            "Z": self.cycleLoupeZoom,
+            "F5": self.recaptureLoupe,
+            "Ctrl+G": self.addSnapGuidesAtCursor,
+            "Ctrl+Shift+G": self.clearSnapGuides,
+            "Ctrl+Shift+L": self.toggleLatencyReadout,
             "Ctrl+S": self.takeScreenshot,
+            "Ctrl+R": self.toggleTimeLapseRecording,
+            "Ctrl+B": self.startBurstRecording,
             "F1": self.displayHelp,
             "H": self.displayHelp,
         }
@@ -82,32 +192,43 @@ class RulerCore(QtWidgets.QWidget):
             shortcut.activated.connect(callback)
             self.shortcuts.append(shortcut)
 
-        self.disable_clickthrough_button = QtWidgets.QPushButton("Disable Clickthrough Mode", None)
-        self.disable_clickthrough_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-        self.disable_clickthrough_button.setWindowFlags(
-            QtCore.Qt.WindowType.Tool
-            | QtCore.Qt.WindowType.FramelessWindowHint
-            | QtCore.Qt.WindowType.WindowStaysOnTopHint
-        )
-        self.disable_clickthrough_button.clicked.connect(self.disableClickthroughMode)
-        self.disable_clickthrough_button.hide()
-
-        self.clickthrough_hover_timer = QtCore.QTimer(self)
-        self.clickthrough_hover_timer.setInterval(50)
-        self.clickthrough_hover_timer.timeout.connect(self.updateClickthroughButtonVisibility)
-
-        self.updateClickthroughButtonGeometry()
+    def getClickthroughButton(self):
+        if self.disable_clickthrough_button is None:
+            self.clickthrough_hover_timer = QtCore.QTimer(self)
+            self.clickthrough_hover_timer.setSingleShot(True)
+            self.clickthrough_hover_timer.timeout.connect(self.pollClickthroughHover)
+
+            self.disable_clickthrough_button = QtWidgets.QPushButton("Disable Clickthrough Mode", None)
+            self.disable_clickthrough_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+            self.disable_clickthrough_button.setWindowFlags(
+                QtCore.Qt.WindowType.Tool
+                | QtCore.Qt.WindowType.FramelessWindowHint
+                | QtCore.Qt.WindowType.WindowStaysOnTopHint
+            )
+            self.disable_clickthrough_button.clicked.connect(self.disableClickthroughMode)
+            self.disable_clickthrough_button.installEventFilter(self)
+            self.disable_clickthrough_button.hide()
+        return self.disable_clickthrough_button
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self.updateCurrentScreen()
         self.updateClickthroughButtonGeometry()
+        self.publishStateChange()
+        self.updateSnapGuides()
 
     def moveEvent(self, event):
         super().moveEvent(event)
+        self.updateCurrentScreen()
+        self.publishStateChange()
         self.updateClickthroughButtonGeometry()
-        self.update()
+        self.updateScreenEdgeHighlight()
+        self.updateSnapGuides()
+        self.updateScanlineOverlay()
 
     def updateClickthroughButtonGeometry(self):
+        if self.disable_clickthrough_button is None:
+            return
         button_width = min(
             max(170, self.disable_clickthrough_button.sizeHint().width() + 16),
             max(50, self.width() - 16),
@@ -123,13 +244,59 @@ class RulerCore(QtWidgets.QWidget):
 
     def updateClickthroughButtonVisibility(self):
         if not self.clickthrough_enabled:
-            self.disable_clickthrough_button.hide()
+            if self.disable_clickthrough_button is not None:
+                self.clickthrough_hover_timer.stop()
+                self.disable_clickthrough_button.hide()
             return
 
         cursor_pos = QtGui.QCursor.pos()
-        is_hovering_ruler = self.frameGeometry().contains(cursor_pos)
+        frame = self.frameGeometry()
+        is_hovering_ruler = frame.contains(cursor_pos)
         self.disable_clickthrough_button.setVisible(is_hovering_ruler)
 
+        # While the cursor is on the button its Leave event takes over from polling.
+        if is_hovering_ruler and self.disable_clickthrough_button.underMouse():
+            self.clickthrough_hover_timer.stop()
+            return
+        self.clickthrough_hover_timer.start(self.getClickthroughPollInterval(frame, cursor_pos))
+
+    def getClickthroughPollInterval(self, frame, cursor_pos):
+        cursor_x = cursor_pos.x()
+        cursor_y = cursor_pos.y()
+        if frame.contains(cursor_pos):
+            # Inside the ruler, the nearest edge is what the cursor has to cross to leave.
+            distance = min(
+                cursor_x - frame.left(), frame.right() - cursor_x, cursor_y - frame.top(), frame.bottom() - cursor_y
+            )
+        else:
+            distance_x = max(frame.left() - cursor_x, 0, cursor_x - frame.right())
+            distance_y = max(frame.top() - cursor_y, 0, cursor_y - frame.bottom())
+            distance = max(distance_x, distance_y)
+
+        interval = int(distance / CLICKTHROUGH_CURSOR_SPEED)
+        return max(CLICKTHROUGH_POLL_MIN_MS, min(CLICKTHROUGH_POLL_MAX_MS, interval))
+
+    def pollClickthroughHover(self):
+        self.clickthrough_poll_wakeups += 1
+        self.updateClickthroughButtonVisibility()
+
+    def getClickthroughPollStats(self):
+        stopped = time.perf_counter() if self.clickthrough_enabled else self.clickthrough_poll_stopped
+        elapsed = max(0.0, stopped - self.clickthrough_poll_started)
+        return {
+            "wakeups": self.clickthrough_poll_wakeups,
+            "seconds": elapsed,
+            "wakeups_per_second": self.clickthrough_poll_wakeups / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def eventFilter(self, watched, event):
+        if watched is self.disable_clickthrough_button and self.clickthrough_enabled:
+            if event.type() == QtCore.QEvent.Type.Enter:
+                self.clickthrough_hover_timer.stop()
+            elif event.type() == QtCore.QEvent.Type.Leave:
+                self.updateClickthroughButtonVisibility()
+        return super().eventFilter(watched, event)
+
     def setClickthroughEnabled(self, enabled):
         enabled = bool(enabled)
         if self.clickthrough_enabled == enabled:
@@ -139,19 +306,19 @@ class RulerCore(QtWidgets.QWidget):
         self.setWindowFlag(QtCore.Qt.WindowType.WindowTransparentForInput, enabled)
         self.show()
         if enabled:
-            if not self.clickthrough_hover_timer.isActive():
-                self.clickthrough_hover_timer.start()
-            self.updateClickthroughButtonVisibility()
+            self.getClickthroughButton()
+            self.clickthrough_poll_wakeups = 0
+            self.clickthrough_poll_started = time.perf_counter()
         else:
-            self.clickthrough_hover_timer.stop()
-            self.disable_clickthrough_button.hide()
+            self.clickthrough_poll_stopped = time.perf_counter()
+        self.updateClickthroughButtonVisibility()
         if enabled:
             self.disable_clickthrough_button.raise_()
             self.updateClickthroughButtonGeometry()
         else:
             self.raise_()
             self.activateWindow()
-        self.update()
+        self.update(self.getStatusMessagesRegion())
 
     def toggleClickthroughMode(self):
         self.setClickthroughEnabled(not self.clickthrough_enabled)
@@ -167,6 +334,8 @@ class RulerCore(QtWidgets.QWidget):
         self.move(qr.topLeft())
 
     def setWindowSize(self):
+        from ..dialogs import ChooseGeometry
+
         dialog = ChooseGeometry([self.pos().x(), self.pos().y(), self.window_size_x, self.window_size_y])
 
         values = []
@@ -174,13 +343,63 @@ class RulerCore(QtWidgets.QWidget):
             values = dialog.get_values()
 
         if values:
-            pos_x, pos_y, size_x, size_y = values
-            self.move(pos_x, pos_y)
-            self.resize(size_x, size_y)
-            self.window_size_x = size_x
-            self.window_size_y = size_y
-            if self.aspect_lock_enabled:
-                self.setAspectLockTarget(size_x, size_y)
+            self.setRulerGeometry(*values)
+
+    def setRulerGeometry(self, pos_x, pos_y, size_x, size_y):
+        self.move(pos_x, pos_y)
+        self.resize(size_x, size_y)
+        self.window_size_x = size_x
+        self.window_size_y = size_y
+        if self.aspect_lock_enabled:
+            self.setAspectLockTarget(size_x, size_y)
+
+    def fitToElementUnderCursor(self):
+        from .content_snap import is_content_snap_available
+
+        if not is_content_snap_available():
+            print(
+                "Fitting to the element under the cursor needs NumPy (pip install numpy).", file=sys.stderr, flush=True
+            )
+            return
+
+        cursor_pos = QtGui.QCursor.pos()
+        screen = QtGui.QGuiApplication.screenAt(cursor_pos) or QtGui.QGuiApplication.primaryScreen()
+        if not screen:
+            return
+
+        radius = CLICK_FIT_NEIGHBORHOOD // 2
+        capture_rect = QtCore.QRect(cursor_pos.x() - radius, cursor_pos.y() - radius, 2 * radius, 2 * radius)
+        capture_rect = capture_rect.intersected(self.screen_metrics.get(screen).geometry)
+        if capture_rect.isEmpty():
+            return
+
+        hide_ruler = self.frameGeometry().intersects(capture_rect)
+        if hide_ruler:
+            self.hide()
+        image = grab_screen_region(screen, capture_rect)
+        if hide_ruler:
+            self.show()
+        if image.isNull():
+            return
+
+        from .region_fit import find_region_bounds, fit_rect_to_aspect, image_to_rgb_array
+
+        pixels = image_to_rgb_array(image, capture_rect.width(), capture_rect.height())
+        left, top, right, bottom, area = find_region_bounds(
+            pixels, cursor_pos.x() - capture_rect.x(), cursor_pos.y() - capture_rect.y()
+        )
+        if area < CLICK_FIT_MIN_AREA:
+            return
+
+        box = QtCore.QRect(capture_rect.x() + left, capture_rect.y() + top, right - left, bottom - top)
+        if self.aspect_lock_enabled:
+            box = fit_rect_to_aspect(box, self.aspect_lock_ratio if self.aspect_lock_ratio > 0 else 1.0)
+
+        size_x = max(self.MIN_WINDOW_SIZE, box.width())
+        size_y = max(self.MIN_WINDOW_SIZE, box.height())
+        self.setGeometry(box.x(), box.y(), size_x, size_y)
+        self.window_size_x = size_x
+        self.window_size_y = size_y
 
     def flipOrientation(self):
         width = self.width()
@@ -211,13 +430,22 @@ class RulerCore(QtWidgets.QWidget):
         self.aspect_lock_enabled = not self.aspect_lock_enabled
         if self.aspect_lock_enabled:
             self.setAspectLockTarget(self.width(), self.height())
-        self.update()
+        self.update(self.getStatusMessagesRegion())
 
     def toggleMeasurementUnit(self):
-        units = ("px", "cm", "in")
+        units = MEASUREMENT_UNITS
         current_index = units.index(self.measurement_unit) if self.measurement_unit in units else 0
-        self.measurement_unit = units[(current_index + 1) % len(units)]
+        self.setMeasurementUnit(units[(current_index + 1) % len(units)])
+
+    def setMeasurementUnit(self, unit):
+        self.measurement_unit = unit
+        self.clearTickLabelCache()
         self.update()
+        self.publishStateChange()
+
+    def publishStateChange(self):
+        if self.state_publisher is not None:
+            self.state_publisher.markDirty()
 
     def toggleGridMode(self):
         self.grid_enabled = not self.grid_enabled
@@ -229,44 +457,139 @@ class RulerCore(QtWidgets.QWidget):
         if clipboard is not None:
             clipboard.setText(dimensions_text)
 
-    def takeScreenshot(self):
-        window_x = self.pos().x()
-        window_y = self.pos().y()
-        window_w = self.width()
-        window_h = self.height()
-
-        center_point = self.frameGeometry().center()
-        screen = QtGui.QGuiApplication.screenAt(center_point)
-        if not screen:
-            screen = QtGui.QGuiApplication.primaryScreen()
-
+    def grabRulerRegion(self):
+        screen = self.getCenterScreen()
         if not screen:
-            return
+            return None
+        return grab_screen_region(screen, QtCore.QRect(self.pos(), self.size()))
 
+    def grabScreenshotImage(self):
+        # QPixmap is GUI-thread only; the encoder works on the returned QImage.
         self.hide()
-
-        screen_geo = screen.geometry()
-        local_x = window_x - screen_geo.x()
-        local_y = window_y - screen_geo.y()
-        screenshot = screen.grabWindow(0, local_x, local_y, window_w, window_h)
-
-        default_name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        fname, _ = QtWidgets.QFileDialog.getSaveFileName(
+        image = self.grabRulerRegion()
+        self.show()
+        return image
+
+    def grabRecordingFrame(self):
+        # Hiding and showing every frame would flicker and drop an ongoing drag's mouse grab, so the ruler
+        # is made fully transparent for the grab instead, as for the loupe.
+        self.setWindowOpacity(0.0)
+        image = self.grabRulerRegion()
+        self.setWindowOpacity(1.0)
+        return image
+
+    def getScreenshotPath(self, image):
+        options = self.screenshot_options
+        if options.output_dir:
+            return options.buildOutputPath(image.width(), image.height())
+
+        file_filters = [SCREENSHOT_FILE_FILTERS[options.image_format]]
+        file_filters.extend(name for key, name in SCREENSHOT_FILE_FILTERS.items() if key != options.image_format)
+        fname, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Save screenshot",
-            default_name,
-            "PNG File (*.png)",
+            options.buildFileName(image.width(), image.height()),
+            ";;".join(file_filters),
         )
-        if fname and not fname.lower().endswith(".png"):
-            fname += ".png"
+        if not fname:
+            return None
 
-        if fname:
-            screenshot.save(fname, "png")
+        selected_format = next(
+            (key for key, name in SCREENSHOT_FILE_FILTERS.items() if name == selected_filter), options.image_format
+        )
+        if get_format_for_path(fname, None) is None:
+            fname = fname.rstrip(".") + ScreenshotOptions(image_format=selected_format).getExtension()
+        return fname
+
+    def getScreenshotWriter(self):
+        if self.screenshot_writer is None:
+            self.screenshot_writer = ScreenshotWriter(self)
+            self.screenshot_writer.progress.connect(self.handleScreenshotProgress)
+            self.screenshot_writer.finished.connect(self.handleScreenshotDone)
+            self.screenshot_writer.failed.connect(self.handleScreenshotFailed)
+        return self.screenshot_writer
 
-        self.show()
+    def takeScreenshot(self):
+        image = self.grabScreenshotImage()
+        if image is None or image.isNull():
+            return
+
+        path = self.getScreenshotPath(image)
+        if path:
+            self.saveScreenshot(image, path)
+
+    def saveScreenshot(self, image, path):
+        self.screenshot_progress[path] = 0
+        self.getScreenshotWriter().save(image, path, self.screenshot_options)
+        self.update(self.getStatusMessagesRegion())
+
+    def handleScreenshotProgress(self, path, percent):
+        if path in self.screenshot_progress:
+            self.screenshot_progress[path] = percent
+            self.update(self.getStatusMessagesRegion())
+
+    def handleScreenshotDone(self, path):
+        self.screenshot_progress.pop(path, None)
+        self.update(self.getStatusMessagesRegion())
+
+    def handleScreenshotFailed(self, path, message):
+        self.handleScreenshotDone(path)
+        print(f"Could not save screenshot {path}: {message}", file=sys.stderr, flush=True)
+
+    def getRecordingDirectory(self):
+        base_dir = self.screenshot_options.output_dir
+        if not base_dir:
+            base_dir = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose recording folder")
+            if not base_dir:
+                return None
+        return os.path.join(base_dir, datetime.now().strftime("recording_%Y-%m-%d_%H-%M-%S"))
+
+    def isRecording(self):
+        return self.recorder is not None and self.recorder.isRecording()
+
+    def startRecording(self, interval_ms, frame_count=None):
+        if self.isRecording():
+            self.recorder.stop()
+            return
+
+        output_dir = self.getRecordingDirectory()
+        if not output_dir:
+            return
+
+        self.recorder = RegionRecorder(
+            self.grabRecordingFrame, output_dir, RECORDING_MAX_FRAMES, RECORDING_MAX_BYTES, parent=self
+        )
+        self.recorder.statsChanged.connect(lambda: self.update(self.getStatusMessagesRegion()))
+        self.recorder.stopped.connect(self.reportRecordingStats)
+        self.recorder.start(interval_ms, frame_count)
+
+    def finishRecording(self):
+        # Frames still in the ring buffer are written out before the application exits.
+        if self.recorder is None:
+            return
+        self.recorder.stop()
+        self.recorder.waitForWriter()
+
+    def toggleTimeLapseRecording(self):
+        self.startRecording(self.recording_interval_ms)
+
+    def startBurstRecording(self):
+        self.startRecording(self.getDisplayFrameInterval() * 1000.0, RECORDING_BURST_FRAMES)
+
+    def reportRecordingStats(self):
+        stats = self.recorder.getStats()
+        print(
+            f"Recording to {self.recorder.output_dir}: {stats['captured']} frames captured, "
+            f"{stats['dropped']} dropped ({stats['late']} late, {stats['evicted']} evicted, "
+            f"{stats['write_failures']} write failures), peak buffer {stats['peak_bytes'] / 1048576:.1f} MiB",
+            file=sys.stderr,
+            flush=True,
+        )
 
     def displayHelp(self):
         if self.help_dialog is None:
+            from ..dialogs import HelpDialog
+
             self.help_dialog = HelpDialog()
 
         self.help_dialog.show()
@@ -0,0 +1,101 @@
+"""Damage-region tracking so repaints cover only what changed."""
+
+from PyQt6 import QtCore, QtGui
+
+
+class RulerDamageMixin:
+    """Compute and request repaints for the regions touched by state changes."""
+
+    def getHoverHintRegion(self, zones):
+        width = self.width()
+        height = self.height()
+        grab_size_x = min(self.GRAB_HANDLE_SIZE, max(1, width // 2))
+        grab_size_y = min(self.GRAB_HANDLE_SIZE, max(1, height // 2))
+
+        region = QtGui.QRegion()
+        if zones["top"]:
+            region = region.united(QtCore.QRect(0, 0, width, grab_size_y))
+        if zones["bottom"]:
+            region = region.united(QtCore.QRect(0, max(height - grab_size_y, 0), width, grab_size_y))
+        if zones["left"]:
+            region = region.united(QtCore.QRect(0, 0, grab_size_x, height))
+        if zones["right"]:
+            region = region.united(QtCore.QRect(max(width - grab_size_x, 0), 0, grab_size_x, height))
+        return region
+
+    def getDisplayedHoverZones(self):
+        is_interacting = self.leftclick or self.middleclick or self.drawPickPos
+        return self.active_interaction_zones if is_interacting else self.hover_zones
+
+    def getCrosshairRegion(self, mouse_xpos, mouse_ypos):
+        width = self.width()
+        height = self.height()
+
+        region = QtGui.QRegion()
+        if width >= 88:
+            region = region.united(QtCore.QRect(mouse_xpos - 1, 0, 3, height))
+        if height > 80 or width < 88:
+            region = region.united(QtCore.QRect(0, mouse_ypos - 1, width, 3))
+        return region
+
+    def getReadoutRegion(self, size_x, size_y):
+        text, draw_rect, alignment = self.getResolutionReadoutLayout(size_x, size_y)
+        text_rect = self.getResolutionTextRect(draw_rect, alignment, text)
+        return QtGui.QRegion(self.resolution_text_rect.united(text_rect).adjusted(-2, -2, 2, 2))
+
+    def getStatusMessagesRegion(self):
+        top = int(self.height() / 2) + 10
+        return QtGui.QRegion(QtCore.QRect(0, top, self.width(), max(0, self.height() - top)))
+
+    def getScreenEdgeRegion(self, edges):
+        width = self.width()
+        height = self.height()
+
+        # Edge highlights use a 2px pen centered on the outermost pixel row/column.
+        region = QtGui.QRegion()
+        if edges["top"]:
+            region = region.united(QtCore.QRect(0, 0, width, 3))
+        if edges["bottom"]:
+            region = region.united(QtCore.QRect(0, max(height - 3, 0), width, 3))
+        if edges["left"]:
+            region = region.united(QtCore.QRect(0, 0, 3, height))
+        if edges["right"]:
+            region = region.united(QtCore.QRect(max(width - 3, 0), 0, 3, height))
+        return region
+
+    def getVisibleSnapGuides(self):
+        # Guides in local coordinates, for the global positions the ruler covers.
+        x_pos = self.pos().x()
+        y_pos = self.pos().y()
+        return {
+            "x": tuple(x - x_pos for x in self.snap_engine.getGuidesWithin("x", x_pos, x_pos + self.width())),
+            "y": tuple(y - y_pos for y in self.snap_engine.getGuidesWithin("y", y_pos, y_pos + self.height())),
+        }
+
+    def getSnapGuideRegion(self, guides):
+        region = QtGui.QRegion()
+        for x_pos in guides["x"]:
+            region = region.united(QtCore.QRect(x_pos, 0, 1, self.height()))
+        for y_pos in guides["y"]:
+            region = region.united(QtCore.QRect(0, y_pos, self.width(), 1))
+        return region
+
+    def updateSnapGuides(self):
+        visible_guides = self.getVisibleSnapGuides()
+        if visible_guides == self.drawn_snap_guides:
+            return
+        region = self.getSnapGuideRegion(self.drawn_snap_guides).united(self.getSnapGuideRegion(visible_guides))
+        self.drawn_snap_guides = visible_guides
+        self.update(region)
+
+    def updateScreenEdgeHighlight(self):
+        is_dragging = self.leftclick or self.middleclick
+        if is_dragging:
+            aligned_edges = self.getScreenEdgeAlignment()
+        else:
+            aligned_edges = {"left": False, "right": False, "top": False, "bottom": False}
+
+        changed_edges = {edge: aligned_edges[edge] != self.highlighted_screen_edges[edge] for edge in aligned_edges}
+        self.highlighted_screen_edges = aligned_edges
+        if any(changed_edges.values()):
+            self.update(self.getScreenEdgeRegion(changed_edges))
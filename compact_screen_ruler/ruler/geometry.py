@@ -1,8 +1,11 @@
 """Geometry and hit-testing logic for the ruler widget."""
 
+import sys
+
 from PyQt6 import QtCore, QtGui
 
 from ..constants import SCREEN_EDGE_SNAP_DISTANCE
+from ..recording import grab_screen_region
 
 
 class RulerGeometryMixin:
@@ -12,44 +15,48 @@ class RulerGeometryMixin:
         screen = self.getCenterScreen()
         if not screen:
             return 0.0
+        return self.screen_metrics.get(screen).getPixelsPerInch(axis)
 
-        axis_name = str(axis).lower()
-        if axis_name == "y":
-            pixels_per_inch = float(screen.physicalDotsPerInchY())
-        else:
-            pixels_per_inch = float(screen.physicalDotsPerInchX())
-
-        if pixels_per_inch <= 0:
-            if axis_name == "y":
-                pixels_per_inch = float(screen.logicalDotsPerInchY())
-            else:
-                pixels_per_inch = float(screen.logicalDotsPerInchX())
-
-        if pixels_per_inch <= 0:
-            return 0.0
-
-        scale_factor = float(screen.devicePixelRatio())
-        if scale_factor <= 0:
-            scale_factor = 1.0
-
-        return pixels_per_inch / scale_factor
-
-    def getCenterScreen(self, x_pos=None, y_pos=None, width=None, height=None):
-        if x_pos is None or y_pos is None or width is None or height is None:
-            frame = self.frameGeometry()
-            center_point = frame.center()
-        else:
-            center_point = QtCore.QPoint(int(x_pos + width / 2), int(y_pos + height / 2))
-
-        screen = QtGui.QGuiApplication.screenAt(center_point)
+    def findScreenAt(self, point):
+        screen = QtGui.QGuiApplication.screenAt(point)
         if not screen:
             screen = QtGui.QGuiApplication.primaryScreen()
         return screen
 
+    def getCenterScreen(self, x_pos=None, y_pos=None, width=None, height=None):
+        if x_pos is None or y_pos is None or width is None or height is None:
+            if self.current_screen is None:
+                self.current_screen = self.findScreenAt(self.frameGeometry().center())
+            return self.current_screen
+
+        center_point = QtCore.QPoint(int(x_pos + width / 2), int(y_pos + height / 2))
+        if self.current_screen is not None and self.screen_metrics.get(self.current_screen).geometry.contains(
+            center_point
+        ):
+            return self.current_screen
+        return self.findScreenAt(center_point)
+
+    def updateCurrentScreen(self):
+        # Only look the screen up again when the ruler's center leaves the tracked screen.
+        center_point = self.frameGeometry().center()
+        if self.current_screen is not None and self.screen_metrics.get(self.current_screen).geometry.contains(
+            center_point
+        ):
+            return
+        screen = self.findScreenAt(center_point)
+        if screen is not self.current_screen:
+            self.current_screen = screen
+            # Physical-unit ticks follow the new screen's DPI; a move alone would not repaint them.
+            self.update()
+
+    def handleScreenMetricsChanged(self, _screen):
+        self.current_screen = None
+        self.snap_engine.invalidate()
+        self.update()
+
     def getResolutionTextRect(self, draw_rect, alignment, text):
-        metrics = QtGui.QFontMetrics(self.font())
         flags = int(alignment) | int(QtCore.Qt.TextFlag.TextSingleLine)
-        return metrics.boundingRect(draw_rect, flags, text)
+        return self.text_layout_cache.boundingRect(self.font(), text, draw_rect, flags)
 
     def getResizeHitZones(self, local_x, local_y):
         width = self.width()
@@ -80,10 +87,6 @@ class RulerGeometryMixin:
             return QtCore.Qt.CursorShape.SizeVerCursor
         return QtCore.Qt.CursorShape.OpenHandCursor
 
-    def getScreenGeometryForRect(self, x_pos, y_pos, width, height):
-        screen = self.getCenterScreen(x_pos, y_pos, width, height)
-        return screen.availableGeometry() if screen else QtCore.QRect()
-
     def convertPixelsToUnit(self, value_px, axis, unit):
         if unit == "px":
             return float(value_px)
@@ -117,78 +120,117 @@ class RulerGeometryMixin:
 
         return inches * pixels_per_inch
 
-    def snapPositionToScreenEdges(self, x_pos, y_pos, width, height):
-        screen_rect = self.getScreenGeometryForRect(x_pos, y_pos, width, height)
-        if screen_rect.isNull():
-            return x_pos, y_pos
-
-        snap_distance = SCREEN_EDGE_SNAP_DISTANCE
-        left_edge = screen_rect.x()
-        top_edge = screen_rect.y()
-        right_edge = left_edge + screen_rect.width()
-        bottom_edge = top_edge + screen_rect.height()
+    def findSnapTarget(self, axis, value, span_start, span_end):
+        target = self.snap_engine.nearest(axis, value, SCREEN_EDGE_SNAP_DISTANCE)
+        if self.content_snap_enabled:
+            content_target = self.findContentEdge(axis, value, span_start, span_end)
+            if content_target is not None and (target is None or content_target[0] < target[0]):
+                target = content_target
+        return target
 
-        x_candidates = [(abs(x_pos - left_edge), left_edge), (abs((x_pos + width) - right_edge), right_edge - width)]
-        y_candidates = [(abs(y_pos - top_edge), top_edge), (abs((y_pos + height) - bottom_edge), bottom_edge - height)]
+    def findContentEdge(self, axis, value, span_start, span_end):
+        if self.content_snapper is None:
+            from .content_snap import ContentSnapper
 
-        x_distance, snapped_x = min(x_candidates, key=lambda item: item[0])
-        y_distance, snapped_y = min(y_candidates, key=lambda item: item[0])
+            self.content_snapper = ContentSnapper(self.grabContentSnapRegion)
+        ruler_rect = QtCore.QRect(self.pos(), self.size())
+        return self.content_snapper.findEdge(axis, value, span_start, span_end, SCREEN_EDGE_SNAP_DISTANCE, ruler_rect)
 
-        if x_distance <= snap_distance:
-            x_pos = snapped_x
-        if y_distance <= snap_distance:
-            y_pos = snapped_y
+    def grabContentSnapRegion(self, rect):
+        screen = self.getCenterScreen()
+        if not screen:
+            return None
+        bounds = self.screen_metrics.get(screen).geometry
+        capture_rect = rect.intersected(bounds)
+        if capture_rect.isEmpty():
+            return None
+        return grab_screen_region(screen, capture_rect), capture_rect, bounds
+
+    def snapSpanToTargets(self, axis, start, length, span_start, span_end):
+        candidates = []
+        start_target = self.findSnapTarget(axis, start, span_start, span_end)
+        if start_target is not None:
+            candidates.append(start_target)
+        end_target = self.findSnapTarget(axis, start + length, span_start, span_end)
+        if end_target is not None:
+            candidates.append((end_target[0], end_target[1] - length))
+        if not candidates:
+            return start
+        return min(candidates, key=lambda item: item[0])[1]
 
-        return x_pos, y_pos
+    def snapPositionToScreenEdges(self, x_pos, y_pos, width, height):
+        return (
+            self.snapSpanToTargets("x", x_pos, width, y_pos, y_pos + height),
+            self.snapSpanToTargets("y", y_pos, height, x_pos, x_pos + width),
+        )
 
     def snapResizeGeometryToScreenEdges(self, x_pos, y_pos, width, height, on_left, on_right, on_top, on_bottom):
-        screen_rect = self.getScreenGeometryForRect(x_pos, y_pos, width, height)
-        if screen_rect.isNull():
-            return x_pos, y_pos, width, height
-
-        snap_distance = SCREEN_EDGE_SNAP_DISTANCE
-        left_edge = screen_rect.x()
-        top_edge = screen_rect.y()
-        right_edge = left_edge + screen_rect.width()
-        bottom_edge = top_edge + screen_rect.height()
-
         right_side = x_pos + width
         bottom_side = y_pos + height
 
-        if on_left and abs(x_pos - left_edge) <= snap_distance:
-            x_pos = left_edge
-            width = max(self.MIN_WINDOW_SIZE, right_side - x_pos)
-            right_side = x_pos + width
-        if on_right and abs(right_side - right_edge) <= snap_distance:
-            width = max(self.MIN_WINDOW_SIZE, right_edge - x_pos)
-            right_side = x_pos + width
-
-        if on_top and abs(y_pos - top_edge) <= snap_distance:
-            y_pos = top_edge
-            height = max(self.MIN_WINDOW_SIZE, bottom_side - y_pos)
-            bottom_side = y_pos + height
-        if on_bottom and abs(bottom_side - bottom_edge) <= snap_distance:
-            height = max(self.MIN_WINDOW_SIZE, bottom_edge - y_pos)
+        if on_left:
+            target = self.findSnapTarget("x", x_pos, y_pos, bottom_side)
+            if target is not None:
+                x_pos = target[1]
+                width = max(self.MIN_WINDOW_SIZE, right_side - x_pos)
+                right_side = x_pos + width
+        if on_right:
+            target = self.findSnapTarget("x", right_side, y_pos, bottom_side)
+            if target is not None:
+                width = max(self.MIN_WINDOW_SIZE, target[1] - x_pos)
+                right_side = x_pos + width
+
+        if on_top:
+            target = self.findSnapTarget("y", y_pos, x_pos, right_side)
+            if target is not None:
+                y_pos = target[1]
+                height = max(self.MIN_WINDOW_SIZE, bottom_side - y_pos)
+                bottom_side = y_pos + height
+        if on_bottom:
+            target = self.findSnapTarget("y", bottom_side, x_pos, right_side)
+            if target is not None:
+                height = max(self.MIN_WINDOW_SIZE, target[1] - y_pos)
 
         return x_pos, y_pos, width, height
 
+    def toggleContentSnap(self):
+        from .content_snap import is_content_snap_available
+
+        if not self.content_snap_enabled and not is_content_snap_available():
+            print("Content edge snapping needs NumPy (pip install numpy).", file=sys.stderr, flush=True)
+            return
+        self.content_snap_enabled = not self.content_snap_enabled
+        self.resetContentSnap()
+        self.update(self.getStatusMessagesRegion())
+
+    def resetContentSnap(self):
+        if self.content_snapper is not None:
+            self.content_snapper.reset()
+
     def getScreenEdgeAlignment(self):
         x_pos = self.pos().x()
         y_pos = self.pos().y()
-        width = self.width()
-        height = self.height()
-        screen_rect = self.getScreenGeometryForRect(x_pos, y_pos, width, height)
-        if screen_rect.isNull():
-            return {"left": False, "right": False, "top": False, "bottom": False}
-
-        left_edge = screen_rect.x()
-        top_edge = screen_rect.y()
-        right_edge = left_edge + screen_rect.width()
-        bottom_edge = top_edge + screen_rect.height()
-
         return {
-            "left": x_pos == left_edge,
-            "right": x_pos + width == right_edge,
-            "top": y_pos == top_edge,
-            "bottom": y_pos + height == bottom_edge,
+            "left": self.snap_engine.isTarget("x", x_pos),
+            "right": self.snap_engine.isTarget("x", x_pos + self.width()),
+            "top": self.snap_engine.isTarget("y", y_pos),
+            "bottom": self.snap_engine.isTarget("y", y_pos + self.height()),
         }
+
+    def addSnapGuidesAtCursor(self):
+        cursor_pos = QtGui.QCursor.pos()
+        self.snap_engine.addGuide("x", cursor_pos.x())
+        self.snap_engine.addGuide("y", cursor_pos.y())
+        self.updateSnapGuides()
+        self.update(self.getStatusMessagesRegion())
+
+    def clearSnapGuides(self):
+        self.snap_engine.clearGuides()
+        self.updateSnapGuides()
+        self.update(self.getStatusMessagesRegion())
+
+    def loadSnapGuides(self):
+        self.snap_engine.ensureGuidesLoaded()
+        self.updateSnapGuides()
+        if self.snap_engine.getGuideCount():
+            self.update(self.getStatusMessagesRegion())
@@ -0,0 +1,107 @@
+"""Opt-in paint profiling and latency tracing hooks for the ruler widget."""
+
+import json
+import sys
+
+from PyQt6 import QtCore, QtGui
+
+from ..constants import LATENCY_READOUT_INTERVAL_MS, LATENCY_TRACE_CAPACITY, PAINT_PROFILE_CAPACITY
+from .latency import LatencyTracer
+from .profiler import PaintProfiler
+
+
+class RulerInstrumentationMixin:
+    """Enable per-stage paint timing and input latency tracing, and report the results."""
+
+    def enablePaintProfiling(self, capacity=PAINT_PROFILE_CAPACITY):
+        if self.paint_profiler is not None:
+            return
+
+        self.paint_profiler = PaintProfiler(capacity)
+        self.paint_profiler.install(self)
+
+        shortcut = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+P"), self)
+        shortcut.activated.connect(self.dumpPaintProfile)
+        self.shortcuts.append(shortcut)
+
+    def dumpPaintProfile(self, stream=None):
+        if self.paint_profiler is None:
+            return
+        report = self.paint_profiler.formatReport()
+        clickthrough_stats = self.getClickthroughPollStats()
+        if clickthrough_stats["wakeups"]:
+            report += (
+                f"\nclickthrough hover polls: {clickthrough_stats['wakeups']} in "
+                f"{clickthrough_stats['seconds']:.1f}s ({clickthrough_stats['wakeups_per_second']:.2f}/s)"
+            )
+        pacing_stats = self.getFramePacingStats()
+        if pacing_stats["events_received"]:
+            report += (
+                f"\npointer events: {pacing_stats['events_received']} received, "
+                f"{pacing_stats['frames_applied']} applied as frames"
+                f" (frame pacing {'on' if pacing_stats['enabled'] else 'off'})"
+            )
+        print(report, file=stream or sys.stderr, flush=True)
+
+    def enableLatencyTracing(self, capacity=LATENCY_TRACE_CAPACITY):
+        if self.latency_tracer is None:
+            self.latency_tracer = LatencyTracer(capacity)
+
+    def stampLatencyEvent(self, event):
+        if self.latency_tracer is not None:
+            self.latency_tracer.stampEvent(event.timestamp())
+
+    def markLatencyGeometry(self, expects_paint):
+        if self.latency_tracer is not None:
+            self.latency_tracer.markGeometry(expects_paint)
+
+    def markLatencyDamage(self, expects_paint=True):
+        if self.latency_tracer is not None:
+            self.latency_tracer.markDamage(expects_paint)
+
+    def markLatencyPaint(self):
+        if self.latency_tracer is not None:
+            self.latency_tracer.markPaint()
+
+    def exportLatencyHistograms(self, path):
+        if self.latency_tracer is None:
+            return
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.latency_tracer.getSummary(), output, indent=2)
+            output.write("\n")
+
+    def getLatencyReadoutRect(self):
+        line_height = self.text_layout_cache.lineHeight(self.font())
+        return QtCore.QRect(24, 24, max(0, self.width() - 48), line_height * 2 + 2)
+
+    def toggleLatencyReadout(self):
+        self.enableLatencyTracing()
+        self.latency_readout_visible = not self.latency_readout_visible
+
+        # Moves are not repainted, so refresh the readout on a slow timer while it is shown.
+        if self.latency_readout_timer is None:
+            self.latency_readout_timer = QtCore.QTimer(self)
+            self.latency_readout_timer.setInterval(LATENCY_READOUT_INTERVAL_MS)
+            self.latency_readout_timer.timeout.connect(lambda: self.update(self.getLatencyReadoutRect()))
+        if self.latency_readout_visible:
+            self.latency_readout_timer.start()
+        else:
+            self.latency_readout_timer.stop()
+        self.update(self.getLatencyReadoutRect())
+
+    def drawLatencyReadout(self, painter, color_value):
+        if not self.latency_readout_visible or self.latency_tracer is None:
+            return
+
+        painter.save()
+        painter.setPen(QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 200), 1))
+        line_height = self.text_layout_cache.lineHeight(painter.font())
+        readout_rect = self.getLatencyReadoutRect()
+        for index, line in enumerate(self.latency_tracer.formatReadout()):
+            top = readout_rect.y() + index * line_height
+            painter.drawText(
+                QtCore.QRect(readout_rect.x(), top, readout_rect.width(), line_height),
+                QtCore.Qt.AlignmentFlag.AlignLeft,
+                line,
+            )
+        painter.restore()
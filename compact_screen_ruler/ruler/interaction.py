@@ -21,8 +21,10 @@ class RulerInteractionMixin:
     def updateHoverState(self, local_x, local_y):
         hover_zones = self.getResizeHitZones(local_x, local_y)
         if hover_zones != self.hover_zones:
+            is_interacting = self.leftclick or self.middleclick or self.drawPickPos
+            if not is_interacting:
+                self.update(self.getHoverHintRegion(self.hover_zones).united(self.getHoverHintRegion(hover_zones)))
             self.hover_zones = hover_zones
-            self.update()
 
         if self.middleclick:
             self.setCursor(QtCore.Qt.CursorShape.ClosedHandCursor)
@@ -38,7 +40,7 @@ class RulerInteractionMixin:
         )
         if self.resolution_text_hovered != is_over_resolution_text:
             self.resolution_text_hovered = is_over_resolution_text
-            self.update()
+            self.update(self.resolution_text_rect.adjusted(-2, -2, 2, 2))
 
         if is_over_resolution_text:
             self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
@@ -47,6 +49,8 @@ class RulerInteractionMixin:
         self.setCursor(self.getResizeCursorShape(hover_zones))
 
     def mousePressEvent(self, event):
+        self.resetRenderLod()
+        self.resetContentSnap()
         local_pos = event.position().toPoint()
         self.left_press_started_on_resolution_text = (
             event.button() == QtCore.Qt.MouseButton.LeftButton
@@ -56,6 +60,7 @@ class RulerInteractionMixin:
         )
         self.left_dragged_since_press = False
         self.press_global_pos = event.globalPosition().toPoint()
+        previous_hover_region = self.getHoverHintRegion(self.getDisplayedHoverZones())
 
         self.leftclick = event.button() == QtCore.Qt.MouseButton.LeftButton
         self.middleclick = event.button() == QtCore.Qt.MouseButton.MiddleButton
@@ -76,16 +81,34 @@ class RulerInteractionMixin:
         else:
             self.active_interaction_zones = {"left": False, "right": False, "top": False, "bottom": False}
 
+        self.pick_crosshair_pos = None
+        if self.drawPickPos:
+            self.mouse_x = self.press_global_pos.x()
+            self.mouse_y = self.press_global_pos.y()
+            self.startPickOverlay()
+            self.startLoupe()
+            self.publishStateChange()
+        self.updateScreenEdgeHighlight()
+        self.update(previous_hover_region.united(self.getHoverHintRegion(self.getDisplayedHoverZones())))
+
     def mouseMoveEvent(self, event):
+        self.pointer_events_received += 1
+        self.stampLatencyEvent(event)
+        self.pending_global_pos = QtCore.QPointF(event.globalPosition())
+        if self.frame_pacing_enabled:
+            self.scheduleInteractionFrame()
+        else:
+            self.applyPendingPointerState()
+
+    def applyPointerState(self, global_pos):
         ctrl_is_held = bool(QtWidgets.QApplication.keyboardModifiers() & QtCore.Qt.KeyboardModifier.ControlModifier)
         shift_is_held = bool(QtWidgets.QApplication.keyboardModifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier)
         screen_edge_snap_enabled = not shift_is_held
         window_x = self.pos().x()
         window_y = self.pos().y()
-        global_pos = event.globalPosition()
         global_x = int(global_pos.x())
         global_y = int(global_pos.y())
-        local_pos = event.position().toPoint()
+        local_pos = self.mapFromGlobal(global_pos.toPoint())
         self.updateHoverState(local_pos.x(), local_pos.y())
 
         self.mouse_x = global_x
@@ -102,7 +125,7 @@ class RulerInteractionMixin:
                 )
             else:
                 self.move(move_x, move_y)
-            self.update()
+            self.markLatencyGeometry(expects_paint=False)
         elif self.leftclick:
             drag_distance = (global_pos.toPoint() - self.press_global_pos).manhattanLength()
             if drag_distance >= QtWidgets.QApplication.startDragDistance():
@@ -252,20 +275,31 @@ class RulerInteractionMixin:
                     )
                 else:
                     self.move(move_x, move_y)
-            self.update()
+            if resize_x is not None or move_x is not None:
+                self.markLatencyGeometry(expects_paint=resize_x is not None)
 
-        else:
-            self.update()
+        elif self.drawPickPos:
+            repainting = self.updatePickOverlay()
+            self.updateLoupe()
+            self.publishStateChange()
+            self.markLatencyDamage(expects_paint=repainting)
+
+        # Hover moves and drags below the snap threshold change nothing worth timing.
+        self.markLatencyDamage(expects_paint=False)
 
     def leaveEvent(self, event):
         super().leaveEvent(event)
+        damaged_region = self.getHoverHintRegion(self.getDisplayedHoverZones())
+        if self.resolution_text_hovered:
+            damaged_region = damaged_region.united(self.resolution_text_rect.adjusted(-2, -2, 2, 2))
         self.hover_zones = {"left": False, "right": False, "top": False, "bottom": False}
         self.active_interaction_zones = {"left": False, "right": False, "top": False, "bottom": False}
         self.resolution_text_hovered = False
         self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
-        self.update()
+        self.update(damaged_region)
 
     def mouseReleaseEvent(self, event):
+        self.flushPendingPointerState()
         release_pos = event.position().toPoint()
         should_open_size_dialog = (
             event.button() == QtCore.Qt.MouseButton.LeftButton
@@ -281,9 +315,16 @@ class RulerInteractionMixin:
         self.window_size_x = self.width()
         self.window_size_y = self.height()
         self.drawPickPos = False
+        self.stopPickOverlay()
+        self.stopLoupe()
+        self.publishStateChange()
+        self.resetRenderLod()
+        self.resetContentSnap()
+        self.refreshScanlineCaptureForScreen()
         self.active_interaction_zones = {"left": False, "right": False, "top": False, "bottom": False}
         self.left_press_started_on_resolution_text = False
         self.left_dragged_since_press = False
+        self.highlighted_screen_edges = {"left": False, "right": False, "top": False, "bottom": False}
         local_pos = self.mapFromGlobal(QtGui.QCursor.pos())
         self.updateHoverState(local_pos.x(), local_pos.y())
         self.update()
@@ -0,0 +1,113 @@
+"""Input-to-geometry and input-to-paint latency tracing."""
+
+import time
+from collections import deque
+
+from .profiler import percentile
+
+# Upper bucket bounds (ms) for exported latency histograms; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (1, 2, 4, 8, 12, 16, 24, 33, 50, 67, 100, 150, 250, 500)
+
+# Event clocks that jump by more than this (ms) are treated as restarted or wrapped.
+CLOCK_RESET_MS = 60000.0
+
+LATENCY_STAGES = ("event_to_geometry", "event_to_paint")
+
+
+class LatencyHistogram:
+    """Bucketed latency counts plus a ring buffer of recent samples for percentiles."""
+
+    def __init__(self, capacity):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=capacity)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms):
+        bucket_index = len(LATENCY_BUCKETS_MS)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                bucket_index = index
+                break
+        self.bucket_counts[bucket_index] += 1
+        self.samples.append(latency_ms)
+        self.count += 1
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def getSummary(self):
+        sorted_samples = sorted(self.samples)
+        buckets = [{"le_ms": bound, "count": count} for bound, count in zip(LATENCY_BUCKETS_MS, self.bucket_counts)]
+        buckets.append({"le_ms": None, "count": self.bucket_counts[-1]})
+        return {
+            "count": self.count,
+            "p50": percentile(sorted_samples, 0.50),
+            "p95": percentile(sorted_samples, 0.95),
+            "p99": percentile(sorted_samples, 0.99),
+            "max": self.max_ms,
+            "buckets": buckets,
+        }
+
+
+class LatencyTracer:
+    """Follow mouse events through to the geometry change and paint they cause.
+
+    Qt event timestamps come from a platform clock with an unknown origin, so
+    they are mapped onto `time.perf_counter` with the smallest receipt delay
+    seen so far. Latencies are therefore measured from the earliest plausible
+    delivery time and slightly understate the true delay from the device.
+    """
+
+    def __init__(self, capacity):
+        self.histograms = {stage: LatencyHistogram(capacity) for stage in LATENCY_STAGES}
+        self.clock_offset_ms = None
+        self.pending_event_ms = None
+        self.awaiting_paint_ms = None
+
+    def nowMs(self):
+        return time.perf_counter() * 1000.0
+
+    def stampEvent(self, event_timestamp_ms):
+        received_ms = self.nowMs()
+        offset_ms = received_ms - float(event_timestamp_ms)
+        if (
+            self.clock_offset_ms is None
+            or offset_ms < self.clock_offset_ms
+            or offset_ms - self.clock_offset_ms > CLOCK_RESET_MS
+        ):
+            self.clock_offset_ms = offset_ms
+
+        # Coalesced events are measured from the oldest one still waiting to be applied.
+        if self.pending_event_ms is None:
+            self.pending_event_ms = float(event_timestamp_ms) + self.clock_offset_ms
+
+    def markGeometry(self, expects_paint):
+        if self.pending_event_ms is None:
+            return
+        self.histograms["event_to_geometry"].record(self.nowMs() - self.pending_event_ms)
+        self.markDamage(expects_paint)
+
+    def markDamage(self, expects_paint=True):
+        # Moves are composited without a repaint, so only resizes and pick updates await one.
+        if expects_paint and self.pending_event_ms is not None and self.awaiting_paint_ms is None:
+            self.awaiting_paint_ms = self.pending_event_ms
+        self.pending_event_ms = None
+
+    def markPaint(self):
+        if self.awaiting_paint_ms is None:
+            return
+        self.histograms["event_to_paint"].record(self.nowMs() - self.awaiting_paint_ms)
+        self.awaiting_paint_ms = None
+
+    def getSummary(self):
+        return {stage: histogram.getSummary() for stage, histogram in self.histograms.items()}
+
+    def formatReadout(self):
+        lines = []
+        for stage, label in (("event_to_geometry", "input>geometry"), ("event_to_paint", "input>paint")):
+            histogram = self.histograms[stage]
+            sorted_samples = sorted(histogram.samples)
+            lines.append(
+                f"{label}: p50 {percentile(sorted_samples, 0.50):.1f}  "
+                f"p95 {percentile(sorted_samples, 0.95):.1f} ms  (n={histogram.count})"
+            )
+        return lines
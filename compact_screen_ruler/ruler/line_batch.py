@@ -0,0 +1,40 @@
+"""Pen-grouped line batching for tick rendering."""
+
+from PyQt6 import QtCore
+
+
+class LineBatch:
+    """Collect lines per pen and submit each integer group with a single `drawLines` call.
+
+    Integer (`QLine`) and float (`QLineF`) lines are kept in separate groups
+    because `QPainter.drawLines` does not accept mixed lists. Float groups
+    are still drawn line by line: with antialiasing, one `drawLines` call for
+    the cm/in subticks measured slower than the separate calls. With
+    `batched=False` every line is submitted on its own, which keeps the
+    per-line path available for comparison.
+    """
+
+    def __init__(self, batched=True):
+        self.batched = batched
+        self.groups = {}
+        self.draw_calls = 0
+
+    def add(self, pen, line):
+        key = (pen.color().rgba(), pen.widthF(), type(line))
+        group = self.groups.get(key)
+        if group is None:
+            group = (pen, [])
+            self.groups[key] = group
+        group[1].append(line)
+
+    def flush(self, painter):
+        for pen, lines in self.groups.values():
+            painter.setPen(pen)
+            if self.batched and isinstance(lines[0], QtCore.QLine):
+                painter.drawLines(lines)
+                self.draw_calls += 1
+            else:
+                for line in lines:
+                    painter.drawLine(line)
+                self.draw_calls += len(lines)
+        self.groups.clear()
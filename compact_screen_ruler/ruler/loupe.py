@@ -0,0 +1,195 @@
+"""Magnifier loupe for right-click pick mode."""
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from ..constants import LOUPE_CAPTURE_RADIUS, LOUPE_VIEW_SIZE, LOUPE_ZOOM_LEVELS
+from ..recording import grab_screen_region
+
+LOUPE_FOOTER_HEIGHT = 18
+LOUPE_CURSOR_OFFSET = 24
+
+
+class LoupeWindow(QtWidgets.QWidget):
+    """Input-transparent window showing a nearest-neighbor zoom of a cached capture."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.setWindowFlags(
+            QtCore.Qt.WindowType.Tool
+            | QtCore.Qt.WindowType.FramelessWindowHint
+            | QtCore.Qt.WindowType.WindowStaysOnTopHint
+            | QtCore.Qt.WindowType.WindowTransparentForInput
+        )
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.image = QtGui.QImage()
+        self.capture_rect = QtCore.QRect()
+        self.cursor_pos = QtCore.QPoint()
+        self.caption = ""
+        self.zoom = LOUPE_ZOOM_LEVELS[0]
+        self.cells = 1
+
+    def setZoom(self, zoom):
+        self.zoom = zoom
+        # An odd cell count keeps the picked pixel in the middle.
+        self.cells = max(1, LOUPE_VIEW_SIZE // zoom) | 1
+        view_size = self.cells * zoom
+        self.setFixedSize(view_size, view_size + LOUPE_FOOTER_HEIGHT)
+
+    def setCapture(self, image, capture_rect):
+        self.image = image
+        self.capture_rect = QtCore.QRect(capture_rect)
+
+    def getSourceRect(self, cursor_pos):
+        half = self.cells // 2
+        return QtCore.QRect(cursor_pos.x() - half, cursor_pos.y() - half, self.cells, self.cells)
+
+    def coversCursor(self, cursor_pos, screen_rect):
+        # The capture is clipped to the screen, so cells past the screen edge never need to be in it.
+        if self.image.isNull() or not screen_rect.contains(cursor_pos):
+            return False
+        return self.capture_rect.contains(self.getSourceRect(cursor_pos).intersected(screen_rect))
+
+    def showAt(self, cursor_pos, caption, screen_rect):
+        self.cursor_pos = QtCore.QPoint(cursor_pos)
+        self.caption = caption
+
+        # Sit below-right of the cursor, flipping to the other side near screen edges.
+        x_pos = cursor_pos.x() + LOUPE_CURSOR_OFFSET
+        y_pos = cursor_pos.y() + LOUPE_CURSOR_OFFSET
+        if x_pos + self.width() > screen_rect.right():
+            x_pos = cursor_pos.x() - LOUPE_CURSOR_OFFSET - self.width()
+        if y_pos + self.height() > screen_rect.bottom():
+            y_pos = cursor_pos.y() - LOUPE_CURSOR_OFFSET - self.height()
+        self.move(x_pos, y_pos)
+        if not self.isVisible():
+            self.show()
+        self.update()
+
+    def getPixelColor(self):
+        local_pos = self.cursor_pos - self.capture_rect.topLeft()
+        if self.image.isNull() or not self.image.rect().contains(local_pos):
+            return None
+        return self.image.pixelColor(local_pos)
+
+    def paintEvent(self, _event):
+        view_size = self.cells * self.zoom
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.fillRect(self.rect(), QtGui.QColor(40, 40, 40))
+
+        # Cells outside the capture, past a screen edge, keep the background.
+        source_rect = self.getSourceRect(self.cursor_pos)
+        visible_rect = source_rect.intersected(self.capture_rect)
+        if not visible_rect.isEmpty():
+            target_rect = QtCore.QRect(
+                (visible_rect.x() - source_rect.x()) * self.zoom,
+                (visible_rect.y() - source_rect.y()) * self.zoom,
+                visible_rect.width() * self.zoom,
+                visible_rect.height() * self.zoom,
+            )
+            painter.drawImage(target_rect, self.image, visible_rect.translated(-self.capture_rect.topLeft()))
+
+        grid_lines = []
+        for cell in range(1, self.cells):
+            offset = cell * self.zoom
+            grid_lines.append(QtCore.QLine(offset, 0, offset, view_size))
+            grid_lines.append(QtCore.QLine(0, offset, view_size, offset))
+        painter.setPen(QtGui.QPen(QtGui.QColor(128, 128, 128, 90), 1))
+        painter.drawLines(grid_lines)
+
+        center = (self.cells // 2) * self.zoom
+        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255), 1))
+        painter.drawRect(center - 1, center - 1, self.zoom + 1, self.zoom + 1)
+        painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0), 1))
+        painter.drawRect(center, center, self.zoom - 1, self.zoom - 1)
+
+        color = self.getPixelColor()
+        caption = self.caption if color is None else f"{self.caption}  {color.name().upper()}"
+        painter.setPen(QtGui.QColor(230, 230, 230))
+        painter.drawText(
+            QtCore.QRect(4, view_size, view_size - 8, LOUPE_FOOTER_HEIGHT),
+            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            caption,
+        )
+        painter.drawRect(0, 0, self.width() - 1, self.height() - 1)
+        painter.end()
+
+
+class RulerLoupeMixin:
+    """Show a loupe next to the cursor in pick mode, sampled from one capture taken when the pick starts."""
+
+    def getLoupeWindow(self):
+        if self.loupe_window is None:
+            self.loupe_window = LoupeWindow()
+            self.loupe_window.setZoom(self.loupe_zoom)
+        return self.loupe_window
+
+    def refreshLoupeCapture(self):
+        if not self.drawPickPos or not self.loupe_zoom:
+            return
+        cursor_pos = QtCore.QPoint(self.mouse_x, self.mouse_y)
+        screen = QtGui.QGuiApplication.screenAt(cursor_pos) or self.getCenterScreen()
+        if not screen:
+            return
+
+        radius = LOUPE_CAPTURE_RADIUS
+        screen_rect = self.screen_metrics.get(screen).geometry
+        capture_rect = QtCore.QRect(cursor_pos.x() - radius, cursor_pos.y() - radius, 2 * radius, 2 * radius)
+        capture_rect = capture_rect.intersected(screen_rect)
+
+        # Hiding would drop the mouse grab of the ongoing pick, so the ruler is made fully transparent
+        # for the grab instead. The loupe itself is hidden because it sits on top of the area.
+        loupe = self.getLoupeWindow()
+        loupe.hide()
+        self.setWindowOpacity(0.0)
+        image = grab_screen_region(screen, capture_rect)
+        self.setWindowOpacity(1.0)
+        if image.size() != capture_rect.size():
+            # Grabs come back in device pixels on scaled displays; the loupe shows logical pixels.
+            image = image.scaled(
+                capture_rect.size(),
+                QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                QtCore.Qt.TransformationMode.FastTransformation,
+            )
+        loupe.setCapture(image, capture_rect)
+        self.loupe_screen_rect = screen_rect
+
+    def updateLoupe(self):
+        if not self.drawPickPos or not self.loupe_zoom:
+            return
+        loupe = self.getLoupeWindow()
+        cursor_pos = QtCore.QPoint(self.mouse_x, self.mouse_y)
+        if not loupe.coversCursor(cursor_pos, self.loupe_screen_rect):
+            self.refreshLoupeCapture()
+
+        caption = (
+            f"{self.formatMeasurementValue(self.mouse_x - self.pos().x(), 'x')}, "
+            f"{self.formatMeasurementValue(self.mouse_y - self.pos().y(), 'y')} {self.measurement_unit}"
+        )
+        loupe.showAt(cursor_pos, caption, self.loupe_screen_rect)
+
+    def startLoupe(self):
+        if self.loupe_zoom:
+            self.refreshLoupeCapture()
+            self.updateLoupe()
+
+    def recaptureLoupe(self):
+        # The capture hides the loupe, so it is shown again at the cursor afterwards.
+        self.startLoupe()
+
+    def stopLoupe(self):
+        if self.loupe_window is not None:
+            self.loupe_window.hide()
+            self.loupe_window.setCapture(QtGui.QImage(), QtCore.QRect())
+
+    def cycleLoupeZoom(self):
+        levels = LOUPE_ZOOM_LEVELS + (0,)
+        index = levels.index(self.loupe_zoom) if self.loupe_zoom in levels else -1
+        self.loupe_zoom = levels[(index + 1) % len(levels)]
+        if not self.loupe_zoom:
+            self.stopLoupe()
+            return
+        loupe = self.getLoupeWindow()
+        loupe.setZoom(self.loupe_zoom)
+        if self.drawPickPos:
+            self.updateLoupe()
@@ -0,0 +1,45 @@
+"""Frame pacing for mouse-driven move and resize."""
+
+import time
+
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class RulerFramePacingMixin:
+    """Coalesce pointer events so geometry and repaint happen at most once per display frame."""
+
+    def getDisplayFrameInterval(self):
+        screen = self.getCenterScreen()
+        refresh_rate = float(screen.refreshRate()) if screen else 0.0
+        if refresh_rate <= 0:
+            refresh_rate = DEFAULT_REFRESH_RATE
+        return 1.0 / refresh_rate
+
+    def scheduleInteractionFrame(self):
+        if self.interaction_frame_timer.isActive():
+            return
+
+        elapsed = time.perf_counter() - self.last_interaction_frame_time
+        delay = max(0.0, self.getDisplayFrameInterval() - elapsed)
+        self.interaction_frame_timer.start(int(delay * 1000))
+
+    def applyPendingPointerState(self):
+        global_pos = self.pending_global_pos
+        if global_pos is None:
+            return
+
+        self.pending_global_pos = None
+        self.last_interaction_frame_time = time.perf_counter()
+        self.pointer_frames_applied += 1
+        self.applyPointerState(global_pos)
+
+    def flushPendingPointerState(self):
+        self.interaction_frame_timer.stop()
+        self.applyPendingPointerState()
+
+    def getFramePacingStats(self):
+        return {
+            "enabled": self.frame_pacing_enabled,
+            "events_received": self.pointer_events_received,
+            "frames_applied": self.pointer_frames_applied,
+        }
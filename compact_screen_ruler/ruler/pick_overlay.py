@@ -0,0 +1,102 @@
+"""Pick-mode crosshair and live readout drawn in a separate overlay window."""
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class PickOverlayWindow(QtWidgets.QWidget):
+    """Translucent, input-transparent window laid over the ruler while picking.
+
+    Repaints here are composited over the ruler by the window system, so
+    moving the crosshair never repaints the ruler's ticks underneath.
+    """
+
+    def __init__(self, ruler):
+        super().__init__(None)
+        self.ruler = ruler
+        self.setWindowFlags(
+            QtCore.Qt.WindowType.Tool
+            | QtCore.Qt.WindowType.FramelessWindowHint
+            | QtCore.Qt.WindowType.WindowStaysOnTopHint
+            | QtCore.Qt.WindowType.WindowTransparentForInput
+        )
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_ShowWithoutActivating)
+
+    def paintEvent(self, _event):
+        painter = QtGui.QPainter(self)
+        painter.setFont(self.ruler.font())
+        self.ruler.drawPickOverlay(painter)
+        painter.end()
+        self.ruler.markLatencyPaint()
+
+
+class RulerPickOverlayMixin:
+    """Track the pick crosshair in an overlay window and damage only the lines and label that moved."""
+
+    def getPickOverlay(self):
+        if self.pick_overlay is None:
+            self.pick_overlay = PickOverlayWindow(self)
+        return self.pick_overlay
+
+    def getPickPosition(self):
+        return self.mouse_x - self.pos().x(), self.mouse_y - self.pos().y()
+
+    def getPickReadoutRect(self, mouse_xpos, mouse_ypos):
+        text, draw_rect, alignment = self.getResolutionReadoutLayout(mouse_xpos, mouse_ypos)
+        return self.getResolutionTextRect(draw_rect, alignment, text).adjusted(-2, -2, 2, 2)
+
+    def startPickOverlay(self):
+        # Transparent mode shows no readout, so there is nothing to track.
+        if self.is_transparent:
+            return
+        overlay = self.getPickOverlay()
+        overlay.setGeometry(self.geometry())
+        mouse_xpos, mouse_ypos = self.getPickPosition()
+        self.pick_crosshair_pos = (mouse_xpos, mouse_ypos)
+        self.pick_readout_rect = self.getPickReadoutRect(mouse_xpos, mouse_ypos)
+        overlay.show()
+        overlay.update()
+        # The ruler drops its own size readout while the overlay shows the pick readout.
+        self.update(self.getReadoutRegion(self.width(), self.height()))
+
+    def updatePickOverlay(self):
+        if self.pick_overlay is None or not self.pick_overlay.isVisible():
+            return False
+        mouse_xpos, mouse_ypos = self.getPickPosition()
+        if (mouse_xpos, mouse_ypos) == self.pick_crosshair_pos:
+            return False
+
+        readout_rect = self.getPickReadoutRect(mouse_xpos, mouse_ypos)
+        region = self.getCrosshairRegion(mouse_xpos, mouse_ypos)
+        region = region.united(readout_rect).united(self.pick_readout_rect)
+        if self.pick_crosshair_pos is not None:
+            region = region.united(self.getCrosshairRegion(*self.pick_crosshair_pos))
+        self.pick_crosshair_pos = (mouse_xpos, mouse_ypos)
+        self.pick_readout_rect = readout_rect
+        self.pick_overlay.update(region)
+        return True
+
+    def stopPickOverlay(self):
+        if self.pick_overlay is not None:
+            self.pick_overlay.hide()
+        self.pick_crosshair_pos = None
+        self.pick_readout_rect = QtCore.QRect()
+
+    def drawPickOverlay(self, painter):
+        if self.pick_crosshair_pos is None:
+            return
+        mouse_xpos, mouse_ypos = self.pick_crosshair_pos
+        stroke_gray = 0 if not self.invert_colors else 255
+        painter.setPen(
+            QtGui.QPen(QtGui.QColor(stroke_gray, stroke_gray, stroke_gray, 200), 1, QtCore.Qt.PenStyle.SolidLine)
+        )
+        if self.height() > 80 and self.width() >= 88:
+            painter.drawLine(mouse_xpos, 0, mouse_xpos, self.height())
+            painter.drawLine(0, mouse_ypos, self.width(), mouse_ypos)
+        elif self.width() >= 88:
+            painter.drawLine(mouse_xpos, 0, mouse_xpos, self.height())
+        else:
+            painter.drawLine(0, mouse_ypos, self.width(), mouse_ypos)
+
+        text, draw_rect, alignment = self.getResolutionReadoutLayout(mouse_xpos, mouse_ypos)
+        painter.drawText(draw_rect, alignment, text)
@@ -0,0 +1,95 @@
+"""Per-stage paint timing collected into fixed-size ring buffers."""
+
+import functools
+import math
+import time
+from collections import Counter, deque
+
+PAINT_STAGES = (
+    "drawBackground",
+    "drawHoverHints",
+    "drawAlignedScreenEdges",
+    "drawTickLayer",
+    "drawTiledGrid",
+    "drawSubticks",
+    "drawMajorTicksAndLabels",
+    "getMeasurementSize",
+    "drawResolutionReadout",
+    "drawScanlineSpans",
+    "drawPickOverlay",
+)
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class PaintProfiler:
+    """Time ruler paint stages by wrapping the widget's stage methods.
+
+    Nothing is wrapped until `install` is called, so a widget without a
+    profiler pays no timing overhead.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.samples = {}
+        self.lod_frames = Counter()
+
+    def getStageSamples(self, stage):
+        samples = self.samples.get(stage)
+        if samples is None:
+            samples = deque(maxlen=self.capacity)
+            self.samples[stage] = samples
+        return samples
+
+    def record(self, stage, elapsed_ms):
+        self.getStageSamples(stage).append(elapsed_ms)
+
+    def recordLod(self, lod_name):
+        self.lod_frames[lod_name] += 1
+
+    def wrap(self, stage, method):
+        samples = self.getStageSamples(stage)
+        perf_counter = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append((perf_counter() - start) * 1000.0)
+
+        return timed
+
+    def install(self, widget, stages=PAINT_STAGES):
+        for stage in stages:
+            setattr(widget, stage, self.wrap(stage, getattr(widget, stage)))
+
+    def getSummary(self):
+        summary = {}
+        for stage, samples in self.samples.items():
+            sorted_samples = sorted(samples)
+            summary[stage] = {
+                "count": len(sorted_samples),
+                "p50": percentile(sorted_samples, 0.50),
+                "p95": percentile(sorted_samples, 0.95),
+                "p99": percentile(sorted_samples, 0.99),
+            }
+        return summary
+
+    def formatReport(self):
+        lines = [f"{'stage':<26} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+        for stage, stats in self.getSummary().items():
+            lines.append(
+                f"{stage:<26} {stats['count']:>7} {stats['p50']:>9.3f} {stats['p95']:>9.3f} {stats['p99']:>9.3f}"
+            )
+        if self.lod_frames:
+            lod_counts = ", ".join(f"{name}={count}" for name, count in sorted(self.lod_frames.items()))
+            lines.append(f"frames by LOD: {lod_counts}")
+        return "\n".join(lines)
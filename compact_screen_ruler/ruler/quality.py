@@ -0,0 +1,48 @@
+"""Adaptive level-of-detail rendering during drag and resize."""
+
+LOD_FULL = 0
+LOD_REDUCED = 1
+LOD_MINIMAL = 2
+
+LOD_NAMES = {LOD_FULL: "full", LOD_REDUCED: "reduced", LOD_MINIMAL: "minimal"}
+
+
+class RulerQualityMixin:
+    """Drop to cheaper rendering while an interaction is producing slow frames.
+
+    `LOD_REDUCED` draws major ticks only, without antialiasing or status
+    messages. `LOD_MINIMAL` also caps the number of drawn tick labels.
+    """
+
+    def recordFrameTime(self, frame_ms):
+        self.recent_frame_times.append(frame_ms)
+        if self.paint_profiler is not None:
+            self.paint_profiler.record("paintEvent", frame_ms)
+            self.paint_profiler.recordLod(LOD_NAMES[self.render_lod])
+
+        if self.leftclick or self.middleclick:
+            self.updateRenderLod()
+
+    def updateRenderLod(self):
+        if not self.adaptive_quality_enabled or not self.recent_frame_times:
+            return
+
+        average_frame_ms = sum(self.recent_frame_times) / len(self.recent_frame_times)
+        if average_frame_ms >= self.lod_minimal_frame_ms:
+            target_lod = LOD_MINIMAL
+        elif average_frame_ms >= self.lod_reduced_frame_ms:
+            target_lod = LOD_REDUCED
+        else:
+            target_lod = LOD_FULL
+
+        # Only escalate during an interaction; cheaper frames at a lower LOD must not bounce the
+        # ruler back to full quality mid-drag.
+        if target_lod > self.render_lod:
+            self.render_lod = target_lod
+
+    def resetRenderLod(self):
+        self.recent_frame_times.clear()
+        if self.render_lod == LOD_FULL:
+            return False
+        self.render_lod = LOD_FULL
+        return True
@@ -0,0 +1,209 @@
+"""NumPy helpers for uniform regions and color spans in captured images."""
+
+from PyQt6 import QtCore, QtGui
+
+from ..constants import (
+    CLICK_FIT_COLOR_TOLERANCE,
+    CLICK_FIT_INITIAL_WINDOW,
+    CLICK_FIT_MAX_RUNS,
+    CLICK_FIT_SEED_RADIUS,
+)
+from .content_snap import np
+
+
+def image_to_rgb_array(image, width, height):
+    """Return a (height, width, 4) uint8 array of `image` in logical pixels, in B, G, R, X byte order."""
+    rgb = image.convertToFormat(QtGui.QImage.Format.Format_RGB32)
+    if rgb.width() != width or rgb.height() != height:
+        rgb = rgb.scaled(
+            width,
+            height,
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.FastTransformation,
+        )
+    data = rgb.constBits().asstring(rgb.sizeInBytes())
+    return np.frombuffer(data, dtype=np.uint8).reshape(rgb.height(), rgb.bytesPerLine() // 4, 4)[:, :width]
+
+
+def get_color_mask(pixels, color, tolerance):
+    """Return a boolean mask of pixels within `tolerance` of `color` on every channel."""
+    mask = None
+    for channel in range(3):
+        low = max(0, int(color[channel]) - tolerance)
+        span = min(255, int(color[channel]) + tolerance) - low
+        # Unsigned wraparound turns the two-sided range check into one comparison.
+        channel_mask = (pixels[:, :, channel] - np.uint8(low)) <= span
+        mask = channel_mask if mask is None else np.logical_and(mask, channel_mask, out=mask)
+    return mask
+
+
+def find_line_spans(line, tolerance):
+    """Split a (n, 4) pixel line into alternating background and element spans.
+
+    The background is the most common color on the line. Pixels within
+    `tolerance` of it are gaps, and everything else is run-length encoded
+    into elements. Returns `(bounds, is_element)` where span i covers
+    `bounds[i]:bounds[i + 1]`.
+    """
+    packed = line[:, 0].astype(np.uint32) | (line[:, 1].astype(np.uint32) << 8)
+    packed |= line[:, 2].astype(np.uint32) << 16
+    colors, counts = np.unique(packed, return_counts=True)
+    dominant = int(colors[int(np.argmax(counts))])
+    background = (dominant & 0xFF, (dominant >> 8) & 0xFF, (dominant >> 16) & 0xFF)
+
+    is_element = ~get_color_mask(line[np.newaxis], background, tolerance)[0]
+    changes = np.flatnonzero(is_element[1:] != is_element[:-1]) + 1
+    bounds = np.concatenate(([0], changes, [len(line)]))
+    return bounds, is_element[bounds[:-1]]
+
+
+def find_seed(pixels, x_pos, y_pos, tolerance):
+    """Pick the seed pixel near `(x_pos, y_pos)`, preferring the dominant color around it.
+
+    Starting from the most common color in a small window keeps a cursor
+    that rests on text or an icon glyph from fitting just that glyph.
+    """
+    height, width = pixels.shape[:2]
+    top, bottom = max(0, y_pos - CLICK_FIT_SEED_RADIUS), min(height, y_pos + CLICK_FIT_SEED_RADIUS + 1)
+    left, right = max(0, x_pos - CLICK_FIT_SEED_RADIUS), min(width, x_pos + CLICK_FIT_SEED_RADIUS + 1)
+    window = pixels[top:bottom, left:right]
+    packed = window[:, :, 0].astype(np.uint32) | (window[:, :, 1].astype(np.uint32) << 8)
+    packed |= window[:, :, 2].astype(np.uint32) << 16
+    colors, counts = np.unique(packed, return_counts=True)
+    dominant = int(colors[int(np.argmax(counts))])
+    color = (dominant & 0xFF, (dominant >> 8) & 0xFF, (dominant >> 16) & 0xFF)
+
+    rows, columns = np.nonzero(get_color_mask(window, color, tolerance))
+    nearest = int(np.argmin((rows + top - y_pos) ** 2 + (columns + left - x_pos) ** 2))
+    return int(columns[nearest]) + left, int(rows[nearest]) + top, color
+
+
+def label_run_components(run_count, first, second):
+    """Return the component label of each of `run_count` runs joined by the `first[i]`-`second[i]` pairs.
+
+    Every label ends up as the smallest run index of its component. Each
+    pass hooks the larger of two joined labels onto the smaller and then
+    shortcuts the label chains, so a handful of whole-array passes replaces
+    a Python step per run.
+    """
+    labels = np.arange(run_count, dtype=np.int32)
+    while True:
+        first_labels = labels[first]
+        second_labels = labels[second]
+        joined = first_labels != second_labels
+        if not joined.any():
+            return labels
+        first, second = first[joined], second[joined]
+        first_labels, second_labels = first_labels[joined], second_labels[joined]
+        np.minimum.at(labels, np.maximum(first_labels, second_labels), np.minimum(first_labels, second_labels))
+        while True:
+            shortcut = labels[labels]
+            if np.array_equal(shortcut, labels):
+                break
+            labels = shortcut
+
+
+def fill_region_runs(mask, seed_x, seed_y, max_runs=None):
+    """Return `(left, top, right, bottom, area)` of the 4-connected True region of `mask` containing the seed.
+
+    Returns None without labelling anything when `mask` has more than
+    `max_runs` row runs.
+    """
+    height, width = mask.shape
+    if mask.all():
+        return 0, 0, width, height, width * height
+
+    # A False column in front of every row and a False row at the end make each run start and end on a
+    # change of the flattened mask.
+    stride = width + 1
+    padded = np.zeros((height + 1, stride), dtype=bool)
+    padded[:height, 1:] = mask
+    flat = padded.ravel()
+    start_flags = flat[1:] & ~flat[:-1]
+    # run_counts[p - 1] is the number of runs starting at or before flat position p.
+    run_counts = np.cumsum(start_flags, dtype=np.int32)
+    run_count = int(run_counts[-1])
+    if max_runs is not None and run_count > max_runs:
+        return None
+    run_starts = np.flatnonzero(start_flags) + 1
+    run_ends = np.flatnonzero(flat[:-1] & ~flat[1:]) + 1
+
+    # Each run of pixels set in both a row and the row below joins one run above to one run below.
+    overlap = (padded[:-1] & padded[1:]).ravel()
+    overlap_starts = np.flatnonzero(overlap[1:] & ~overlap[:-1]) + 1
+    upper_runs = run_counts[overlap_starts - 1] - 1
+    lower_runs = run_counts[overlap_starts + stride - 1] - 1
+    labels = label_run_components(run_count, upper_runs, lower_runs)
+
+    region = labels == labels[run_counts[seed_y * stride + seed_x] - 1]
+    region_starts = run_starts[region]
+    region_ends = run_ends[region]
+    region_rows = region_starts // stride
+    area = int((region_ends - region_starts).sum())
+    return (
+        int((region_starts - region_rows * stride).min()) - 1,
+        int(region_rows.min()),
+        int((region_ends - region_rows * stride).max()) - 1,
+        int(region_rows.max()) + 1,
+        area,
+    )
+
+
+def find_region_bounds(pixels, x_pos, y_pos, tolerance=CLICK_FIT_COLOR_TOLERANCE):
+    """Return `(left, top, right, bottom, area)` of the region containing the seed; right/bottom are exclusive.
+
+    The region is the 4-connected set of pixels within `tolerance` of the seed
+    color. The color mask, its row runs and their connected components are all
+    computed in NumPy. Work starts in a window around the seed that only grows
+    on the sides the region reaches, so small elements never pay for the whole
+    neighborhood. A grown window with more than CLICK_FIT_MAX_RUNS row runs is
+    not labelled; the region found in the previous window is returned instead.
+    """
+    seed_x, seed_y, color = find_seed(pixels, x_pos, y_pos, tolerance)
+    height, width = pixels.shape[:2]
+    half_size = CLICK_FIT_INITIAL_WINDOW // 2
+    window_left, window_top = max(0, seed_x - half_size), max(0, seed_y - half_size)
+    window_right, window_bottom = min(width, seed_x + half_size), min(height, seed_y + half_size)
+
+    bounds = None
+    while True:
+        mask = get_color_mask(pixels[window_top:window_bottom, window_left:window_right], color, tolerance)
+        max_runs = CLICK_FIT_MAX_RUNS if bounds is not None else None
+        fill = fill_region_runs(mask, seed_x - window_left, seed_y - window_top, max_runs)
+        if fill is None:
+            return bounds
+        left, top, right, bottom, area = fill
+        bounds = (left + window_left, top + window_top, right + window_left, bottom + window_top, area)
+        grow_left = left == 0 and window_left > 0
+        grow_top = top == 0 and window_top > 0
+        grow_right = right == window_right - window_left and window_right < width
+        grow_bottom = bottom == window_bottom - window_top and window_bottom < height
+        if not (grow_left or grow_top or grow_right or grow_bottom):
+            return bounds
+
+        window_width = window_right - window_left
+        window_height = window_bottom - window_top
+        if grow_left:
+            window_left = max(0, window_left - window_width)
+        if grow_right:
+            window_right = min(width, window_right + window_width)
+        if grow_top:
+            window_top = max(0, window_top - window_height)
+        if grow_bottom:
+            window_bottom = min(height, window_bottom + window_height)
+        # Past half the neighborhood another partial pass costs more than finishing on all of it.
+        if (window_right - window_left) * (window_bottom - window_top) * 2 > width * height:
+            window_left, window_top, window_right, window_bottom = 0, 0, width, height
+
+
+def fit_rect_to_aspect(rect, ratio):
+    """Return the largest rect with `ratio` (width / height) centered inside `rect`."""
+    width = rect.width()
+    height = rect.height()
+    if width / max(1, height) > ratio:
+        width = max(1, int(round(height * ratio)))
+    else:
+        height = max(1, int(round(width / ratio)))
+    fitted = QtCore.QRect(0, 0, width, height)
+    fitted.moveCenter(rect.center())
+    return fitted
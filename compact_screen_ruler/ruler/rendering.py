@@ -1,8 +1,12 @@
 """Composed painting pipeline for the ruler widget."""
 
+import time
+
 from PyQt6 import QtCore, QtGui
 
+from .quality import LOD_FULL
 from .rendering_format import RulerRenderingFormatMixin
+from .rendering_grid import RulerRenderingGridMixin
 from .rendering_overlays import RulerRenderingOverlaysMixin
 from .rendering_text import RulerRenderingTextMixin
 from .rendering_ticks import RulerRenderingTicksMixin
@@ -10,27 +14,17 @@ from .rendering_ticks import RulerRenderingTicksMixin
 
 class RulerRenderingMixin(
     RulerRenderingTicksMixin,
+    RulerRenderingGridMixin,
     RulerRenderingTextMixin,
     RulerRenderingOverlaysMixin,
     RulerRenderingFormatMixin,
 ):
     """Coordinate paint flow using focused rendering mixins."""
 
-    def paintEvent(self, _event):
-        highlight_gray = 255 if not self.invert_colors else 0
-        background_gray = 100 if not self.invert_colors else 120
-        stroke_gray = 0 if not self.invert_colors else 255
-        self.resetResolutionTextState()
-
-        painter = QtGui.QPainter()
-        painter.begin(self)
-
-        stroke_pen = QtGui.QPen(
-            QtGui.QColor(stroke_gray, stroke_gray, stroke_gray, 200), 1, QtCore.Qt.PenStyle.SolidLine
-        )
+    def drawBackground(self, painter, stroke_pen, background_gray, highlight_gray):
         painter.setPen(stroke_pen)
 
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, self.render_lod == LOD_FULL)
         painter.setBrush(
             QtGui.QColor(background_gray, background_gray, background_gray, (0 if self.is_transparent else 180))
         )
@@ -49,17 +43,36 @@ class RulerRenderingMixin(
         else:
             painter.drawRect(QtCore.QRect(21, 21, max(self.width() - 21 * 2, 0), max(self.height() - 21 * 2, 0)))
 
+    def paintEvent(self, _event):
+        frame_start = time.perf_counter()
+        highlight_gray = 255 if not self.invert_colors else 0
+        background_gray = 100 if not self.invert_colors else 120
+        stroke_gray = 0 if not self.invert_colors else 255
+        self.resetResolutionTextState()
+
+        painter = QtGui.QPainter()
+        painter.begin(self)
+
+        stroke_pen = QtGui.QPen(
+            QtGui.QColor(stroke_gray, stroke_gray, stroke_gray, 200), 1, QtCore.Qt.PenStyle.SolidLine
+        )
+        self.drawBackground(painter, stroke_pen, background_gray, highlight_gray)
+
         self.drawHoverHints(painter, highlight_gray)
         self.drawAlignedScreenEdges(painter)
+        self.drawSnapGuides(painter)
 
         painter.setPen(stroke_pen)
 
         if not self.is_transparent:
-            right_label_limit = self.getRightLabelLimit(painter)
-            x_tick_config, y_tick_config = self.drawSubticks(painter, stroke_gray)
-            self.drawMajorTicksAndLabels(painter, stroke_gray, right_label_limit, x_tick_config, y_tick_config)
+            self.drawTickLayer(painter, stroke_gray)
 
-            size_x, size_y = self.getMeasurementSize(painter)
+            size_x, size_y = self.getMeasurementSize()
             self.drawResolutionReadout(painter, size_x, size_y, stroke_gray)
 
+        self.drawScanlineSpans(painter, stroke_gray)
+        self.drawLatencyReadout(painter, stroke_gray)
+
         painter.end()
+        self.recordFrameTime((time.perf_counter() - frame_start) * 1000.0)
+        self.markLatencyPaint()
@@ -1,5 +1,7 @@
 """Formatting and unit conversion presentation helpers for ruler rendering."""
 
+from .tick_schedule import is_near_step
+
 
 class RulerRenderingFormatMixin:
     """Provide text/tick formatting helpers used by paint routines."""
@@ -47,11 +49,7 @@ class RulerRenderingFormatMixin:
         }
 
     def isNearStep(self, value, step, tolerance):
-        if step <= 0:
-            return False
-        nearest_index = int(round(value / step))
-        nearest_value = nearest_index * step
-        return abs(value - nearest_value) <= tolerance
+        return is_near_step(value, step, tolerance)
 
     def formatTickLabel(self, value):
         if self.measurement_unit == "px":
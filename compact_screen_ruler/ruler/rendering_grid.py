@@ -0,0 +1,193 @@
+"""Tiled pixmap rendering for full-window grid mode."""
+
+import math
+
+from PyQt6 import QtCore, QtGui
+
+from ..constants import GRID_TILE_MAX_DRIFT, GRID_TILE_MAX_SIZE, GRID_TILE_PHASES
+from .line_batch import LineBatch
+from .tick_schedule import TICK_SMALL, AxisTickSchedule
+
+# Thickness of a grid tile across its lines; the tile repeats along that direction too.
+GRID_TILE_THICKNESS = 16
+
+
+def is_whole_multiple(value, step):
+    """Return True when `value` is an integer multiple of `step`."""
+    if step <= 0:
+        return False
+    ratio = value / step
+    return abs(ratio - round(ratio)) < 1e-6
+
+
+class RulerRenderingGridMixin:
+    """Fill grid mode lines from a repeating tile instead of drawing each line."""
+
+    def getGridTileLayout(self, tick_config):
+        small_step = tick_config["small_step_px"]
+        medium_step = tick_config["medium_step_px"]
+        major_step = tick_config["major_step_px"]
+
+        # The tile pattern only repeats when subticks divide the major period evenly.
+        if not is_whole_multiple(major_step, small_step) or not is_whole_multiple(major_step, medium_step):
+            return None
+
+        if not tick_config["distinct_subticks"]:
+            if not is_whole_multiple(major_step, 1.0):
+                return None
+            return int(round(major_step)), float(round(major_step))
+
+        # Non-integer cm/in periods: repeat the number of periods whose pixel rounding drifts least
+        # per pixel, so the tile can be re-anchored as rarely as possible.
+        best_layout = None
+        best_drift = None
+        periods = 1
+        while periods * major_step <= GRID_TILE_MAX_SIZE:
+            true_length = periods * major_step
+            drift = abs(true_length - round(true_length)) / true_length
+            if best_drift is None or drift < best_drift:
+                best_layout = (int(round(true_length)), true_length)
+                best_drift = drift
+            periods += 1
+        return best_layout
+
+    def buildGridTile(self, axis, tick_config, tile_length, phase, color_value):
+        scale_factor = self.devicePixelRatioF()
+        if axis == "x":
+            tile_width, tile_height = tile_length, GRID_TILE_THICKNESS
+        else:
+            tile_width, tile_height = GRID_TILE_THICKNESS, tile_length
+
+        tile = QtGui.QPixmap(
+            max(1, int(math.ceil(tile_width * scale_factor))),
+            max(1, int(math.ceil(tile_height * scale_factor))),
+        )
+        tile.setDevicePixelRatio(scale_factor)
+        tile.fill(QtCore.Qt.GlobalColor.transparent)
+
+        tick_pens = self.getTickPens(color_value)
+        pattern = AxisTickSchedule(tick_config, tile_length + 1, tile_length - 0.5, str)
+        tile_lines = [(0.0, tick_pens["major"])]
+        tile_lines.extend((major_pos, tick_pens["major"]) for major_pos in pattern.major_positions)
+        for small_pos, tick_class in zip(pattern.small_positions, pattern.small_classes):
+            tile_lines.append((small_pos, tick_pens["smallest_grid" if tick_class == TICK_SMALL else "normal"]))
+
+        batch = LineBatch()
+        span = GRID_TILE_THICKNESS + 1
+        for line_pos, pen in tile_lines:
+            if pattern.distinct_subticks:
+                line_pos += phase
+            else:
+                line_pos = int(round(line_pos))
+            # Antialiased lines near a tile edge spill into the neighbouring tile, so draw the
+            # wrapped copies as well and let the tile bounds clip them.
+            for wrapped_pos in (line_pos - tile_length, line_pos, line_pos + tile_length):
+                if pattern.distinct_subticks:
+                    if axis == "x":
+                        batch.add(pen, QtCore.QLineF(wrapped_pos, -1.0, wrapped_pos, float(span)))
+                    else:
+                        batch.add(pen, QtCore.QLineF(-1.0, wrapped_pos, float(span), wrapped_pos))
+                elif axis == "x":
+                    batch.add(pen, QtCore.QLine(wrapped_pos, -1, wrapped_pos, span))
+                else:
+                    batch.add(pen, QtCore.QLine(-1, wrapped_pos, span, wrapped_pos))
+
+        painter = QtGui.QPainter(tile)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        batch.flush(painter)
+        painter.end()
+        return tile
+
+    def getGridTile(self, axis, tick_config, tile_length, phase, color_value):
+        key = (
+            axis,
+            tile_length,
+            phase,
+            tick_config["small_step_px"],
+            tick_config["major_step_px"],
+            color_value,
+            self.devicePixelRatioF(),
+        )
+        tile = self.grid_tile_cache.get(key)
+        if tile is None:
+            if len(self.grid_tile_cache) >= 4 * GRID_TILE_PHASES:
+                self.grid_tile_cache.clear()
+            tile = self.buildGridTile(axis, tick_config, tile_length, phase, color_value)
+            self.grid_tile_cache[key] = tile
+        return tile
+
+    def getGridTiledEnd(self, axis_schedule, tick_config, length):
+        # Major lines stop short of the far edge on some axes while subticks continue. The tile
+        # covers everything up to halfway before the first omitted major line; the rest is drawn
+        # as individual lines.
+        major_step = tick_config["major_step_px"]
+        omitted_major_pos = (len(axis_schedule.major_positions) + 1) * major_step
+        if omitted_major_pos < length - 1:
+            return int(omitted_major_pos - tick_config["small_step_px"] / 2)
+        # Schedules stop short of the last pixel. When the length is a whole number of tiles, the tile's
+        # line at the far edge would still blend into the last column or row, so the fill stops before it.
+        return length - 1
+
+    def drawGridAxisTiles(self, painter, axis, tick_config, axis_schedule, length, color_value):
+        layout = self.getGridTileLayout(tick_config)
+        if layout is None:
+            return None
+
+        tile_length, true_length = layout
+        tiled_end = self.getGridTiledEnd(axis_schedule, tick_config, length)
+
+        # Each chunk anchors the tile at the nearest pixel, with the sub-pixel remainder baked into
+        # one of GRID_TILE_PHASES pre-shifted tiles. Chunks end before rounding drift exceeds
+        # GRID_TILE_MAX_DRIFT, so lines never stray more than a fraction of a pixel.
+        drift_per_tile = abs(true_length - tile_length)
+        if drift_per_tile > 1e-9:
+            tiles_per_chunk = max(1, int(GRID_TILE_MAX_DRIFT / drift_per_tile))
+        else:
+            tiles_per_chunk = int(math.ceil(length / tile_length)) + 1
+        chunk_true_length = tiles_per_chunk * true_length
+
+        chunk_index = 0
+        fill_start = 1
+        while fill_start < tiled_end:
+            chunk_start = chunk_index * chunk_true_length
+            anchor = math.floor(chunk_start)
+            phase_index = int(round((chunk_start - anchor) * GRID_TILE_PHASES))
+            if phase_index == GRID_TILE_PHASES:
+                anchor += 1
+                phase_index = 0
+            fill_end = min(tiled_end, int(round(chunk_start + chunk_true_length)))
+            if fill_end > fill_start:
+                tile = self.getGridTile(axis, tick_config, tile_length, phase_index / GRID_TILE_PHASES, color_value)
+                tile_offset = float((fill_start - anchor) % tile_length)
+                fill_length = float(fill_end - fill_start)
+                if axis == "x":
+                    fill_rect = QtCore.QRectF(float(fill_start), 0.0, fill_length, float(self.height()))
+                    offset = QtCore.QPointF(tile_offset, 0.0)
+                else:
+                    fill_rect = QtCore.QRectF(0.0, float(fill_start), float(self.width()), fill_length)
+                    offset = QtCore.QPointF(0.0, tile_offset)
+                painter.drawTiledPixmap(fill_rect, tile, offset)
+                self.tick_draw_calls += 1
+                fill_start = fill_end
+            chunk_index += 1
+
+        return tiled_end
+
+    def drawTiledGrid(self, painter, color_value, tick_schedule):
+        tiled_grid = {}
+
+        if self.width() >= 88:
+            tiled_end = self.drawGridAxisTiles(
+                painter, "x", tick_schedule.x_tick_config, tick_schedule.x, self.width(), color_value
+            )
+            if tiled_end is not None:
+                tiled_grid["x"] = tiled_end
+
+        if self.height() > 80:
+            tiled_end = self.drawGridAxisTiles(
+                painter, "y", tick_schedule.y_tick_config, tick_schedule.y, self.height(), color_value
+            )
+            if tiled_end is not None:
+                tiled_grid["y"] = tiled_end
+
+        return tiled_grid
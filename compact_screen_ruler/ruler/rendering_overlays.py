@@ -3,6 +3,7 @@
 from PyQt6 import QtCore, QtGui
 
 from ..utils import simplify_ratio
+from .quality import LOD_FULL
 
 
 class RulerRenderingOverlaysMixin:
@@ -35,6 +36,21 @@ class RulerRenderingOverlaysMixin:
 
         painter.restore()
 
+    def drawSnapGuides(self, painter):
+        guides = self.drawn_snap_guides
+        if not guides["x"] and not guides["y"]:
+            return
+
+        painter.save()
+        painter.setPen(QtGui.QPen(QtGui.QColor(0, 160, 255, 220), 1, QtCore.Qt.PenStyle.DashLine))
+        max_x = max(self.width() - 1, 0)
+        max_y = max(self.height() - 1, 0)
+        for x_pos in guides["x"]:
+            painter.drawLine(x_pos, 0, x_pos, max_y)
+        for y_pos in guides["y"]:
+            painter.drawLine(0, y_pos, max_x, y_pos)
+        painter.restore()
+
     def drawResolutionText(self, painter, draw_rect, alignment, text):
         painter.save()
         if self.resolution_text_hovered:
@@ -45,8 +61,7 @@ class RulerRenderingOverlaysMixin:
         painter.restore()
 
     def drawHoverHints(self, painter, base_color):
-        is_interacting = self.leftclick or self.middleclick or self.drawPickPos
-        zones_to_draw = self.active_interaction_zones if is_interacting else self.hover_zones
+        zones_to_draw = self.getDisplayedHoverZones()
 
         if not any(zones_to_draw.values()):
             return
@@ -102,30 +117,39 @@ class RulerRenderingOverlaysMixin:
             messages.append(f"Aspect Ratio Locked [{ratio_width}:{ratio_height}]")
         if self.clickthrough_enabled:
             messages.append("Clickthrough Mode Enabled")
+        if self.content_snap_enabled:
+            messages.append("Content Edge Snap Enabled")
+        if self.isRecording():
+            stats = self.recorder.getStats()
+            messages.append(
+                f"Recording: {stats['captured']} frames, {stats['dropped']} dropped, "
+                f"{stats['buffered_bytes'] / 1048576:.0f} MiB buffered"
+            )
+        if self.screenshot_progress:
+            percent = min(self.screenshot_progress.values())
+            messages.append(f"Saving Screenshot ({percent}%)")
+        guide_count = self.snap_engine.getGuideCount()
+        if guide_count:
+            messages.append(f"Snap Guides: {guide_count}")
         return messages
 
     def drawStatusMessages(self, painter, color_value):
+        if self.render_lod != LOD_FULL:
+            return
+
         messages = self.getStatusMessages()
         if not messages:
             return
 
         painter.save()
 
-        font = QtGui.QFont(painter.font())
-        point_size = font.pointSizeF()
-        if point_size > 0:
-            font.setPointSizeF(point_size * 0.9)
-        else:
-            pixel_size = font.pixelSize()
-            if pixel_size > 0:
-                font.setPixelSize(max(1, int(round(pixel_size * 0.9))))
+        font = self.text_layout_cache.getScaledFont(painter.font(), 0.9)
         painter.setFont(font)
 
         pen = QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 150), 1, QtCore.Qt.PenStyle.SolidLine)
         painter.setPen(pen)
 
-        metrics = QtGui.QFontMetrics(font)
-        line_height = metrics.height()
+        line_height = self.text_layout_cache.lineHeight(font)
         start_y = int(self.height() / 2) + 10
 
         for index, message in enumerate(messages):
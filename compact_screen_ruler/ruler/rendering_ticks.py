@@ -1,223 +1,309 @@
 """Tick rendering helpers for ruler scales and labels."""
 
+import math
+
 from PyQt6 import QtCore, QtGui
 
+from ..constants import TICK_LAYER_CACHE_MAX_BYTES
+from .line_batch import LineBatch
+from .quality import LOD_FULL, LOD_MINIMAL
+from .tick_schedule import TICK_SIZES, TICK_SMALL, TickSchedule
+
 
 class RulerRenderingTicksMixin:
     """Provide border tick rendering for all measurement units."""
 
+    def getTickLayerKey(self, right_label_limit):
+        return (
+            self.width(),
+            self.height(),
+            self.measurement_unit,
+            self.getPixelsPerInch("x"),
+            self.getPixelsPerInch("y"),
+            self.grid_enabled,
+            self.invert_colors,
+            self.is_transparent,
+            self.devicePixelRatioF(),
+            self.font().key(),
+            right_label_limit,
+            self.render_lod,
+        )
+
+    def renderTickLayer(self, color_value, right_label_limit):
+        scale_factor = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(
+            max(1, int(math.ceil(self.width() * scale_factor))),
+            max(1, int(math.ceil(self.height() * scale_factor))),
+        )
+        pixmap.setDevicePixelRatio(scale_factor)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, self.render_lod == LOD_FULL)
+        painter.setFont(self.font())
+        self.tick_draw_calls = 0
+        tick_schedule = self.getTickSchedule()
+        if self.render_lod == LOD_FULL:
+            tiled_grid = self.drawTiledGrid(painter, color_value, tick_schedule) if self.grid_enabled else {}
+            self.drawSubticks(painter, color_value, tick_schedule, tiled_grid)
+        else:
+            tiled_grid = {}
+        self.drawMajorTicksAndLabels(painter, color_value, right_label_limit, tick_schedule, tiled_grid)
+        painter.end()
+        return pixmap
+
+    def storeTickLayer(self, key, pixmap):
+        self.tick_layer_cache[key] = pixmap
+        self.tick_layer_cache_bytes += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+        # Evict least recently used layers, but never the one just rendered.
+        while self.tick_layer_cache_bytes > TICK_LAYER_CACHE_MAX_BYTES and len(self.tick_layer_cache) > 1:
+            _old_key, old_pixmap = self.tick_layer_cache.popitem(last=False)
+            self.tick_layer_cache_bytes -= old_pixmap.width() * old_pixmap.height() * old_pixmap.depth() // 8
+
+    def clearTickLayerCache(self):
+        self.tick_layer_cache.clear()
+        self.tick_layer_cache_bytes = 0
+
+    def drawTickLayer(self, painter, color_value):
+        right_label_limit = self.getRightLabelLimit(painter)
+        key = self.getTickLayerKey(right_label_limit)
+        pixmap = self.tick_layer_cache.get(key)
+        if pixmap is None:
+            pixmap = self.renderTickLayer(color_value, right_label_limit)
+            self.storeTickLayer(key, pixmap)
+        else:
+            self.tick_layer_cache.move_to_end(key)
+
+        painter.drawPixmap(0, 0, pixmap)
+
     def getRightLabelLimit(self, painter):
         right_label_limit = self.width() - 37
         if self.height() <= 80:
             preview_resolution_text = self.buildResolutionText(self.width(), self.height(), include_y=False)
-            preview_resolution_width = painter.fontMetrics().horizontalAdvance(preview_resolution_text)
+            preview_resolution_width = self.text_layout_cache.horizontalAdvance(self.font(), preview_resolution_text)
             right_label_limit = self.width() - max(37, preview_resolution_width + 12)
         return right_label_limit
 
-    def drawSubticks(self, painter, color_value):
+    def getTickSchedule(self):
+        key = (
+            self.width(),
+            self.height(),
+            self.measurement_unit,
+            self.getPixelsPerInch("x"),
+            self.getPixelsPerInch("y"),
+        )
+        if self.tick_schedule is None or self.tick_schedule_key != key:
+            self.tick_schedule = TickSchedule(
+                self.getTickConfig("x"),
+                self.getTickConfig("y"),
+                self.width(),
+                self.height(),
+                self.formatTickLabel,
+            )
+            self.tick_schedule_key = key
+        return self.tick_schedule
+
+    def getTickLabelStaticText(self, index, label, pixels_per_inch, font):
+        key = (self.measurement_unit, index, pixels_per_inch, font.key())
+        static_text = self.tick_label_cache.get(key)
+        if static_text is None:
+            static_text = QtGui.QStaticText(label)
+            static_text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            static_text.setPerformanceHint(QtGui.QStaticText.PerformanceHint.AggressiveCaching)
+            static_text.prepare(QtGui.QTransform(), font)
+            self.tick_label_cache[key] = static_text
+        return static_text
+
+    def clearTickLabelCache(self):
+        self.tick_label_cache.clear()
+
+    def drawTickLabel(self, painter, label_rect, alignment, static_text):
+        text_size = static_text.size()
+        if alignment & QtCore.Qt.AlignmentFlag.AlignRight:
+            x_pos = label_rect.x() + label_rect.width() - text_size.width()
+        elif alignment & QtCore.Qt.AlignmentFlag.AlignHCenter:
+            x_pos = label_rect.x() + (label_rect.width() - text_size.width()) / 2
+        else:
+            x_pos = label_rect.x()
+
+        if alignment & QtCore.Qt.AlignmentFlag.AlignVCenter:
+            y_pos = label_rect.y() + (label_rect.height() - text_size.height()) / 2
+        else:
+            y_pos = label_rect.y()
+
+        painter.drawStaticText(QtCore.QPoint(int(round(x_pos)), int(round(y_pos))), static_text)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.Type.FontChange:
+            self.clearTickLabelCache()
+            self.text_layout_cache.clear()
+
+    def getTickPens(self, color_value):
         normal_subtick_alpha = 128
         smallest_grid_alpha = int(round(normal_subtick_alpha * 0.5))
-        normal_pen = QtGui.QPen(
-            QtGui.QColor(color_value, color_value, color_value, normal_subtick_alpha),
-            1,
-            QtCore.Qt.PenStyle.SolidLine,
-        )
-        smallest_grid_pen = QtGui.QPen(
-            QtGui.QColor(color_value, color_value, color_value, smallest_grid_alpha),
-            1,
-            QtCore.Qt.PenStyle.SolidLine,
-        )
-        painter.setPen(normal_pen)
+        return {
+            "normal": QtGui.QPen(
+                QtGui.QColor(color_value, color_value, color_value, normal_subtick_alpha),
+                1,
+                QtCore.Qt.PenStyle.SolidLine,
+            ),
+            "smallest_grid": QtGui.QPen(
+                QtGui.QColor(color_value, color_value, color_value, smallest_grid_alpha),
+                1,
+                QtCore.Qt.PenStyle.SolidLine,
+            ),
+            "major": QtGui.QPen(
+                QtGui.QColor(color_value, color_value, color_value, 200),
+                1,
+                QtCore.Qt.PenStyle.SolidLine,
+            ),
+        }
 
-        x_tick_config = self.getTickConfig("x")
-        y_tick_config = self.getTickConfig("y")
-        x_small_step = x_tick_config["small_step_px"]
-        x_medium_step = x_tick_config["medium_step_px"]
-        x_major_step = x_tick_config["major_step_px"]
-        y_small_step = y_tick_config["small_step_px"]
-        y_medium_step = y_tick_config["medium_step_px"]
-        y_major_step = y_tick_config["major_step_px"]
-
-        if self.width() >= 88:
-            x_small_pos = x_small_step
-            x_tolerance = max(1.0, x_small_step * 0.2)
-            while x_small_pos < self.width() - 1:
-                if not self.isNearStep(x_small_pos, x_major_step, x_tolerance):
-                    is_smallest_tick = False
-                    if x_tick_config["distinct_subticks"] and self.isNearStep(x_small_pos, x_medium_step, x_tolerance):
-                        tick_size = 10
-                    elif x_tick_config["distinct_subticks"]:
-                        tick_size = 5
-                        is_smallest_tick = True
-                    else:
-                        small_index = int(round(x_small_pos / x_small_step))
-                        tick_size = (((small_index - 1) % 2) + 1) * 5
-                        is_smallest_tick = tick_size == 5
+    def drawSubticks(self, painter, color_value, tick_schedule, tiled_grid=None):
+        tick_pens = self.getTickPens(color_value)
+        normal_pen = tick_pens["normal"]
+        smallest_grid_pen = tick_pens["smallest_grid"]
+
+        width = self.width()
+        height = self.height()
+        batch = LineBatch(self.batched_tick_lines)
+        tiled_grid = tiled_grid or {}
 
-                    if self.grid_enabled and is_smallest_tick:
-                        painter.setPen(smallest_grid_pen)
+        if width >= 88:
+            x_schedule = tick_schedule.x
+            x_tiled_end = tiled_grid.get("x", 0)
+            for x_small_pos, tick_class in zip(x_schedule.small_positions, x_schedule.small_classes):
+                if x_small_pos < x_tiled_end:
+                    continue
+                tick_size = TICK_SIZES[tick_class]
+                if self.grid_enabled and tick_class == TICK_SMALL:
+                    pen = smallest_grid_pen
+                else:
+                    pen = normal_pen
+
+                if x_schedule.distinct_subticks:
+                    xloc = float(x_small_pos)
+                    if self.grid_enabled:
+                        batch.add(pen, QtCore.QLineF(xloc, 0.0, xloc, float(height)))
                     else:
-                        painter.setPen(normal_pen)
-
-                    if x_tick_config["distinct_subticks"]:
-                        xloc = float(x_small_pos)
-                        if self.grid_enabled:
-                            painter.drawLine(QtCore.QLineF(xloc, 0.0, xloc, float(self.height())))
-                        else:
-                            painter.drawLine(QtCore.QLineF(xloc, 0.0, xloc, float(tick_size)))
+                        batch.add(pen, QtCore.QLineF(xloc, 0.0, xloc, float(tick_size)))
+                else:
+                    xloc = int(round(x_small_pos))
+                    if self.grid_enabled:
+                        batch.add(pen, QtCore.QLine(xloc, 0, xloc, height))
                     else:
-                        xloc = int(round(x_small_pos))
-                        if self.grid_enabled:
-                            painter.drawLine(xloc, 0, xloc, self.height())
-                        else:
-                            painter.drawLine(xloc, 0, xloc, tick_size)
-
-                    if self.height() > 43 and not self.grid_enabled:
-                        if x_tick_config["distinct_subticks"]:
-                            painter.drawLine(
-                                QtCore.QLineF(
-                                    xloc,
-                                    float(self.height()),
-                                    xloc,
-                                    float(self.height() - tick_size),
-                                )
-                            )
-                        else:
-                            painter.drawLine(xloc, self.height(), xloc, self.height() - tick_size)
-                x_small_pos += x_small_step
-
-        if self.height() > 80:
-            y_small_pos = y_small_step
-            y_tolerance = max(1.0, y_small_step * 0.2)
-            while y_small_pos < self.height() - 1:
-                if not self.isNearStep(y_small_pos, y_major_step, y_tolerance):
-                    is_smallest_tick = False
-                    if y_tick_config["distinct_subticks"] and self.isNearStep(y_small_pos, y_medium_step, y_tolerance):
-                        tick_size = 10
-                    elif y_tick_config["distinct_subticks"]:
-                        tick_size = 5
-                        is_smallest_tick = True
+                        batch.add(pen, QtCore.QLine(xloc, 0, xloc, tick_size))
+
+                if height > 43 and not self.grid_enabled:
+                    if x_schedule.distinct_subticks:
+                        batch.add(pen, QtCore.QLineF(xloc, float(height), xloc, float(height - tick_size)))
                     else:
-                        small_index = int(round(y_small_pos / y_small_step))
-                        tick_size = (((small_index - 1) % 2) + 1) * 5
-                        is_smallest_tick = tick_size == 5
+                        batch.add(pen, QtCore.QLine(xloc, height, xloc, height - tick_size))
+
+        if height > 80:
+            y_schedule = tick_schedule.y
+            y_tiled_end = tiled_grid.get("y", 0)
+            for y_small_pos, tick_class in zip(y_schedule.small_positions, y_schedule.small_classes):
+                if y_small_pos < y_tiled_end:
+                    continue
+                tick_size = TICK_SIZES[tick_class]
+                if self.grid_enabled and tick_class == TICK_SMALL:
+                    pen = smallest_grid_pen
+                else:
+                    pen = normal_pen
 
-                    if self.grid_enabled and is_smallest_tick:
-                        painter.setPen(smallest_grid_pen)
+                if y_schedule.distinct_subticks:
+                    yloc = float(y_small_pos)
+                    if self.grid_enabled:
+                        batch.add(pen, QtCore.QLineF(0.0, yloc, float(width), yloc))
                     else:
-                        painter.setPen(normal_pen)
-
-                    if y_tick_config["distinct_subticks"]:
-                        yloc = float(y_small_pos)
-                        if self.grid_enabled:
-                            painter.drawLine(QtCore.QLineF(0.0, yloc, float(self.width()), yloc))
-                        else:
-                            painter.drawLine(QtCore.QLineF(0.0, yloc, float(tick_size), yloc))
+                        batch.add(pen, QtCore.QLineF(0.0, yloc, float(tick_size), yloc))
+                else:
+                    yloc = int(round(y_small_pos))
+                    if self.grid_enabled:
+                        batch.add(pen, QtCore.QLine(0, yloc, width, yloc))
                     else:
-                        yloc = int(round(y_small_pos))
-                        if self.grid_enabled:
-                            painter.drawLine(0, yloc, self.width(), yloc)
-                        else:
-                            painter.drawLine(0, yloc, tick_size, yloc)
-
-                    if self.width() > 43 and not self.grid_enabled:
-                        if y_tick_config["distinct_subticks"]:
-                            painter.drawLine(
-                                QtCore.QLineF(
-                                    float(self.width()),
-                                    yloc,
-                                    float(self.width() - tick_size),
-                                    yloc,
-                                )
-                            )
-                        else:
-                            painter.drawLine(self.width(), yloc, self.width() - tick_size, yloc)
-                y_small_pos += y_small_step
-
-        return x_tick_config, y_tick_config
-
-    def drawMajorTicksAndLabels(self, painter, color_value, right_label_limit, x_tick_config, y_tick_config):
-        pen = QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 200), 1, QtCore.Qt.PenStyle.SolidLine)
-        painter.setPen(pen)
+                        batch.add(pen, QtCore.QLine(0, yloc, tick_size, yloc))
 
-        x_major_step = x_tick_config["major_step_px"]
-        x_major_unit = x_tick_config["major_unit"]
-        y_major_step = y_tick_config["major_step_px"]
-        y_major_unit = y_tick_config["major_unit"]
+                if width > 43 and not self.grid_enabled:
+                    if y_schedule.distinct_subticks:
+                        batch.add(pen, QtCore.QLineF(float(width), yloc, float(width - tick_size), yloc))
+                    else:
+                        batch.add(pen, QtCore.QLine(width, yloc, width - tick_size, yloc))
+
+        batch.flush(painter)
+        painter.setPen(normal_pen)
+        self.tick_draw_calls += batch.draw_calls
 
-        if self.width() >= 88:
-            x_major_index = 1
-            x_major_pos = x_major_step
-            while x_major_pos < self.width() - 1:
+    def drawMajorTicksAndLabels(self, painter, color_value, right_label_limit, tick_schedule, tiled_grid=None):
+        pen = self.getTickPens(color_value)["major"]
+        align_center = QtCore.Qt.AlignmentFlag.AlignCenter
+        align_left = QtCore.Qt.AlignmentFlag.AlignLeft
+        align_right = QtCore.Qt.AlignmentFlag.AlignRight
+
+        width = self.width()
+        height = self.height()
+        font = painter.font()
+        batch = LineBatch(self.batched_tick_lines)
+        labels = []
+        tiled_grid = tiled_grid or {}
+
+        if width >= 88:
+            x_schedule = tick_schedule.x
+            x_pixels_per_inch = self.getPixelsPerInch("x")
+            for x_major_index, (x_major_pos, label) in enumerate(
+                zip(x_schedule.major_positions, x_schedule.major_labels), start=1
+            ):
                 xloc = int(round(x_major_pos))
-                label = self.formatTickLabel(x_major_index * x_major_unit)
+                static_label = self.getTickLabelStaticText(x_major_index, label, x_pixels_per_inch, font)
                 if self.grid_enabled:
-                    painter.drawLine(xloc, 0, xloc, self.height())
+                    if "x" not in tiled_grid:
+                        batch.add(pen, QtCore.QLine(xloc, 0, xloc, height))
                 else:
-                    painter.drawLine(xloc, 0, xloc, 20)
-                if self.height() > 52 and not self.grid_enabled:
-                    painter.drawLine(xloc, self.height(), xloc, self.height() - 20)
-
-                if xloc < right_label_limit or self.height() > 80:
-                    if self.height() > 80:
-                        if xloc < self.width() - 37:
-                            painter.drawText(
-                                QtCore.QRect(xloc - 25, 19, 50, 15),
-                                QtCore.Qt.AlignmentFlag.AlignCenter,
-                                label,
-                            )
-                            painter.drawText(
-                                QtCore.QRect(xloc - 25, self.height() - 35, 50, 15),
-                                QtCore.Qt.AlignmentFlag.AlignCenter,
-                                label,
-                            )
-                    elif self.height() < 54:
-                        painter.drawText(
-                            QtCore.QRect(xloc - 25, 19, 50, 15),
-                            QtCore.Qt.AlignmentFlag.AlignCenter,
-                            label,
-                        )
+                    batch.add(pen, QtCore.QLine(xloc, 0, xloc, 20))
+                if height > 52 and not self.grid_enabled:
+                    batch.add(pen, QtCore.QLine(xloc, height, xloc, height - 20))
+
+                if xloc < right_label_limit or height > 80:
+                    if height > 80:
+                        if xloc < width - 37:
+                            labels.append((QtCore.QRect(xloc - 25, 19, 50, 15), align_center, static_label))
+                            labels.append((QtCore.QRect(xloc - 25, height - 35, 50, 15), align_center, static_label))
+                    elif height < 54:
+                        labels.append((QtCore.QRect(xloc - 25, 19, 50, 15), align_center, static_label))
                     else:
-                        painter.drawText(
-                            QtCore.QRect(xloc - 25, 0, 50, self.height()),
-                            QtCore.Qt.AlignmentFlag.AlignCenter,
-                            label,
-                        )
-
-                x_major_index += 1
-                x_major_pos += x_major_step
-
-        if self.height() > 80:
-            y_major_index = 1
-            y_major_pos = y_major_step
-            while y_major_pos < self.height() - 9:
+                        labels.append((QtCore.QRect(xloc - 25, 0, 50, height), align_center, static_label))
+
+        if height > 80:
+            y_schedule = tick_schedule.y
+            y_pixels_per_inch = self.getPixelsPerInch("y")
+            for y_major_index, (y_major_pos, label) in enumerate(
+                zip(y_schedule.major_positions, y_schedule.major_labels), start=1
+            ):
                 yloc = int(round(y_major_pos))
-                label = self.formatTickLabel(y_major_index * y_major_unit)
+                static_label = self.getTickLabelStaticText(y_major_index, label, y_pixels_per_inch, font)
                 if self.grid_enabled:
-                    painter.drawLine(0, yloc, self.width(), yloc)
+                    if "y" not in tiled_grid:
+                        batch.add(pen, QtCore.QLine(0, yloc, width, yloc))
                 else:
-                    painter.drawLine(0, yloc, 20, yloc)
-                if self.width() > 52 and not self.grid_enabled:
-                    painter.drawLine(self.width(), yloc, self.width() - 20, yloc)
-
-                if yloc < self.height() - 35:
-                    if self.width() >= 88:
-                        painter.drawText(
-                            QtCore.QRect(23, yloc - 7, 50, 20),
-                            QtCore.Qt.AlignmentFlag.AlignLeft,
-                            label,
-                        )
-                        painter.drawText(
-                            QtCore.QRect(self.width() - 63, yloc - 7, 40, 50),
-                            QtCore.Qt.AlignmentFlag.AlignRight,
-                            label,
-                        )
-                    elif self.width() > 62:
-                        painter.drawText(
-                            QtCore.QRect(0, yloc - 25, self.width(), 50),
-                            QtCore.Qt.AlignmentFlag.AlignCenter,
-                            label,
-                        )
-
-                y_major_index += 1
-                y_major_pos += y_major_step
+                    batch.add(pen, QtCore.QLine(0, yloc, 20, yloc))
+                if width > 52 and not self.grid_enabled:
+                    batch.add(pen, QtCore.QLine(width, yloc, width - 20, yloc))
+
+                if yloc < height - 35:
+                    if width >= 88:
+                        labels.append((QtCore.QRect(23, yloc - 7, 50, 20), align_left, static_label))
+                        labels.append((QtCore.QRect(width - 63, yloc - 7, 40, 50), align_right, static_label))
+                    elif width > 62:
+                        labels.append((QtCore.QRect(0, yloc - 25, width, 50), align_center, static_label))
+
+        if self.render_lod >= LOD_MINIMAL:
+            labels = labels[: self.lod_label_budget]
+
+        batch.flush(painter)
+        painter.setPen(pen)
+        for label_rect, alignment, static_label in labels:
+            self.drawTickLabel(painter, label_rect, alignment, static_label)
+        self.tick_draw_calls += batch.draw_calls + len(labels)
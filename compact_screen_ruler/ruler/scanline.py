@@ -0,0 +1,171 @@
+"""Scanline spacing inspector: measure gaps and elements along the ruler's centerline."""
+
+import sys
+
+from PyQt6 import QtCore, QtGui
+
+from ..constants import SCANLINE_COLOR_TOLERANCE
+from ..recording import grab_screen_region
+from .quality import LOD_MINIMAL
+
+
+class RulerScanlineMixin:
+    """Overlay labelled gap and element widths sampled from a cached capture under the ruler's centerline."""
+
+    def toggleScanlineInspector(self):
+        from .content_snap import is_content_snap_available
+
+        if not self.scanline_enabled and not is_content_snap_available():
+            print("The scanline inspector needs NumPy (pip install numpy).", file=sys.stderr, flush=True)
+            return
+
+        self.scanline_enabled = not self.scanline_enabled
+        if self.scanline_enabled:
+            self.refreshScanlineCapture()
+        else:
+            self.scanline_capture = None
+            self.scanline_spans_key = None
+        self.update()
+
+    def refreshScanlineCapture(self):
+        if not self.scanline_enabled:
+            return
+        screen = self.getCenterScreen()
+        if not screen:
+            return
+
+        from .region_fit import image_to_rgb_array
+
+        # The ruler covers the line it measures, so the capture is taken with it hidden and reused while
+        # it moves instead of being grabbed again on every frame.
+        bounds = QtCore.QRect(self.screen_metrics.get(screen).geometry)
+        self.hide()
+        image = grab_screen_region(screen, bounds)
+        self.show()
+        if image.isNull():
+            self.scanline_capture = None
+        else:
+            self.scanline_capture = (screen, bounds, image_to_rgb_array(image, bounds.width(), bounds.height()))
+        self.scanline_spans_key = None
+        self.update()
+
+    def refreshScanlineCaptureForScreen(self):
+        if self.scanline_capture is not None and self.scanline_capture[0] is not self.current_screen:
+            self.refreshScanlineCapture()
+
+    def isScanlineHorizontal(self):
+        return self.width() >= self.height()
+
+    def getScanlineSpans(self):
+        if self.scanline_capture is None:
+            return []
+
+        x_pos = self.pos().x()
+        y_pos = self.pos().y()
+        horizontal = self.isScanlineHorizontal()
+        key = (x_pos, y_pos, self.width(), self.height())
+        if key == self.scanline_spans_key:
+            return self.scanline_spans
+
+        _screen, capture_rect, pixels = self.scanline_capture
+        if horizontal:
+            line_index = y_pos + self.height() // 2 - capture_rect.y()
+            first = max(x_pos, capture_rect.x())
+            last = min(x_pos + self.width(), capture_rect.x() + capture_rect.width())
+            line_limit = capture_rect.height()
+            origin = x_pos
+        else:
+            line_index = x_pos + self.width() // 2 - capture_rect.x()
+            first = max(y_pos, capture_rect.y())
+            last = min(y_pos + self.height(), capture_rect.y() + capture_rect.height())
+            line_limit = capture_rect.width()
+            origin = y_pos
+
+        spans = []
+        if 0 <= line_index < line_limit and last - first >= 2:
+            from .region_fit import find_line_spans
+
+            if horizontal:
+                line = pixels[line_index, first - capture_rect.x() : last - capture_rect.x()]
+            else:
+                line = pixels[first - capture_rect.y() : last - capture_rect.y(), line_index]
+            bounds, is_element = find_line_spans(line, SCANLINE_COLOR_TOLERANCE)
+            offset = first - origin
+            spans = [
+                (offset + start, offset + end, element)
+                for start, end, element in zip(bounds[:-1].tolist(), bounds[1:].tolist(), is_element.tolist())
+            ]
+
+        self.scanline_spans = spans
+        self.scanline_spans_key = key
+        return spans
+
+    def getScanlineOverlayRect(self):
+        if self.isScanlineHorizontal():
+            center = self.height() // 2
+            return QtCore.QRect(0, center - 24, self.width(), 48)
+        center = self.width() // 2
+        return QtCore.QRect(center - 80, 0, 160, self.height())
+
+    def updateScanlineOverlay(self):
+        # Moves are not repainted otherwise; redraw the band the spans occupy.
+        if self.scanline_capture is not None:
+            self.update(self.getScanlineOverlayRect())
+
+    def drawScanlineSpans(self, painter, color_value):
+        if not self.scanline_enabled:
+            return
+        spans = self.getScanlineSpans()
+        if not spans:
+            return
+
+        painter.save()
+        horizontal = self.isScanlineHorizontal()
+        axis = "x" if horizontal else "y"
+        center = self.height() // 2 if horizontal else self.width() // 2
+        font = painter.font()
+        line_height = self.text_layout_cache.lineHeight(font)
+
+        boundary_pen = QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 220), 1)
+        element_pen = QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 160), 3)
+        gap_pen = QtGui.QPen(QtGui.QColor(color_value, color_value, color_value, 160), 1, QtCore.Qt.PenStyle.DotLine)
+
+        boundaries = []
+        element_lines = []
+        gap_lines = []
+        for start, end, element in spans:
+            if horizontal:
+                boundaries.append(QtCore.QLine(start, center - 6, start, center + 6))
+                span_line = QtCore.QLine(start, center, end, center)
+            else:
+                boundaries.append(QtCore.QLine(center - 6, start, center + 6, start))
+                span_line = QtCore.QLine(center, start, center, end)
+            (element_lines if element else gap_lines).append(span_line)
+
+        painter.setPen(gap_pen)
+        painter.drawLines(gap_lines)
+        painter.setPen(element_pen)
+        painter.drawLines(element_lines)
+        painter.setPen(boundary_pen)
+        painter.drawLines(boundaries)
+
+        label_budget = self.lod_label_budget if self.render_lod == LOD_MINIMAL else len(spans)
+        for start, end, element in spans:
+            if label_budget <= 0:
+                break
+            label = self.formatMeasurementValue(end - start, axis)
+            label_width = self.text_layout_cache.horizontalAdvance(font, label)
+            if horizontal:
+                if label_width + 4 > end - start:
+                    continue
+                top = center - 8 - line_height if element else center + 8
+                label_rect = QtCore.QRect(start, top, end - start, line_height)
+            else:
+                if line_height + 2 > end - start:
+                    continue
+                left = center - 10 - label_width if element else center + 10
+                label_rect = QtCore.QRect(left, start, label_width, end - start)
+            painter.drawText(label_rect, QtCore.Qt.AlignmentFlag.AlignCenter, label)
+            label_budget -= 1
+
+        painter.restore()
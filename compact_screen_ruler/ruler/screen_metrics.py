@@ -0,0 +1,85 @@
+"""Per-screen DPI and geometry cache invalidated by QScreen signals."""
+
+from PyQt6 import QtGui
+
+
+def compute_pixels_per_inch(physical_dpi, logical_dpi, device_pixel_ratio):
+    """Return logical pixels per physical inch, falling back to logical DPI."""
+    pixels_per_inch = physical_dpi if physical_dpi > 0 else logical_dpi
+    if pixels_per_inch <= 0:
+        return 0.0
+    scale_factor = device_pixel_ratio if device_pixel_ratio > 0 else 1.0
+    return pixels_per_inch / scale_factor
+
+
+class ScreenMetrics:
+    """Snapshot of the values the ruler reads from one QScreen."""
+
+    def __init__(self, screen):
+        self.physical_dpi_x = float(screen.physicalDotsPerInchX())
+        self.physical_dpi_y = float(screen.physicalDotsPerInchY())
+        self.logical_dpi_x = float(screen.logicalDotsPerInchX())
+        self.logical_dpi_y = float(screen.logicalDotsPerInchY())
+        self.device_pixel_ratio = float(screen.devicePixelRatio())
+        self.geometry = screen.geometry()
+        self.available_geometry = screen.availableGeometry()
+        self.pixels_per_inch_x = compute_pixels_per_inch(
+            self.physical_dpi_x, self.logical_dpi_x, self.device_pixel_ratio
+        )
+        self.pixels_per_inch_y = compute_pixels_per_inch(
+            self.physical_dpi_y, self.logical_dpi_y, self.device_pixel_ratio
+        )
+
+    def getPixelsPerInch(self, axis):
+        return self.pixels_per_inch_y if str(axis).lower() == "y" else self.pixels_per_inch_x
+
+
+class ScreenMetricsCache:
+    """Cache `ScreenMetrics` per screen and drop entries when Qt reports a change.
+
+    `on_change` is called after any screen is added, removed, or changes its
+    DPI or geometry.
+    """
+
+    def __init__(self, on_change=None):
+        self.metrics = {}
+        self.on_change = on_change
+
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self.handleScreenAdded)
+            app.screenRemoved.connect(self.handleScreenRemoved)
+            for screen in app.screens():
+                self.watchScreen(screen)
+
+    def watchScreen(self, screen):
+        for signal in (
+            screen.physicalDotsPerInchChanged,
+            screen.logicalDotsPerInchChanged,
+            screen.physicalSizeChanged,
+            screen.geometryChanged,
+            screen.availableGeometryChanged,
+        ):
+            signal.connect(lambda *_args, changed_screen=screen: self.invalidate(changed_screen))
+
+    def get(self, screen):
+        metrics = self.metrics.get(screen)
+        if metrics is None:
+            metrics = ScreenMetrics(screen)
+            self.metrics[screen] = metrics
+        return metrics
+
+    def invalidate(self, screen=None):
+        if screen is None:
+            self.metrics.clear()
+        else:
+            self.metrics.pop(screen, None)
+        if self.on_change is not None:
+            self.on_change(screen)
+
+    def handleScreenAdded(self, screen):
+        self.watchScreen(screen)
+        self.invalidate(screen)
+
+    def handleScreenRemoved(self, screen):
+        self.invalidate(screen)
@@ -0,0 +1,114 @@
+"""Sorted per-axis snap targets for screen edges, monitor seams and user guides."""
+
+from bisect import bisect_left
+
+from PyQt6 import QtCore, QtGui
+
+SETTINGS_ORGANIZATION = "Compact Screen Ruler"
+SETTINGS_APPLICATION = "Screen Ruler"
+
+
+class SnapEngine:
+    """Answer nearest-target queries per axis in O(log n).
+
+    Targets are the outer and available-geometry edges of every screen (the
+    edges shared by neighbouring monitors form the seams between them) plus
+    persistent guide lines. The index is rebuilt lazily after `invalidate`.
+    Stored guides are read from the settings on first use, or when the ruler
+    calls `ensureGuidesLoaded` after its first frame.
+    """
+
+    def __init__(self, screen_metrics):
+        self.screen_metrics = screen_metrics
+        self.targets = {"x": [], "y": []}
+        self.target_sets = {"x": frozenset(), "y": frozenset()}
+        self.guides = {"x": [], "y": []}
+        self.guides_loaded = False
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def rebuild(self):
+        self.ensureGuidesLoaded()
+        targets = {"x": set(self.guides["x"]), "y": set(self.guides["y"])}
+        for screen in QtGui.QGuiApplication.screens():
+            metrics = self.screen_metrics.get(screen)
+            for rect in (metrics.geometry, metrics.available_geometry):
+                targets["x"].update((rect.x(), rect.x() + rect.width()))
+                targets["y"].update((rect.y(), rect.y() + rect.height()))
+
+        self.targets = {axis: sorted(values) for axis, values in targets.items()}
+        self.target_sets = {axis: frozenset(values) for axis, values in targets.items()}
+        self.dirty = False
+
+    def getTargets(self, axis):
+        if self.dirty:
+            self.rebuild()
+        return self.targets[axis]
+
+    def nearest(self, axis, value, max_distance):
+        """Return `(distance, target)` for the closest target within `max_distance`, or None."""
+        targets = self.getTargets(axis)
+        index = bisect_left(targets, value)
+        best = None
+        for candidate_index in (index - 1, index):
+            if 0 <= candidate_index < len(targets):
+                distance = abs(targets[candidate_index] - value)
+                if distance <= max_distance and (best is None or distance < best[0]):
+                    best = (distance, targets[candidate_index])
+        return best
+
+    def isTarget(self, axis, value):
+        if self.dirty:
+            self.rebuild()
+        return value in self.target_sets[axis]
+
+    def addGuide(self, axis, value):
+        self.ensureGuidesLoaded()
+        if value in self.guides[axis]:
+            return
+        self.guides[axis].append(value)
+        self.guides[axis].sort()
+        self.saveGuides()
+        self.invalidate()
+
+    def clearGuides(self):
+        self.guides_loaded = True
+        self.guides = {"x": [], "y": []}
+        self.saveGuides()
+        self.invalidate()
+
+    def getGuideCount(self):
+        return len(self.guides["x"]) + len(self.guides["y"])
+
+    def getGuidesWithin(self, axis, start, end):
+        """Return the guides at `start` <= value < `end`."""
+        guides = self.guides[axis]
+        return guides[bisect_left(guides, start) : bisect_left(guides, end)]
+
+    def ensureGuidesLoaded(self):
+        if self.guides_loaded:
+            return
+        self.guides = self.loadGuides()
+        self.guides_loaded = True
+        self.invalidate()
+
+    def loadGuides(self):
+        settings = QtCore.QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        guides = {}
+        for axis in ("x", "y"):
+            stored = str(settings.value(f"snap_guides/{axis}", "") or "")
+            values = []
+            for item in stored.split(","):
+                try:
+                    values.append(int(item))
+                except ValueError:
+                    continue
+            guides[axis] = sorted(set(values))
+        return guides
+
+    def saveGuides(self):
+        settings = QtCore.QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        for axis in ("x", "y"):
+            settings.setValue(f"snap_guides/{axis}", ",".join(str(value) for value in self.guides[axis]))
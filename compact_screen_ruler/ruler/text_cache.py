@@ -0,0 +1,55 @@
+"""Bounded cache of text measurements shared by readout and label placement."""
+
+from collections import OrderedDict
+
+from PyQt6 import QtCore, QtGui
+
+
+class TextLayoutCache:
+    """LRU cache of font metrics, text advances, and text bounding rects."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def lookup(self, key, compute):
+        value = self.entries.get(key)
+        if value is None:
+            value = compute()
+            self.entries[key] = value
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        self.entries.clear()
+
+    def getMetrics(self, font):
+        return self.lookup(("metrics", font.key()), lambda: QtGui.QFontMetrics(font))
+
+    def getScaledFont(self, font, factor):
+        def build_scaled_font():
+            scaled_font = QtGui.QFont(font)
+            point_size = scaled_font.pointSizeF()
+            if point_size > 0:
+                scaled_font.setPointSizeF(point_size * factor)
+            else:
+                pixel_size = scaled_font.pixelSize()
+                if pixel_size > 0:
+                    scaled_font.setPixelSize(max(1, int(round(pixel_size * factor))))
+            return scaled_font
+
+        return self.lookup(("scaled_font", font.key(), factor), build_scaled_font)
+
+    def lineHeight(self, font):
+        return self.getMetrics(font).height()
+
+    def horizontalAdvance(self, font, text):
+        return self.lookup(("advance", font.key(), text), lambda: self.getMetrics(font).horizontalAdvance(text))
+
+    def boundingRect(self, font, text, rect, flags):
+        key = ("bounds", font.key(), text, rect.x(), rect.y(), rect.width(), rect.height(), flags)
+        bounds = self.lookup(key, lambda: self.getMetrics(font).boundingRect(rect, flags, text))
+        return QtCore.QRect(bounds)
@@ -0,0 +1,69 @@
+"""Precomputed tick positions, classes, and labels for ruler scales."""
+
+from array import array
+
+TICK_SMALL = 0
+TICK_MEDIUM = 1
+
+TICK_SIZES = {TICK_SMALL: 5, TICK_MEDIUM: 10}
+
+
+def is_near_step(value, step, tolerance):
+    """Return True when `value` lies within `tolerance` of a multiple of `step`."""
+    if step <= 0:
+        return False
+    nearest_index = int(round(value / step))
+    nearest_value = nearest_index * step
+    return abs(value - nearest_value) <= tolerance
+
+
+class AxisTickSchedule:
+    """Subtick and major tick layout for one ruler axis.
+
+    Positions are computed as `index * step` rather than accumulated, so
+    long rulers in cm/in do not drift.
+    """
+
+    def __init__(self, tick_config, length, major_limit, format_label):
+        small_step = tick_config["small_step_px"]
+        medium_step = tick_config["medium_step_px"]
+        major_step = tick_config["major_step_px"]
+        major_unit = tick_config["major_unit"]
+
+        self.distinct_subticks = tick_config["distinct_subticks"]
+        self.small_positions = array("d")
+        self.small_classes = array("b")
+        self.major_positions = array("d")
+        self.major_labels = []
+
+        tolerance = max(1.0, small_step * 0.2)
+        small_index = 1
+        small_pos = small_step
+        while small_pos < length - 1:
+            if not is_near_step(small_pos, major_step, tolerance):
+                if self.distinct_subticks:
+                    is_medium = is_near_step(small_pos, medium_step, tolerance)
+                else:
+                    is_medium = small_index % 2 == 0
+                self.small_positions.append(small_pos)
+                self.small_classes.append(TICK_MEDIUM if is_medium else TICK_SMALL)
+            small_index += 1
+            small_pos = small_index * small_step
+
+        major_index = 1
+        major_pos = major_step
+        while major_pos < major_limit:
+            self.major_positions.append(major_pos)
+            self.major_labels.append(format_label(major_index * major_unit))
+            major_index += 1
+            major_pos = major_index * major_step
+
+
+class TickSchedule:
+    """Tick layout for both ruler axes, rebuilt only when size, unit or DPI change."""
+
+    def __init__(self, x_tick_config, y_tick_config, width, height, format_label):
+        self.x_tick_config = x_tick_config
+        self.y_tick_config = y_tick_config
+        self.x = AxisTickSchedule(x_tick_config, width, width - 1, format_label)
+        self.y = AxisTickSchedule(y_tick_config, height, height - 9, format_label)
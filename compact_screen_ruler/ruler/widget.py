@@ -1,10 +1,29 @@
 """Composed ScreenRuler widget class."""
 
 from .core import RulerCore
+from .damage import RulerDamageMixin
 from .geometry import RulerGeometryMixin
+from .instrumentation import RulerInstrumentationMixin
 from .interaction import RulerInteractionMixin
+from .loupe import RulerLoupeMixin
+from .pacing import RulerFramePacingMixin
+from .pick_overlay import RulerPickOverlayMixin
+from .quality import RulerQualityMixin
 from .rendering import RulerRenderingMixin
+from .scanline import RulerScanlineMixin
 
 
-class ScreenRuler(RulerInteractionMixin, RulerRenderingMixin, RulerGeometryMixin, RulerCore):
+class ScreenRuler(
+    RulerInteractionMixin,
+    RulerFramePacingMixin,
+    RulerRenderingMixin,
+    RulerScanlineMixin,
+    RulerLoupeMixin,
+    RulerPickOverlayMixin,
+    RulerDamageMixin,
+    RulerQualityMixin,
+    RulerGeometryMixin,
+    RulerInstrumentationMixin,
+    RulerCore,
+):
     """Concrete ruler widget assembled from focused behavior mixins."""
@@ -0,0 +1,193 @@
+"""Background screenshot encoding for Compact Screen Ruler."""
+
+import os
+from datetime import datetime
+
+from PyQt6 import QtCore, QtGui
+
+# Format name -> (QImageWriter format, file extension). Raw files hold tightly packed RGBA8888 rows.
+SCREENSHOT_FORMATS = {
+    "png": ("png", ".png"),
+    "webp": ("webp", ".webp"),
+    "raw": (None, ".raw"),
+}
+
+SCREENSHOT_FILE_FILTERS = {
+    "png": "PNG File (*.png)",
+    "webp": "WebP File (*.webp)",
+    "raw": "Raw RGBA8888 (*.raw)",
+}
+
+DEFAULT_NAME_PATTERN = "%Y-%m-%d_%H-%M-%S"
+
+# Raw captures are written in chunks of this many bytes so progress can be reported.
+RAW_WRITE_CHUNK_SIZE = 1024 * 1024
+
+
+class ScreenshotOptions:
+    """Where and how screenshots are written.
+
+    With `output_dir` set, screenshots are named from `name_pattern` (a
+    `strftime` pattern that may also use `{width}` and `{height}`) and the
+    save dialog is skipped. `compression` is the PNG zlib level (0-9, -1 for
+    Qt's default) and `quality` the WebP quality (0-100, -1 for default);
+    neither applies to the other format.
+    """
+
+    def __init__(
+        self, output_dir=None, name_pattern=DEFAULT_NAME_PATTERN, image_format="png", compression=-1, quality=-1
+    ):
+        self.output_dir = output_dir
+        self.name_pattern = name_pattern
+        self.image_format = image_format if image_format in SCREENSHOT_FORMATS else "png"
+        self.compression = compression
+        self.quality = quality
+
+    @classmethod
+    def fromEnvironment(cls):
+        def read_int(name, default):
+            try:
+                return int(os.environ.get(name, default))
+            except ValueError:
+                return default
+
+        return cls(
+            output_dir=os.environ.get("SCREEN_RULER_SCREENSHOT_DIR") or None,
+            name_pattern=os.environ.get("SCREEN_RULER_SCREENSHOT_NAME") or DEFAULT_NAME_PATTERN,
+            image_format=os.environ.get("SCREEN_RULER_SCREENSHOT_FORMAT", "png").lower(),
+            compression=read_int("SCREEN_RULER_SCREENSHOT_COMPRESSION", -1),
+            quality=read_int("SCREEN_RULER_SCREENSHOT_QUALITY", -1),
+        )
+
+    def getExtension(self):
+        return SCREENSHOT_FORMATS[self.image_format][1]
+
+    def buildFileName(self, width, height, when=None):
+        when = when or datetime.now()
+        name = when.strftime(self.name_pattern).replace("{width}", str(width)).replace("{height}", str(height))
+        if self.image_format == "raw":
+            name += f"_{width}x{height}_rgba8888"
+        return name + self.getExtension()
+
+    def buildOutputPath(self, width, height, when=None):
+        file_name = self.buildFileName(width, height, when)
+        path = os.path.join(self.output_dir, file_name)
+        stem, extension = os.path.splitext(path)
+        index = 1
+        while os.path.exists(path):
+            path = f"{stem}_{index}{extension}"
+            index += 1
+        return path
+
+
+def get_format_for_path(path, default_format):
+    """Pick the screenshot format from a file extension, falling back to `default_format`."""
+    extension = os.path.splitext(path)[1].lower()
+    for image_format, (_writer_format, format_extension) in SCREENSHOT_FORMATS.items():
+        if extension == format_extension:
+            return image_format
+    return default_format
+
+
+def get_png_quality(compression):
+    """Return the `QImageWriter` quality that makes Qt's PNG writer use zlib level `compression` (0-9).
+
+    Qt's PNG handler ignores `setCompression` and derives the zlib level from
+    the quality instead, as `(100 - quality) * 9 // 91`: quality 100 is level
+    0 (largest files) and quality 9 or less is level 9 (smallest).
+    """
+    level = max(0, min(9, compression))
+    return 100 - (level * 91 + 8) // 9
+
+
+class ScreenshotSignals(QtCore.QObject):
+    """Signals emitted by an encode task; QRunnable itself cannot emit."""
+
+    progress = QtCore.pyqtSignal(str, int)
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str, str)
+
+
+class ScreenshotEncodeTask(QtCore.QRunnable):
+    """Encode and write one captured `QImage` on a pool thread."""
+
+    def __init__(self, image, path, image_format, compression, quality):
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.image_format = image_format
+        self.compression = compression
+        self.quality = quality
+        self.signals = ScreenshotSignals()
+
+    def run(self):
+        self.signals.progress.emit(self.path, 0)
+        try:
+            if self.image_format == "raw":
+                self.writeRaw()
+            else:
+                self.writeEncoded()
+        except OSError as error:
+            self.signals.failed.emit(self.path, str(error))
+            return
+        self.signals.progress.emit(self.path, 100)
+        self.signals.finished.emit(self.path)
+
+    def writeEncoded(self):
+        writer_format = SCREENSHOT_FORMATS[self.image_format][0]
+        writer = QtGui.QImageWriter(self.path, writer_format.encode("ascii"))
+        # Neither the PNG nor the WebP writer honors setCompression; both are tuned through the quality.
+        if writer_format == "png":
+            if self.compression >= 0:
+                writer.setQuality(get_png_quality(self.compression))
+        elif self.quality >= 0:
+            writer.setQuality(self.quality)
+        if not writer.write(self.image):
+            raise OSError(writer.errorString())
+
+    def writeRaw(self):
+        image = self.image.convertToFormat(QtGui.QImage.Format.Format_RGBA8888)
+        row_bytes = image.width() * 4
+        data = image.constBits().asstring(image.sizeInBytes())
+
+        total = image.height() * row_bytes
+        rows_per_chunk = max(1, RAW_WRITE_CHUNK_SIZE // max(1, row_bytes))
+        with open(self.path, "wb") as output:
+            for first_row in range(0, image.height(), rows_per_chunk):
+                last_row = min(image.height(), first_row + rows_per_chunk)
+                # Rows may be padded to bytesPerLine; write only the pixels.
+                for row in range(first_row, last_row):
+                    start = row * image.bytesPerLine()
+                    output.write(data[start : start + row_bytes])
+                self.signals.progress.emit(self.path, int(last_row * row_bytes * 100 / max(1, total)))
+
+
+class ScreenshotWriter(QtCore.QObject):
+    """Queue captured images for background encoding and relay task signals."""
+
+    progress = QtCore.pyqtSignal(str, int)
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str, str)
+
+    def __init__(self, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QtCore.QThreadPool.globalInstance()
+        self.pending = {}
+
+    def save(self, image, path, options):
+        image_format = get_format_for_path(path, options.image_format)
+        task = ScreenshotEncodeTask(image, path, image_format, options.compression, options.quality)
+        task.signals.progress.connect(self.progress)
+        task.signals.finished.connect(self.handleFinished)
+        task.signals.failed.connect(self.handleFailed)
+        # Keep the signal object alive until the task reports back.
+        self.pending[path] = task.signals
+        self.thread_pool.start(task)
+
+    def handleFinished(self, path):
+        self.pending.pop(path, None)
+        self.finished.emit(path)
+
+    def handleFailed(self, path, message):
+        self.pending.pop(path, None)
+        self.failed.emit(path, message)
@@ -24,7 +24,7 @@ if exist "%RELEASE_DIR%" rmdir /s /q "%RELEASE_DIR%"
 if exist "%ZIP_PATH%" del /q "%ZIP_PATH%"
 
 echo [3/5] Building standalone executable with Nuitka...
-%PY% -m nuitka --standalone --assume-yes-for-downloads --enable-plugin=pyqt6 --windows-console-mode=disable --windows-icon-from-ico=icon.ico --include-data-files=icon.png=icon.png --include-data-files=icon.ico=icon.ico --output-dir=%DIST_ROOT% --output-filename=screen_ruler.exe screen_ruler.py
+%PY% -m nuitka --standalone --assume-yes-for-downloads --enable-plugin=pyqt6 --windows-console-mode=disable --windows-icon-from-ico=icon.ico --output-dir=%DIST_ROOT% --output-filename=screen_ruler.exe screen_ruler.py
 if errorlevel 1 exit /b 1
 
 echo [4/5] Preparing release folder...